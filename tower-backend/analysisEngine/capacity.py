@@ -0,0 +1,245 @@
+import numpy as np
+
+from analysisEngine.frame import FrameModel, segment_nodal_loads, wind_direction
+from loadEngine.combinations import dead_load
+from loadEngine.wind_loads import WindLoads
+from section import ELEMENT_GROUP_COLUMNS, MEMBER_GROUPS
+from section_catalog import DEFAULT_INDEX, compileCatalog
+
+# Resistance factor for axial tension and compression
+RESISTANCE_FACTOR = 0.9
+
+# Default steel yield strength in MPa
+DEFAULT_YIELD_STRENGTH = 250.0
+
+# Maximum slenderness KL/r
+SLENDERNESS_LIMITS = {"compression": 200.0, "tension": 300.0}
+
+# Factored (dead, wind) pairs whose axial envelope the members are checked against
+STRENGTH_COMBINATIONS = ((1.2, 1.0), (0.9, 1.0))
+
+
+def critical_stress(slenderness, young_modulus, yield_strength=DEFAULT_YIELD_STRENGTH):
+    """
+    Flexural buckling stress Fcr in MPa (AISC 360 E3) for any broadcastable arrays.
+
+    Fe = π²E / (KL/r)²; Fcr = 0.658^(Fy/Fe) Fy when KL/r <= 4.71 √(E/Fy), else 0.877 Fe.
+    """
+    slenderness = np.maximum(slenderness, 1e-9)
+    euler = np.pi**2 * young_modulus / slenderness**2
+    inelastic = slenderness <= 4.71 * np.sqrt(young_modulus / yield_strength)
+    return np.where(inelastic, 0.658 ** (yield_strength / euler) * yield_strength, 0.877 * euler)
+
+
+def axial_envelope(axial):
+    """
+    Largest tension and compression (both as positive N) of every element over its load cases.
+    """
+    axial = np.asarray(axial, dtype=np.float64)
+    if axial.ndim == 1:
+        axial = axial[:, None]
+    return np.maximum(axial.max(axis=1), 0.0), np.maximum(-axial.min(axis=1), 0.0)
+
+
+def member_demands(section, site=None, gh=None):
+    """
+    Axial force of every Section element under the strength combinations of dead load and wind.
+
+    Wind is applied in every Table 2-6 direction at the ultimate wind speed and dead load
+    acts downwards; both are spread over each segment's nodes and solved on one factorization.
+
+    Returns:
+        tuple: (model, axial) with axial of shape (n_elements, n_combinations) in N, tension positive.
+    """
+    model = FrameModel.from_section(section)
+    wind = WindLoads.from_section(section, site, gh)
+    result = wind.compute()
+    state = result["limit_states"].index("ultimate")
+
+    cases = [segment_nodal_loads(model.mesh, dead_load(section), (0.0, -1.0, 0.0))]
+    for a, angle_key in enumerate(result["angle_keys"]):
+        angle = 0.0 if angle_key == "Normal" else float(angle_key)
+        cases.append(segment_nodal_loads(model.mesh, result["force"][state, a], wind_direction(angle)))
+    loads = np.stack([model.load_vector(case) for case in cases], axis=1)
+
+    # Columns: factored dead + one wind direction, for every combination
+    factors = []
+    for dead_factor, wind_factor in STRENGTH_COMBINATIONS:
+        for a in range(len(result["angle_keys"])):
+            column = np.zeros(len(cases))
+            column[0], column[1 + a] = dead_factor, wind_factor
+            factors.append(column)
+    displacements = model.solve(loads @ np.array(factors).T)
+    return model, model.axial_forces(displacements)
+
+
+class CapacityCheck:
+    """
+    Axial capacity of every element against every candidate section, as (elements × candidates) arrays.
+
+    Attributes:
+        length (np.ndarray): Element lengths in m, shape (n_elements,).
+        tension, compression (np.ndarray): Demand envelopes in N, shape (n_elements,).
+        catalog (SectionCatalog): Section library the candidates come from.
+        candidates (np.ndarray): Catalog rows considered, shape (n_candidates,).
+        effective_length_factor (float | np.ndarray): K, per element or shared.
+        yield_strength (float): Fy in MPa.
+    """
+
+    def __init__(self, length, axial, catalog, candidates=None, effective_length_factor=1.0,
+                 yield_strength=DEFAULT_YIELD_STRENGTH):
+        self.length = np.asarray(length, dtype=np.float64)
+        self.tension, self.compression = axial_envelope(axial)
+        self.catalog = compileCatalog(catalog)
+        if candidates is None:
+            candidates = np.setdiff1d(np.arange(len(self.catalog)), [DEFAULT_INDEX])
+        self.candidates = np.asarray(candidates, dtype=np.int64)
+        self.effective_length_factor = effective_length_factor
+        self.yield_strength = yield_strength
+        self.section_count = None  # set by from_section, whose elements are sections × members
+
+    @classmethod
+    def from_section(cls, section, axial, section_types=None, **kwargs):
+        """
+        Check every element of a Section (row-major over sections × members).
+
+        Args:
+            section (Section): Tower geometry and catalog.
+            axial (np.ndarray): Axial forces (n_elements[, n_cases]) in N, tension positive.
+            section_types (list): Catalog types to draw candidates from, e.g. ["round"]; all by default.
+        """
+        catalog = section.catalog
+        candidates = None
+        if section_types is not None:
+            types = np.array(catalog.types)
+            candidates = np.flatnonzero(np.isin(types, section_types) & (np.arange(len(catalog)) != DEFAULT_INDEX))
+        check = cls(section.getElementArrays()["length"].ravel(), axial, catalog, candidates, **kwargs)
+        check.section_count = len(section.getCoordinateArray())
+        return check
+
+    def utilization(self, rows=None):
+        """
+        Utilization of every element against every candidate (or against the given rows).
+
+        Args:
+            rows (np.ndarray): Catalog row of every element to check only that section,
+                e.g. the current assignment; shape (n_elements,).
+
+        Returns:
+            dict: "utilization", "slenderness", "tension" and "compression" utilizations and
+            "passes", each (n_elements, n_candidates), or (n_elements,) when rows is given.
+        """
+        if rows is None:
+            area = self.catalog.crossArea[self.candidates][None, :]
+            inertia = self.catalog.momentOfInertia[self.candidates][None, :]
+            modulus = self.catalog.youngModulus[self.candidates][None, :]
+            length = self.length[:, None]
+            tension, compression = self.tension[:, None], self.compression[:, None]
+            k = np.asarray(self.effective_length_factor)
+            k = k[:, None] if k.ndim else k
+        else:
+            rows = np.asarray(rows, dtype=np.int64)
+            area, inertia, modulus = self.catalog.crossArea[rows], self.catalog.momentOfInertia[rows], self.catalog.youngModulus[rows]
+            length, tension, compression = self.length, self.tension, self.compression
+            k = self.effective_length_factor
+
+        # KL/r with L in mm and r = √(I/A) in mm
+        slenderness = k * length * 1000 / np.sqrt(inertia / area)
+        compression_capacity = RESISTANCE_FACTOR * critical_stress(slenderness, modulus, self.yield_strength) * area
+        tension_capacity = RESISTANCE_FACTOR * self.yield_strength * area
+        tension_ratio = tension / tension_capacity
+        compression_ratio = compression / compression_capacity
+
+        slender_ok = (
+            ((compression == 0) | (slenderness <= SLENDERNESS_LIMITS["compression"]))
+            & ((tension == 0) | (slenderness <= SLENDERNESS_LIMITS["tension"]))
+        )
+        utilization = np.maximum(tension_ratio, compression_ratio)
+        return {
+            "utilization": utilization,
+            "slenderness": slenderness,
+            "tension": tension_ratio,
+            "compression": compression_ratio,
+            "passes": slender_ok & (utilization <= 1.0),
+        }
+
+    def group_passes(self, groups):
+        """
+        Whether each candidate passes for every element of a group.
+
+        Args:
+            groups (np.ndarray): Group id of every element, shape (n_elements,).
+
+        Returns:
+            tuple: (group ids (n_groups,), passes (n_groups, n_candidates), group lengths (n_groups,) in m).
+        """
+        checks = self.utilization()
+        groups = np.asarray(groups)
+        order = np.argsort(groups, kind="stable")
+        sorted_groups = groups[order]
+        starts = np.flatnonzero(np.r_[True, sorted_groups[1:] != sorted_groups[:-1]])
+        passes = np.logical_and.reduceat(checks["passes"][order], starts, axis=0)
+        return sorted_groups[starts], passes, np.add.reduceat(self.length[order], starts)
+
+    def unit_mass(self):
+        """
+        Mass per meter of every candidate in kg/m.
+        """
+        return self.catalog.density[self.candidates] * self.catalog.crossArea[self.candidates] * 1e-6
+
+    def lightest_sections(self, groups):
+        """
+        Lightest candidate that passes for every element of each group.
+
+        Args:
+            groups (np.ndarray): Group id of every element, shape (n_elements,).
+
+        Returns:
+            dict: group id -> (catalog row, weight in kg) or None when no candidate passes.
+        """
+        group_ids, group_passes, group_length = self.group_passes(groups)
+        weight = np.where(group_passes, group_length[:, None] * self.unit_mass()[None, :], np.inf)
+        best = weight.argmin(axis=1)
+
+        result = {}
+        for g, group in enumerate(group_ids.tolist()):
+            result[group] = (int(self.candidates[best[g]]), float(weight[g, best[g]])) if np.isfinite(weight[g, best[g]]) else None
+        return result
+
+    def section_assignments(self):
+        """
+        Lightest passing section of every (section, member group), as an elementSections dict.
+
+        Returns:
+            tuple: ({section number: {group: name}}, [(section number, group) without a passing candidate]).
+        """
+        if self.section_count is None:
+            raise ValueError("Section assignments need a check built with CapacityCheck.from_section().")
+        members = len(ELEMENT_GROUP_COLUMNS)
+        section_index = np.repeat(np.arange(self.section_count), members)
+        group_column = np.tile(ELEMENT_GROUP_COLUMNS, self.section_count)
+        chosen = self.lightest_sections(section_index * len(MEMBER_GROUPS) + group_column)
+
+        assignments, failures = {}, []
+        for key, choice in chosen.items():
+            number, group = key // len(MEMBER_GROUPS) + 1, MEMBER_GROUPS[key % len(MEMBER_GROUPS)]
+            if choice is None:
+                failures.append((number, group))
+            else:
+                assignments.setdefault(str(number), {})[group] = self.catalog.names[choice[0]]
+        return assignments, failures
+
+    def report(self, rows):
+        """
+        JSON-ready utilization report of the given assignment (catalog row per element).
+        """
+        checks = self.utilization(rows)
+        governing = int(np.argmax(checks["utilization"])) if len(rows) else 0
+        return {
+            "elements": len(rows),
+            "failing": int((~checks["passes"]).sum()),
+            "max_utilization": round(float(checks["utilization"][governing]), 4) if len(rows) else 0.0,
+            "governing_element": governing,
+            "utilization": np.round(checks["utilization"], 4).tolist(),
+            "slenderness": np.round(checks["slenderness"], 1).tolist(),
+        }
@@ -0,0 +1,215 @@
+import numpy as np
+from scipy.sparse import diags
+from scipy.sparse.linalg import LinearOperator, eigsh
+
+from analysisEngine.frame import DOF_PER_NODE, FrameModel
+from loadEngine.tables import table_gust_exposure
+from loadEngine.wind_loads import DEFAULT_SITE, gust_effect_factor
+
+# Damping ratio of a bolted steel lattice tower
+DEFAULT_DAMPING_RATIO = 0.01
+
+# Structures whose fundamental frequency is below this (Hz) are dynamically sensitive
+FLEXIBLE_FREQUENCY = 1.0
+
+# Peak factors for background response and wind speed
+PEAK_FACTOR_Q = 3.4
+PEAK_FACTOR_V = 3.4
+
+
+def lumped_masses(model, density):
+    """
+    Translational mass of every node in kg: half of each element's density × area × length at each end.
+
+    Args:
+        model (FrameModel): Frame whose A (m²) and element lengths are used.
+        density (np.ndarray): Density of every element in kg/m³.
+
+    Returns:
+        np.ndarray: Nodal masses, shape (n_nodes,).
+    """
+    element_mass = density * model.A * np.linalg.norm(model.element_vectors(), axis=1)
+    masses = np.zeros(model.node_count)
+    np.add.at(masses, model.connectivity[:, 0], element_mass / 2)
+    np.add.at(masses, model.connectivity[:, 1], element_mass / 2)
+    return masses
+
+
+def _resonance_term(eta):
+    # R_l = 1/η - (1 - e^(-2η)) / (2η²), and 1 for η = 0
+    eta = np.maximum(eta, 1e-12)
+    return np.where(eta > 1e-6, 1 / eta - (1 - np.exp(-2 * eta)) / (2 * eta**2), 1.0)
+
+
+def flexible_gust_factor(frequency, height, width, depth, wind_speed, exposure_category="Exposure C",
+                         damping_ratio=DEFAULT_DAMPING_RATIO):
+    """
+    Gust effect factor Gf of a dynamically sensitive structure (ASCE 7 §26.11.5, SI units).
+
+    Args:
+        frequency (float): Fundamental natural frequency n1 in Hz.
+        height (float): Structure height h in m.
+        width (float): Width B normal to the wind in m.
+        depth (float): Depth L along the wind in m.
+        wind_speed (float): Basic wind speed V in m/s.
+        exposure_category (str): "Exposure B", "Exposure C" or "Exposure D".
+        damping_ratio (float): Fraction of critical damping β.
+
+    Returns:
+        float: Gf.
+    """
+    try:
+        c, l, epsilon_bar, alpha_bar, b_bar, zmin = (
+            table_gust_exposure[key][exposure_category] for key in ("c", "l", "epsilon_bar", "alpha_bar", "b_bar", "zmin")
+        )
+    except KeyError as e:
+        raise ValueError(f"Invalid exposure category '{exposure_category}'.") from e
+
+    z_bar = max(0.6 * height, zmin)
+    intensity = c * (10 / z_bar) ** (1 / 6)
+    length_scale = l * (z_bar / 10) ** epsilon_bar
+    mean_speed = b_bar * (z_bar / 10) ** alpha_bar * wind_speed
+
+    background = 1 / (1 + 0.63 * ((width + height) / length_scale) ** 0.63)
+    reduced_frequency = frequency * length_scale / mean_speed
+    spectrum = 7.47 * reduced_frequency / (1 + 10.3 * reduced_frequency) ** (5 / 3)
+    r_h = _resonance_term(4.6 * frequency * height / mean_speed)
+    r_b = _resonance_term(4.6 * frequency * width / mean_speed)
+    r_l = _resonance_term(15.4 * frequency * depth / mean_speed)
+    resonant = spectrum * r_h * r_b * (0.53 + 0.47 * r_l) / damping_ratio
+
+    log_term = np.sqrt(2 * np.log(3600 * frequency))
+    peak_factor_r = log_term + 0.577 / log_term
+    return float(
+        0.925 * (1 + 1.7 * intensity * np.sqrt(PEAK_FACTOR_Q**2 * background + peak_factor_r**2 * resonant))
+        / (1 + 1.7 * PEAK_FACTOR_V * intensity)
+    )
+
+
+class ModalAnalysis:
+    """
+    Lowest natural modes of a frame model with lumped masses.
+
+    The generalized problem K φ = ω² M φ is solved by eigsh in shift-invert mode around
+    zero, reusing the frame model's sparse factorization of K for every inverse product.
+
+    Attributes:
+        model (FrameModel): Frame with its stiffness and supports.
+        masses (np.ndarray): Translational mass of every node in kg.
+    """
+
+    def __init__(self, model, masses):
+        self.model = model
+        self.masses = np.asarray(masses, dtype=np.float64)
+
+    @classmethod
+    def from_section(cls, section, extra_masses=None):
+        """
+        Modal model of a Section, with masses from the catalog density × cross area × length.
+
+        Args:
+            section (Section): Tower geometry with its element section assignments.
+            extra_masses (np.ndarray): Optional non-structural mass per mesh node in kg (ice, appurtenances).
+        """
+        model = FrameModel.from_section(section)
+        arrays = section.getElementArrays()
+        masses = lumped_masses(model, arrays["density"].ravel())
+        if extra_masses is not None:
+            masses = masses + extra_masses
+        return cls(model, masses)
+
+    def mass_matrix(self):
+        """
+        Lumped mass matrix of the free DOF: nodal mass on ux, uy, uz and none on rotations.
+        """
+        per_dof = np.zeros((self.model.node_count, DOF_PER_NODE))
+        per_dof[:, :3] = self.masses[:, None]
+        return diags(per_dof.ravel()[self.model.free]).tocsc()
+
+    def modes(self, count=6):
+        """
+        The lowest `count` natural modes.
+
+        Returns:
+            dict: "frequency" (Hz) and "period" (s) of shape (count,), "shapes" of shape
+            (n_nodes, 6, count) scaled to a unit peak translation, and "effective_mass_ratio"
+            ({"x", "y", "z"} arrays of shape (count,)).
+        """
+        free = self.model.free
+        count = min(count, len(free) - 1)
+        stiffness_inverse = self.model.factorize()
+        operator = LinearOperator((len(free), len(free)), matvec=stiffness_inverse.solve, dtype=np.float64)
+        mass = self.mass_matrix()
+
+        eigenvalues, vectors = eigsh(self.model.assemble()[free][:, free], k=count, M=mass, sigma=0, OPinv=operator)
+        order = np.argsort(eigenvalues)
+        eigenvalues, vectors = np.maximum(eigenvalues[order], 0.0), vectors[:, order]
+
+        shapes = np.zeros((self.model.dof_count, count))
+        shapes[free] = vectors
+        shapes = shapes.reshape(self.model.node_count, DOF_PER_NODE, count)
+        peak = np.abs(shapes[:, :3]).max(axis=(0, 1))
+        shapes /= np.where(peak > 0, peak, 1.0)
+
+        # Effective modal mass ratio for rigid translation along each global axis
+        total_mass = self.masses.sum()
+        modal_mass = np.einsum("n,nak,nak->k", self.masses, shapes[:, :3], shapes[:, :3])
+        effective = {
+            axis: np.einsum("n,nk->k", self.masses, shapes[:, a]) ** 2 / modal_mass / total_mass
+            for a, axis in enumerate(("x", "y", "z"))
+        }
+
+        frequency = np.sqrt(eigenvalues) / (2 * np.pi)
+        return {
+            "frequency": frequency,
+            "period": np.where(frequency > 0, 1 / np.maximum(frequency, 1e-300), np.inf),
+            "shapes": shapes,
+            "effective_mass_ratio": effective,
+        }
+
+    def gust_factor(self, site, frequency=None, damping_ratio=DEFAULT_DAMPING_RATIO):
+        """
+        Gust effect factor for the wind load engine from the fundamental frequency.
+
+        Flexible towers (n1 < 1 Hz) use flexible_gust_factor; stiffer towers keep the
+        height-based latticed-structure Gh.
+
+        Args:
+            site (dict): Site parameters with exposure_category and basic_wind_speed_ultimate.
+            frequency (float): Fundamental frequency in Hz; computed when not given.
+        """
+        site = {**DEFAULT_SITE, **{key: value for key, value in (site or {}).items() if value is not None}}
+        if frequency is None:
+            frequency = float(self.modes(1)["frequency"][0])
+        nodes = self.model.nodes
+        height = float(nodes[:, 1].max() - nodes[:, 1].min())
+        if frequency >= FLEXIBLE_FREQUENCY:
+            return gust_effect_factor(height)
+
+        base = nodes[nodes[:, 1] <= nodes[:, 1].min() + 1e-6]
+        top = nodes[nodes[:, 1] >= nodes[:, 1].max() - 1e-6]
+        width = float((np.ptp(base[:, 0]) + np.ptp(top[:, 0])) / 2)
+        depth = float((np.ptp(base[:, 2]) + np.ptp(top[:, 2])) / 2)
+        return flexible_gust_factor(
+            frequency, height, width, depth or width, site["basic_wind_speed_ultimate"],
+            site["exposure_category"], damping_ratio,
+        )
+
+    def summary(self, count=6, site=None, include_shapes=False):
+        """
+        JSON-ready frequencies, periods, effective mass ratios and the resulting gust factor.
+        """
+        modes = self.modes(count)
+        fundamental = float(modes["frequency"][0])
+        summary = {
+            "total_mass": round(float(self.masses.sum()), 2),
+            "frequency": np.round(modes["frequency"], 4).tolist(),
+            "period": np.round(modes["period"], 4).tolist(),
+            "effective_mass_ratio": {axis: np.round(ratio, 4).tolist() for axis, ratio in modes["effective_mass_ratio"].items()},
+            "flexible": fundamental < FLEXIBLE_FREQUENCY,
+            "gust_effect_factor": round(self.gust_factor(site, fundamental), 4),
+        }
+        if include_shapes:
+            summary["nodes"] = np.round(self.model.nodes, 3).tolist()
+            summary["shapes"] = np.round(modes["shapes"][:, :3].transpose(2, 0, 1), 5).tolist()
+        return summary
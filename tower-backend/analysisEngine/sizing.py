@@ -0,0 +1,228 @@
+import os
+from multiprocessing import get_context
+
+import numpy as np
+
+from analysisEngine.capacity import CapacityCheck, member_demands
+from loadEngine.panel import effective_projected_areas
+from section import ELEMENT_GROUP_COLUMNS, MEMBER_GROUPS, groupFaceLengths
+
+# Analyse -> size rounds before the assignment is taken as converged
+DEFAULT_ITERATIONS = 4
+
+
+def _max_epa(angle_area, round_area, gross_area, cross_section):
+    aero = effective_projected_areas(angle_area, round_area, gross_area, cross_section)
+    return max(float(value) for value in aero["epa"].values())
+
+
+def size_panel(task):
+    """
+    Lightest member group sections of one panel by branch and bound.
+
+    Groups outside the loaded face (T, S) only need capacity and take their lightest
+    passing candidate. Face groups (M, D, C) share the panel's solidity and EPA, so their
+    combinations are searched depth first in weight order and pruned with:
+    - the current weight plus the lightest option of every remaining group;
+    - the solidity from the current face area plus the smallest remaining face areas;
+    - the EPA of that same area counted as round bars (EPA grows with each member's area).
+
+    Args:
+        task (tuple): (number, group_length, face_length, gross_area, passes, unit_mass,
+            width, is_round, cross_section, max_solidity, max_epa), see SectionSizer._tasks.
+
+    Returns:
+        dict: "number", "choice" (candidate index per group), "weight", "unsized" groups
+        without a passing candidate, "limits_met", and the "explored"/"pruned" node counts.
+    """
+    (number, group_length, face_length, gross_area, passes, unit_mass,
+     width, is_round, cross_section, max_solidity, max_epa) = task
+
+    options, unsized = [], []
+    for g in range(len(group_length)):
+        candidates = np.flatnonzero(passes[g])
+        if not len(candidates):
+            # Nothing passes: keep the heaviest (strongest) candidate and report the group
+            unsized.append(g)
+            candidates = np.array([int(np.argmax(unit_mass))])
+        weight = group_length[g] * unit_mass[candidates]
+        order = np.argsort(weight, kind="stable")
+        options.append([
+            (float(weight[k]), float(face_length[g] * width[candidates[k]]), bool(is_round[candidates[k]]), int(candidates[k]))
+            for k in order
+        ])
+
+    choice = [group_options[0][3] for group_options in options]
+    face_groups = [g for g in range(len(options)) if face_length[g] > 0]
+    remaining_weight = np.r_[np.cumsum([options[g][0][0] for g in face_groups][::-1])[::-1], 0.0]
+    remaining_area = np.r_[np.cumsum([min(o[1] for o in options[g]) for g in face_groups][::-1])[::-1], 0.0]
+
+    best = {"weight": np.inf, "choice": None}
+    stats = {"explored": 0, "pruned": 0}
+
+    def within_limits(angle_area, round_area):
+        if max_solidity is not None and (angle_area + round_area) / gross_area > max_solidity:
+            return False
+        if max_epa is not None and _max_epa(angle_area, round_area, gross_area, cross_section) > max_epa:
+            return False
+        return True
+
+    def search(level, weight, angle_area, round_area, picked):
+        if level == len(face_groups):
+            if weight < best["weight"] and within_limits(angle_area, round_area):
+                best["weight"], best["choice"] = weight, list(picked)
+            return
+        for option_weight, face_area, option_round, candidate in options[face_groups[level]]:
+            stats["explored"] += 1
+            if weight + option_weight + remaining_weight[level + 1] >= best["weight"]:
+                # Options are sorted by weight, so every later one is pruned as well
+                stats["pruned"] += 1
+                break
+            next_angle = angle_area + (0.0 if option_round else face_area)
+            next_round = round_area + (face_area if option_round else 0.0)
+            if not within_limits(next_angle, next_round + remaining_area[level + 1]):
+                stats["pruned"] += 1
+                continue
+            picked.append(candidate)
+            search(level + 1, weight + option_weight, next_angle, next_round, picked)
+            picked.pop()
+
+    search(0, 0.0, 0.0, 0.0, [])
+    limits_met = best["choice"] is not None
+    if limits_met:
+        for g, candidate in zip(face_groups, best["choice"]):
+            choice[g] = candidate
+
+    weight = sum(group_length[g] * unit_mass[choice[g]] for g in range(len(choice)))
+    return {
+        "number": number,
+        "choice": choice,
+        "weight": float(weight),
+        "unsized": unsized,
+        "limits_met": limits_met,
+        **stats,
+    }
+
+
+class SectionSizer:
+    """
+    Minimum-weight section assignment of a tower, per panel and member group (M/D/C/T/S).
+
+    Each round analyses the current assignment (member_demands), checks every element
+    against every candidate (CapacityCheck) and sizes every panel independently with
+    size_panel in parallel: on `pool` when one is given, otherwise on a spawned pool of
+    `processes` workers started for the run. Member sizes change the stiffness and the
+    wind area, so rounds repeat until the assignment stops changing.
+
+    Attributes:
+        section (Section): Tower being sized; its elementSections are updated in place.
+        site (dict): Site parameters for the wind loads.
+        max_solidity (float): Upper bound on every panel's solidity ratio, or None.
+        max_epa (float): Upper bound on every panel's EPA in m² (any direction), or None.
+        section_types (list): Catalog types to choose from, e.g. ["round"]; all by default.
+        processes (int): Workers used, capped at the CPU count (the default); 1 sizes serially.
+        pool: Running process pool (multiprocessing Pool or ProcessPoolExecutor) to size on
+            instead of starting one; it is left running.
+    """
+
+    def __init__(self, section, site=None, max_solidity=None, max_epa=None, section_types=None,
+                 processes=None, pool=None, max_iterations=DEFAULT_ITERATIONS):
+        self.section = section
+        self.site = site
+        self.max_solidity = max_solidity
+        self.max_epa = max_epa
+        self.section_types = section_types
+        cpu_count = os.cpu_count() or 1
+        self.processes = max(1, min(int(processes or cpu_count), cpu_count))
+        self.pool = pool
+        self.max_iterations = max_iterations
+
+    def _tasks(self, check):
+        section_count = check.section_count
+        members = len(ELEMENT_GROUP_COLUMNS)
+        groups = np.repeat(np.arange(section_count), members) * len(MEMBER_GROUPS) + np.tile(ELEMENT_GROUP_COLUMNS, section_count)
+        _, passes, _ = check.group_passes(groups)
+        passes = passes.reshape(section_count, len(MEMBER_GROUPS), -1)
+
+        lengths = self.section.getElementArrays()["length"]
+        group_length = np.zeros((section_count, len(MEMBER_GROUPS)))
+        np.add.at(group_length.T, ELEMENT_GROUP_COLUMNS, lengths.T)
+        face_length = groupFaceLengths(lengths)
+        gross_area = self.section.getFaceAreas()["gross_area"]
+
+        catalog = check.catalog
+        unit_mass = check.unit_mass()
+        width = catalog.projectedWidth[check.candidates]
+        is_round = catalog.isRound[check.candidates]
+        cross_section = self.section.towerData["cross_section"]
+        return [
+            (s + 1, group_length[s], face_length[s], float(gross_area[s]), passes[s], unit_mass, width, is_round,
+             cross_section, self.max_solidity, self.max_epa)
+            for s in range(section_count)
+        ]
+
+    def _size_panels(self, tasks, pool):
+        if pool is not None:
+            try:
+                results = pool.map(size_panel, tasks, chunksize=max(1, len(tasks) // (self.processes * 4)))
+            except RuntimeError:
+                # A shared executor retired mid-run (section_batch.getBatchPool after a library
+                # change) refuses new work; size the panels in this process instead
+                pass
+            else:
+                return list(results)
+        return [size_panel(task) for task in tasks]
+
+    def optimize(self):
+        """
+        Size the tower and return the optimized elementSections with a report.
+
+        Returns:
+            dict: "elementSections", "total_weight" (kg), "iterations", "converged",
+            "max_utilization", "unsized" [(section, group)], "limits_not_met" [section],
+            and the branch-and-bound "explored"/"pruned" node counts.
+        """
+        own_pool = None
+        pool = self.pool
+        if pool is None and self.processes > 1:
+            # Spawned, not forked: the caller may be a threaded server (see section_batch)
+            own_pool = pool = get_context("spawn").Pool(self.processes)
+        try:
+            converged, explored, pruned = False, 0, 0
+            for iteration in range(1, self.max_iterations + 1):
+                _, axial = member_demands(self.section, self.site)
+                check = CapacityCheck.from_section(self.section, axial, self.section_types)
+                results = self._size_panels(self._tasks(check), pool)
+
+                names = check.catalog.names
+                assignments = {
+                    str(result["number"]): {
+                        group: names[check.candidates[candidate]] for group, candidate in zip(MEMBER_GROUPS, result["choice"])
+                    }
+                    for result in results
+                }
+                explored += sum(result["explored"] for result in results)
+                pruned += sum(result["pruned"] for result in results)
+                if not self.section.updateElementSections(assignments):
+                    converged = True
+                    break
+        finally:
+            if own_pool is not None:
+                own_pool.close()
+                own_pool.join()
+
+        # Verify the final assignment under its own demands
+        _, axial = member_demands(self.section, self.site)
+        arrays = self.section.getElementArrays()
+        final = CapacityCheck.from_section(self.section, axial).utilization(arrays["row"].ravel())
+        return {
+            "elementSections": assignments,
+            "total_weight": round(float((arrays["density"] * arrays["cross_area"] * 1e-6 * arrays["length"]).sum()), 2),
+            "iterations": iteration,
+            "converged": converged,
+            "max_utilization": round(float(final["utilization"].max()), 4) if final["utilization"].size else 0.0,
+            "unsized": [(result["number"], MEMBER_GROUPS[g]) for result in results for g in result["unsized"]],
+            "limits_not_met": [result["number"] for result in results if not result["limits_met"]],
+            "explored": explored,
+            "pruned": pruned,
+        }
@@ -1,28 +1,35 @@
 import os
+import hmac
 import json
-from flask import Flask, request, jsonify, send_from_directory
+import threading
+from collections import OrderedDict
+from flask import Flask, Response, request, jsonify, send_from_directory, stream_with_context
 from flask_bcrypt import Bcrypt
 from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
-from google.cloud import storage, firestore
+from google.cloud import firestore
 from flask_cors import CORS
 from dotenv import load_dotenv
 from loadEngine.geometry import Geometry
-from section import Section  
-from utils import normalizeTowerDataKeys
+from loadEngine.wind_loads import WIND_SPEED_KEYS, WindLoads
+from loadEngine.ice_loads import IceLoads
+from loadEngine.combinations import LoadCombinations
+from analysisEngine.modal import ModalAnalysis
+from analysisEngine.sizing import SectionSizer
+from section import Section, changedSections
+from section_catalog import CATALOG_REVALIDATE_SECONDS, CatalogCache
+from section_batch import getBatchPool
+from storage_backend import DEFAULT_BACKEND, getStorage
+from user_cache import NEGATIVE_CACHE_TTL, USER_CACHE_TTL, MemoryFirestore, UserCache
+from result_cache import ResultCache, resultKey
+from tower_index import DEFAULT_PAGE_SIZE, TowerIndex
+from utils import normalizeSiteKeys, normalizeTowerDataKeys
 
 
 # ✅ Load environment variables
 load_dotenv()
 
-# ✅ Check if the path is loaded correctly
-gcs_key_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-if not gcs_key_path or not os.path.exists(gcs_key_path):
-    raise FileNotFoundError(f"❌ Google Cloud credentials file not found: {gcs_key_path}")
-
-print(f"✅ Using Google Cloud credentials from: {gcs_key_path}")
-
-# ✅ Set Google Cloud credentials
-os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = gcs_key_path
+# ✅ Users live in Firestore unless USER_STORE=memory (local stand-in, e.g. for load tests)
+USER_STORE = os.getenv("USER_STORE", "firestore").lower()
 
 # ✅ Initialize Flask app
 app = Flask(__name__, static_folder="../tower-frontend/dist", static_url_path="/")
@@ -34,14 +41,70 @@ login_manager.login_view = "login"
 
 CORS(app)  # ✅ Allow requests from React frontend
 
-# ✅ Google Cloud Storage setup
-os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-BUCKET_NAME = os.getenv("BUCKET_NAME", "default-bucket-name")
-storage_client = storage.Client()
-bucket = storage_client.bucket(BUCKET_NAME)
-
-# ✅ Firestore setup for user authentication
-db = firestore.Client()
+# ✅ Worker processes of the warm pool (section batches, sizing), at most one per CPU
+POOL_WORKERS = max(1, min(int(os.getenv("POOL_WORKERS", os.cpu_count() or 1)), os.cpu_count() or 1))
+
+# ✅ Operator token for the maintenance endpoints (X-Admin-Token header); unset disables them
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+
+# ✅ Storage, caches and the user store, created by init_services()
+object_storage = tower_index = result_cache = catalog_cache = db = user_cache = None
+
+def fetch_user_record(username):
+    """Read one user document from Firestore, None when it does not exist."""
+    doc = db.collection("users").document(username).get()
+    if doc.exists:
+        return {"username": doc.get("username"), "password": doc.get("password")}
+    return None
+
+def init_services():
+    """Check the credentials and create the storage, cache and user store clients of the server."""
+    global object_storage, tower_index, result_cache, catalog_cache, db, user_cache
+
+    # ✅ Check if the path is loaded correctly (only Google Cloud backends need it)
+    if USER_STORE == "firestore" or (os.getenv("STORAGE_BACKEND") or DEFAULT_BACKEND).lower() == "gcs":
+        gcs_key_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
+        if not gcs_key_path or not os.path.exists(gcs_key_path):
+            raise FileNotFoundError(f"❌ Google Cloud credentials file not found: {gcs_key_path}")
+
+        print(f"✅ Using Google Cloud credentials from: {gcs_key_path}")
+
+        # ✅ Set Google Cloud credentials
+        os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = gcs_key_path
+
+    # ✅ Object storage setup (STORAGE_BACKEND=gcs|local|memory, see storage_backend.createStorage)
+    object_storage = getStorage()
+    print(f"🗄️ Storage backend: {object_storage.scheme}")
+    tower_index = TowerIndex(object_storage)
+
+    # ✅ Computed responses by content hash; RESULT_CACHE_MB of memory, plus RESULT_CACHE_DISK_MB of disk when RESULT_CACHE_DIR is set
+    result_cache = ResultCache(
+        int(float(os.getenv("RESULT_CACHE_MB", 256)) * 1024 * 1024),
+        os.getenv("RESULT_CACHE_DIR") or None,
+        int(float(os.getenv("RESULT_CACHE_DISK_MB", 1024)) * 1024 * 1024),
+    )
+
+    # ✅ Compiled section library, revalidated against its stored generation every CATALOG_TTL_SECONDS
+    catalog_cache = CatalogCache(object_storage, ttl=float(os.getenv("CATALOG_TTL_SECONDS", CATALOG_REVALIDATE_SECONDS)))
+
+    # ✅ Firestore setup for user authentication
+    if USER_STORE == "memory":
+        db = MemoryFirestore(float(os.getenv("USER_STORE_LATENCY_MS", "0")) / 1000)
+    else:
+        db = firestore.Client()
+    print(f"👤 User store: {USER_STORE}")
+
+    # ✅ Users restored on every authenticated request, cached for USER_CACHE_TTL seconds
+    user_cache = UserCache(
+        fetch_user_record,
+        ttl=float(os.getenv("USER_CACHE_TTL", USER_CACHE_TTL)),
+        negativeTtl=float(os.getenv("USER_NEGATIVE_CACHE_TTL", NEGATIVE_CACHE_TTL)),
+    )
+
+# ✅ Process pool workers are spawned, and a spawned worker re-imports the script that started
+# the server (`python app.py`) as __mp_main__. Workers only run the engines, so they skip this.
+if __name__ != "__mp_main__":
+    init_services()
 
 # ✅ User Model (Stored in Firestore)
 class User(UserMixin):
@@ -59,42 +122,97 @@ class User(UserMixin):
             "username": self.username,
             "password": self.password
         })
+        user_cache.invalidate(self.username)
 
     @staticmethod
-    def find_by_username(username):
-        """Retrieve user from Firestore."""
-        doc = db.collection("users").document(username).get()
-        if doc.exists:
-            return User(doc.get("username"), doc.get("password"))
+    def find_by_username(username, fresh=False):
+        """Retrieve user from the user cache, or straight from Firestore when fresh is set."""
+        record = fetch_user_record(username) if fresh else user_cache.get(username)
+        if record:
+            return User(record["username"], record["password"])
         return None
 
 @login_manager.user_loader
 def load_user(username):
     return User.find_by_username(username)
 
-# ✅ Upload JSON to Google Cloud Storage
+# ✅ Upload JSON to object storage
 def upload_json_to_gcs(file_name, data):
-    """Uploads JSON file to Google Cloud Storage."""
+    """Uploads a JSON object to the configured storage backend and returns its URL."""
     try:
-        blob = bucket.blob(file_name)
-        blob.upload_from_string(json.dumps(data), content_type="application/json")
-        return f"https://storage.googleapis.com/{BUCKET_NAME}/{file_name}"
+        object_storage.putJson(file_name, data)
+        return object_storage.url(file_name)
     except Exception as e:
         print(f"❌ Error uploading JSON: {str(e)}")
         return None
 
-# ✅ Download JSON from Google Cloud Storage
+# ✅ Stream JSON chunks to object storage
+def upload_json_stream_to_gcs(file_name, chunks):
+    """Uploads JSON text chunks (a resumable upload on GCS), holding at most one chunk buffer in memory."""
+    try:
+        with object_storage.openWriter(file_name) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+        return object_storage.url(file_name)
+    except Exception as e:
+        print(f"❌ Error streaming JSON: {str(e)}")
+        return None
+
+# ✅ Download JSON from object storage
 def download_json_from_gcs(file_name):
-    """Downloads JSON file from Google Cloud Storage."""
+    """Downloads a JSON object from the configured storage backend, None when it does not exist."""
     try:
-        blob = bucket.blob(file_name)
-        if not blob.exists():
-            return None
-        return json.loads(blob.download_as_text())
+        return object_storage.getJson(file_name)
     except Exception as e:
         print(f"❌ Error downloading JSON: {str(e)}")
         return None
 
+# ✅ Recently generated towers, kept so assignment edits only recompute the sections they touch
+SECTION_SESSION_LIMIT = 32
+_section_sessions = OrderedDict()
+_section_sessions_lock = threading.Lock()
+
+def get_section_session(towerData, catalog):
+    """Return the (Section, lock) kept for this tower geometry and library version, creating it if needed."""
+    key = (json.dumps(towerData, sort_keys=True), catalog.version)
+    with _section_sessions_lock:
+        session = _section_sessions.get(key)
+        if session is None:
+            session = (Section(towerData, {}, catalog), threading.Lock())
+            _section_sessions[key] = session
+            while len(_section_sessions) > SECTION_SESSION_LIMIT:
+                _section_sessions.popitem(last=False)
+        else:
+            _section_sessions.move_to_end(key)
+        return session
+
+def is_admin_request():
+    """True when the request carries the configured ADMIN_TOKEN in its X-Admin-Token header."""
+    token = request.headers.get("X-Admin-Token", "")
+    return bool(ADMIN_TOKEN) and hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode())
+
+def site_parameters(tower_data, site=None):
+    """Site parameters of a tower with the request's overrides on top, both under the load engines' key names."""
+    return {**normalizeSiteKeys(tower_data), **normalizeSiteKeys(site or {})}
+
+def section_payload(section):
+    """The JSON-ready Section as asked by the ?format=mesh query parameter."""
+    if request.args.get("format") == "mesh":
+        return section.toMeshDict()
+    return section.toDict()
+
+def section_response(section):
+    """Serialize a Section as asked by the ?format=mesh and ?stream=1 query parameters."""
+    if request.args.get("stream"):
+        section.getElementArrays()  # surface input errors before the response starts
+        return Response(stream_with_context(section.iterJson()), mimetype="application/json")
+    return jsonify(section_payload(section))
+
+def cached_json_response(key, compute):
+    """JSON response of compute(), computed once per result key (concurrent identical requests share it)."""
+    body = result_cache.getOrCompute(key, lambda: app.json.response(compute()).get_data())
+    return Response(body, mimetype="application/json")
+
 # ✅ Serve React Vite Frontend
 @app.route("/")
 def serve_react():
@@ -116,6 +234,11 @@ def create_tower():
         if not file_url:
             return jsonify({"error": "Failed to upload tower data"}), 500
 
+        try:
+            tower_index.record(tower_id, data, len(json.dumps(data)))
+        except Exception as e:
+            # The tower is stored; GET /api/towers?refresh=1 rebuilds the manifest from the bodies
+            print(f"❌ Error recording tower {tower_id} in the manifest: {str(e)}")
         return jsonify({"message": "Tower created successfully", "url": file_url})
 
     except Exception as e:
@@ -123,14 +246,22 @@ def create_tower():
 
 @app.route("/api/towers", methods=["GET"])
 def get_towers():
-    """Fetch all stored towers."""
+    """
+    Page through the stored towers from the manifest.
+
+    Query parameters: cursor (next_cursor of the previous page), limit, fields (comma
+    separated), full=1 for the stored tower bodies and refresh=1 to rebuild the manifest.
+    """
     try:
-        blobs = bucket.list_blobs(prefix="towers/")
-        towers = []
-        for blob in blobs:
-            tower_data = json.loads(blob.download_as_text())
-            towers.append(tower_data)
-        return jsonify(towers)
+        if request.args.get("refresh"):
+            tower_index.rebuild()
+        fields = [field for field in request.args.get("fields", "").split(",") if field]
+        return jsonify(tower_index.page(
+            cursor=request.args.get("cursor"),
+            limit=request.args.get("limit", DEFAULT_PAGE_SIZE),
+            fields=fields or None,
+            full=bool(request.args.get("full")),
+        ))
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -155,7 +286,8 @@ def register():
         password = data["password"]
         hashed_password = bcrypt.generate_password_hash(password).decode("utf-8")
 
-        if User.find_by_username(username):
+        # Uniqueness is checked against Firestore itself, never a cached miss
+        if User.find_by_username(username, fresh=True):
             return jsonify({"error": "Username already exists"}), 400
 
         new_user = User(username, hashed_password)
@@ -199,27 +331,128 @@ def calculate_segments_from_json(tower_id):
         return jsonify({"error": "Tower data not found"}), 404
 
     try:
-        # Initialize Geometry with tower_data
-        geometry = Geometry(
-            tower_base_width=float(tower_data["Tower Base Width"]),
-            top_width=float(tower_data["Top Width"]),
-            height=float(tower_data["Height"]),
-            variable_segments=int(tower_data["Variable Segments"]),
-            constant_segments=int(tower_data["Constant Segments"]),
-            cross_section=tower_data["Cross Section"]
-        )
+        def compute():
+            # Initialize Geometry with tower_data
+            geometry = Geometry(
+                tower_base_width=float(tower_data["Tower Base Width"]),
+                top_width=float(tower_data["Top Width"]),
+                height=float(tower_data["Height"]),
+                variable_segments=int(tower_data["Variable Segments"]),
+                constant_segments=int(tower_data["Constant Segments"]),
+                cross_section=tower_data["Cross Section"]
+            )
+
+            segment_list = geometry.calculate_segments()
+
+            return {
+                "tower_id": tower_id,
+                "segments": segment_list
+            }
+
+        return cached_json_response(resultKey("segments", normalizeTowerDataKeys(tower_data), tower_id=tower_id), compute)
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+    
+    
+@app.route("/api/calculate/loads/<tower_id>", methods=["GET", "POST"])
+def calculate_wind_loads(tower_id):
+    """Wind forces, shear and overturning moment per segment and direction for a stored tower."""
+    file_name = f"towers/tower_{tower_id}.json"
+    tower_data = download_json_from_gcs(file_name)
 
-        segment_list = geometry.calculate_segments()
+    if not tower_data:
+        return jsonify({"error": "Tower data not found"}), 404
 
+    try:
+        payload = request.get_json(silent=True) or {}
+        if request.args.get("combinations") and payload.get("combinations") is not None and not len(payload["combinations"]):
+            return jsonify({"error": "combinations must not be empty; omit it for the standard combinations"}), 400
+        limit_state = request.args.get("limit_state", "ultimate")
+        if limit_state not in WIND_SPEED_KEYS:
+            return jsonify({"error": f"Unknown limit_state '{limit_state}', expected one of {list(WIND_SPEED_KEYS)}"}), 400
+        try:
+            step = float(request.args.get("step", 1.0))
+        except ValueError:
+            step = None
+        if not step or step <= 0:
+            return jsonify({"error": "step must be a positive number of degrees"}), 400
+        elementSections = payload.get("elementSections", {})
+        try:
+            site = site_parameters(tower_data, payload.get("site"))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        sectionLibrary = catalog_cache.get()
+        section = Section(normalizeTowerDataKeys(tower_data), elementSections, sectionLibrary)
+
+        gh = None
+        if request.args.get("dynamic"):
+            # Gust factor from the fundamental frequency instead of the height formula
+            gh = ModalAnalysis.from_section(section).gust_factor(site)
+            print(f"🌀 Dynamic gust effect factor: {gh:.4f}")
+        loads = WindLoads.from_section(section, site, gh, sensitivities=bool(request.args.get("sensitivities")))
+
+        result = {
+            "tower_id": tower_id,
+            "loads": loads.summary()
+        }
+        if request.args.get("sweep"):
+            # Fine-grained direction sweep, ?step= degrees (default 1)
+            result["direction_sweep"] = loads.direction_summary(step, limit_state)
+        if request.args.get("sensitivities"):
+            # d(EPA, base shear, base moment)/d(member group width) per segment, ?limit_state=
+            result["sensitivities"] = loads.sensitivity_summary(limit_state)
+        if request.args.get("ice"):
+            # Ice sensitivity, ?ice=<mm>,<mm>,... or ?ice=1 for the tower's own ice thickness
+            iceLoads = IceLoads(section, site, loads.gh)
+            if request.args["ice"] == "1":
+                thicknesses = [iceLoads.default_thickness()]
+            else:
+                thicknesses = [float(value) / 1000 for value in request.args["ice"].split(",")]
+            result["ice"] = iceLoads.summary(thicknesses)
+        if request.args.get("combinations"):
+            # Envelopes of the standard strength and service combinations
+            combinations = LoadCombinations.from_tower(section, site, gh=loads.gh)
+            result["combinations"] = combinations.envelope_summary(payload.get("combinations"))
+
+        return jsonify(result)
+
+    except Exception as e:
+        print("❌ Error in /api/calculate/loads/<tower_id>:", str(e))
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route("/api/analysis/modal/<tower_id>", methods=["GET", "POST"])
+def calculate_modes(tower_id):
+    """Lowest natural frequencies of a stored tower and the gust effect factor they imply."""
+    file_name = f"towers/tower_{tower_id}.json"
+    tower_data = download_json_from_gcs(file_name)
+
+    if not tower_data:
+        return jsonify({"error": "Tower data not found"}), 404
+
+    try:
+        payload = request.get_json(silent=True) or {}
+        try:
+            site = site_parameters(tower_data, payload.get("site"))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        sectionLibrary = catalog_cache.get()
+        section = Section(normalizeTowerDataKeys(tower_data), payload.get("elementSections", {}), sectionLibrary)
+
+        modal = ModalAnalysis.from_section(section)
+        count = int(request.args.get("modes", 6))
         return jsonify({
             "tower_id": tower_id,
-            "segments": segment_list
+            "modal": modal.summary(count, site, bool(request.args.get("shapes")))
         })
 
     except Exception as e:
+        print("❌ Error in /api/analysis/modal/<tower_id>:", str(e))
         return jsonify({"error": str(e)}), 500
-    
-    
+
+
 @app.route("/api/calculate/section/<tower_id>", methods=["POST"])
 def calculate_section_and_save(tower_id):
     try:
@@ -236,13 +469,24 @@ def calculate_section_and_save(tower_id):
 
         # Generate geometry (no section assignment at this stage)
         section = Section(towerData)
-        result = {
-            "coordinates": section.getCoordinates(),
-            "elements": section.getElements()
-        }
+        file_name = f"sections/tower_sections_{tower_id}.json"
+
+        if request.args.get("stream"):
+            # Upload section by section and return only the location
+            file_url = upload_json_stream_to_gcs(file_name, section.iterJson())
+            print(f"🧮 Geometry builds for this request: {section.geometryBuilds}")
+            if not file_url:
+                return jsonify({"error": "Failed to upload section data"}), 500
+            return jsonify({
+                "message": "Section data calculated and uploaded successfully",
+                "tower_id": tower_id,
+                "url": file_url
+            })
+
+        result = section.toDict()
+        print(f"🧮 Geometry builds for this request: {section.geometryBuilds}")
 
         # Upload to GCS
-        file_name = f"sections/tower_sections_{tower_id}.json"
         file_url = upload_json_to_gcs(file_name, result)
 
         return jsonify({
@@ -264,32 +508,95 @@ def calculate_section_from_json():
         tower_data = request.json
         towerData = normalizeTowerDataKeys(tower_data)
 
-        section = Section(towerData)
+        if request.args.get("stream"):
+            return section_response(Section(towerData))
 
-        return jsonify({
-            "coordinates": section.getCoordinates(),
-            "elements": section.getElements()
-        })
+        def compute():
+            section = Section(towerData)
+            payload = section_payload(section)
+            print(f"🧮 Geometry builds for this request: {section.geometryBuilds}")
+            return payload
+
+        # Geometry only: the default section properties, no library
+        return cached_json_response(resultKey("section", towerData, format=request.args.get("format")), compute)
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
-@app.route("/api/sections/library", methods=["GET"])
-def get_section_library():
+@app.route("/api/calculate/section-batch", methods=["POST"])
+def calculate_section_batch():
+    """Compute many towerData/elementSections payloads on the warm process pool."""
     try:
-        print("📦 Request received: /api/sections/library")
-        print("🪵 Trying to fetch 'sections/element_sections/section_library.json' from GCS...")
+        payload = request.get_json()
+        items = payload.get("items") if isinstance(payload, dict) else payload
+        if not isinstance(items, list):
+            return jsonify({"error": "Expected a list of {towerData, elementSections} items"}), 400
+
+        # Workers compile the library once; the pool is restarted when the library version changes
+        sectionLibrary, catalog = catalog_cache.snapshot()
+        pool = getBatchPool(sectionLibrary, catalog.version, POOL_WORKERS)
+        print(f"📦 Batch of {len(items)} towers on {pool.workers} workers")
+
+        if request.args.get("stream"):
+            # One NDJSON line per tower, in completion order
+            lines = (f'{{"index": {i}, "result": {result}}}\n' for i, result in pool.iterCompleted(items))
+            return Response(stream_with_context(lines), mimetype="application/x-ndjson")
+
+        return Response("[" + ",".join(pool.map(items)) + "]", mimetype="application/json")
+
+    except Exception as e:
+        print("❌ Error in /api/calculate/section-batch:", str(e))
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route("/api/cache/metrics", methods=["GET"])
+def get_result_cache_metrics():
+    """Result cache hit rate, coalesced requests, evictions and size."""
+    return jsonify(result_cache.stats())
+
+
+@app.route("/api/users/cache", methods=["GET"])
+def get_user_cache_metrics():
+    """User cache hit rate, negative hits and mean Firestore load time."""
+    return jsonify(user_cache.stats())
+
+
+@app.route("/api/storage/metrics", methods=["GET"])
+def get_storage_metrics():
+    """Per-operation storage latency metrics since start-up or the last reset."""
+    return jsonify(object_storage.metrics())
+
 
-        data = download_json_from_gcs("sections/element_sections/section_library.json")
+@app.route("/api/storage/metrics/reset", methods=["POST"])
+def reset_storage_metrics():
+    """Return the storage metrics and start a new measurement window (admin token only)."""
+    if not is_admin_request():
+        return jsonify({"error": "Resetting the storage metrics needs the admin token"}), 403
+    return jsonify(object_storage.metrics(reset=True))
 
-        print("✅ Successfully loaded section library from GCS")
+
+@app.route("/api/sections/library", methods=["GET"])
+def get_section_library():
+    try:
+        data = catalog_cache.library()
         return jsonify(data)
     except Exception as e:
         print("❌ Failed to load section library:", str(e))
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/api/sections/library/cache", methods=["GET", "POST"])
+def section_library_cache():
+    """Catalog cache hit/miss counts; POST (admin token only) makes the next request revalidate the stored library."""
+    if request.method == "POST":
+        if not is_admin_request():
+            return jsonify({"error": "Invalidating the section library cache needs the admin token"}), 403
+        catalog_cache.invalidate()
+        print("🔄 Section library cache invalidated")
+    return jsonify(catalog_cache.stats())
+
+
 
 
 @app.route('/api/sections/generate', methods=['POST'])
@@ -307,18 +614,82 @@ def generate_section_with_elements():
         elementSections = data.get("elementSections", {})
         print("🔧 Element Sections:", elementSections)
 
-        sectionLibrary = download_json_from_gcs("sections/element_sections/section_library.json")
-        print("📚 Loaded section library:", sectionLibrary)
+        sectionLibrary = catalog_cache.get()
+        print(f"📚 Loaded section library version {sectionLibrary.version} ({len(sectionLibrary)} entries)")
+
+        if request.args.get("stream"):
+            # Streams outlive the request lock, so they get their own Section
+            section = Section(towerData, elementSections, sectionLibrary)
+            return section_response(section)
+
+        if data.get("changesOnly") and "previousElementSections" not in data:
+            return jsonify({"error": "changesOnly needs the previousElementSections the client last rendered"}), 400
+
+        # The session only reuses computed geometry and element columns; which sections changed is
+        # always taken against the client's own previous assignment, never against shared state
+        section, sectionLock = get_section_session(towerData, sectionLibrary)
+        with sectionLock:
+            recomputed = section.updateElementSections(elementSections)
+            print(f"🔁 Sections recomputed: {recomputed}")
+
+            if data.get("changesOnly"):
+                changed = changedSections(
+                    data["previousElementSections"], elementSections, len(section.getCoordinateArray())
+                )
+                response = jsonify({
+                    "changed_sections": changed,
+                    "elements": section.getSectionElements(changed)
+                })
+            else:
+                # The session still tracks the assignment above; only serializing is shared
+                key = resultKey("section", towerData, elementSections, sectionLibrary.version, format=request.args.get("format"))
+                response = cached_json_response(key, lambda: section_payload(section))
+            print(f"🧮 Geometry builds for this tower: {section.geometryBuilds}")
+
+        return response
 
-        section = Section(towerData, elementSections, sectionLibrary)
+    except Exception as e:
+        print("❌ Error in /api/sections/generate:", str(e))
+        return jsonify({"error": str(e)}), 500
 
-        return jsonify({
-            "coordinates": section.getCoordinates(),
-            "elements": section.getElements()
-        })
+
+@app.route("/api/sections/optimize", methods=["POST"])
+def optimize_element_sections():
+    """Lightest elementSections that carry the wind and dead loads within the solidity/EPA limits."""
+    try:
+        data = request.get_json()
+
+        rawTowerData = data.get("towerData")
+        if not rawTowerData:
+            return jsonify({"error": "Missing towerData"}), 400
+        towerData = normalizeTowerDataKeys(rawTowerData)
+        try:
+            site = site_parameters(rawTowerData, data.get("site"))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        sectionLibrary, catalog = catalog_cache.snapshot()
+        section = Section(towerData, data.get("elementSections", {}), catalog)
+
+        # Panels are sized in parallel on the warm pool (POOL_WORKERS, server configuration)
+        pool = getBatchPool(sectionLibrary, catalog.version, POOL_WORKERS)
+        sizer = SectionSizer(
+            section,
+            site=site,
+            max_solidity=data.get("maxSolidity"),
+            max_epa=data.get("maxEpa"),
+            section_types=data.get("sectionTypes"),
+            processes=pool.workers,
+            pool=pool.executor,
+        )
+        result = sizer.optimize()
+        print(f"🏋️ Optimized in {result['iterations']} iterations: {result['total_weight']} kg, "
+              f"{result['explored']} nodes explored, {result['pruned']} pruned")
+
+        return jsonify(result)
 
     except Exception as e:
-        print("❌ Error in /api/sections/generate:", str(e))
+        print("❌ Error in /api/sections/optimize:", str(e))
         return jsonify({"error": str(e)}), 500
 
 
@@ -0,0 +1,206 @@
+import numpy as np
+
+from loadEngine.ice_loads import IceLoads
+from loadEngine.wind_loads import WindLoads
+
+# Steel self-weight uses g in m/s²
+GRAVITY = 9.81
+
+# Combinations evaluated per matrix product while enveloping
+ENVELOPE_CHUNK_SIZE = 256
+
+# Response quantities stored for every segment, in column order
+QUANTITIES = ("axial", "shear", "moment")
+
+
+def dead_load(section):
+    """
+    Steel self-weight of every segment in N, from each member's density, cross area (mm²) and length.
+    """
+    arrays = section.getElementArrays()
+    return (arrays["density"] * arrays["cross_area"] * 1e-6 * arrays["length"]).sum(axis=-1) * GRAVITY
+
+
+def _suffix_sum(values):
+    # Load carried at the bottom of each segment from everything above it
+    return np.flip(np.cumsum(np.flip(values, axis=-1), axis=-1), axis=-1)
+
+
+class LoadCombinations:
+    """
+    Base load cases held as a (n_cases, n_points) matrix and evaluated as factored combinations.
+
+    A combination is a vector of case factors, so any number of them is one matrix
+    product. Envelopes are reduced chunk by chunk and never hold every combination result.
+
+    Attributes:
+        case_names (list): Name of every row of the matrix.
+        matrix (np.ndarray): Response of every base case, shape (n_cases, n_points).
+        columns (dict): Quantity name -> slice of the point axis, e.g. {"shear": slice(10, 20)}.
+    """
+
+    def __init__(self, case_names, matrix, columns=None):
+        self.case_names = list(case_names)
+        self.matrix = np.asarray(matrix, dtype=np.float64)
+        self.columns = columns or {"value": slice(0, self.matrix.shape[1])}
+        self._case_index = {name: i for i, name in enumerate(self.case_names)}
+
+        if self.matrix.shape[0] != len(self.case_names):
+            raise ValueError(f"Matrix has {self.matrix.shape[0]} rows but {len(self.case_names)} case names were given.")
+
+    @classmethod
+    def from_tower(cls, section, site=None, ice_thicknesses=None, gh=None):
+        """
+        Base cases of a tower: dead load, wind (ultimate and service) per direction, and
+        ice weight plus wind on ice per direction for every ice thickness.
+
+        Each case stores the axial load, shear and overturning moment at the bottom of
+        every segment (QUANTITIES), all in N or N·m.
+
+        Args:
+            section (Section): Tower geometry with its element section assignments.
+            site (dict): Site parameters (tower_data keys).
+            ice_thicknesses (list): Base radial ice thicknesses in m; defaults to the tower's own.
+            gh (float): Gust effect factor, computed from the tower height when not given.
+        """
+        wind = WindLoads.from_section(section, site, gh)
+        n_segments = len(wind.z_height)
+        zeros = np.zeros(n_segments)
+        case_names, rows = [], []
+
+        def add(name, axial, shear, moment):
+            case_names.append(name)
+            rows.append(np.concatenate([axial, shear, moment]))
+
+        add("dead", _suffix_sum(dead_load(section)), zeros, zeros)
+
+        result = wind.compute()
+        for s, state in enumerate(result["limit_states"]):
+            for a, angle_key in enumerate(result["angle_keys"]):
+                add(f"wind_{state}_{angle_key}", zeros, result["shear"][s, a], result["moment"][s, a])
+
+        ice = IceLoads(section, site, wind.gh)
+        if ice_thicknesses is None:
+            ice_thicknesses = [ice.default_thickness()]
+        ice_result = ice.compute(np.asarray(ice_thicknesses, dtype=np.float64))
+        for t, thickness in enumerate(ice_thicknesses):
+            label = f"{thickness * 1000:g}mm"
+            add(f"ice_{label}", _suffix_sum(ice_result["ice_weight"][t]), zeros, zeros)
+            for a, angle_key in enumerate(ice_result["angle_keys"]):
+                add(f"wind_ice_{label}_{angle_key}", zeros, ice_result["shear"][t, a], ice_result["moment"][t, a])
+
+        columns = {quantity: slice(k * n_segments, (k + 1) * n_segments) for k, quantity in enumerate(QUANTITIES)}
+        return cls(case_names, np.array(rows).reshape(len(rows), 3 * n_segments), columns)
+
+    def add_case(self, name, values):
+        """
+        Append a base case (e.g. appurtenance loads) with one value per point.
+        """
+        if name in self._case_index:
+            raise ValueError(f"Load case '{name}' already exists.")
+        self._case_index[name] = len(self.case_names)
+        self.case_names.append(name)
+        self.matrix = np.vstack([self.matrix, np.asarray(values, dtype=np.float64)[None, :]])
+
+    def factor_matrix(self, combinations):
+        """
+        Turn {combination name: {case name: factor}} into a (n_combinations, n_cases) matrix.
+        """
+        factors = np.zeros((len(combinations), len(self.case_names)))
+        for c, case_factors in enumerate(combinations.values()):
+            for case_name, factor in case_factors.items():
+                if case_name not in self._case_index:
+                    raise ValueError(f"Unknown load case '{case_name}'.")
+                factors[c, self._case_index[case_name]] = factor
+        return factors
+
+    def standard_combinations(self):
+        """
+        Strength and service combinations for every direction and ice case present.
+
+        1.2D + 1.0Wo, 0.9D + 1.0Wo, 1.2D + 1.0Di + 1.0Wi and 1.0D + 1.0Ws.
+        """
+        combinations = {}
+        for name in self.case_names:
+            if name.startswith("wind_ultimate_"):
+                direction = name[len("wind_ultimate_"):]
+                combinations[f"1.2D+1.0Wo_{direction}"] = {"dead": 1.2, name: 1.0}
+                combinations[f"0.9D+1.0Wo_{direction}"] = {"dead": 0.9, name: 1.0}
+            elif name.startswith("wind_service_"):
+                combinations[f"1.0D+1.0Ws_{name[len('wind_service_'):]}"] = {"dead": 1.0, name: 1.0}
+            elif name.startswith("wind_ice_"):
+                label, direction = name[len("wind_ice_"):].split("_", 1)
+                combinations[f"1.2D+1.0Di+1.0Wi_{label}_{direction}"] = {"dead": 1.2, f"ice_{label}": 1.0, name: 1.0}
+        return combinations
+
+    def _factors(self, combinations):
+        if isinstance(combinations, dict):
+            return list(combinations), self.factor_matrix(combinations)
+        factors = np.atleast_2d(np.asarray(combinations, dtype=np.float64))
+        return [str(c) for c in range(len(factors))], factors
+
+    def evaluate(self, combinations):
+        """
+        Every combination result, materialized as a (n_combinations, n_points) matrix.
+
+        Args:
+            combinations (dict | np.ndarray): {name: {case: factor}} or a factor matrix.
+        """
+        return self._factors(combinations)[1] @ self.matrix
+
+    def envelope(self, combinations, chunk_size=ENVELOPE_CHUNK_SIZE):
+        """
+        Maximum and minimum of every point over all combinations, and which combination governs.
+
+        Combinations are multiplied chunk_size at a time and folded into the running
+        envelope, so memory stays at one chunk regardless of the combination count.
+
+        Returns:
+            dict: "max", "min" (n_points,), "max_combination", "min_combination" (names per point).
+        """
+        names, factors = self._factors(combinations)
+        if not len(factors):
+            # An empty envelope would be ±inf, which is not valid JSON
+            raise ValueError("No load combinations to envelope.")
+        n_points = self.matrix.shape[1]
+        upper = np.full(n_points, -np.inf)
+        lower = np.full(n_points, np.inf)
+        upper_index = np.zeros(n_points, dtype=np.int64)
+        lower_index = np.zeros(n_points, dtype=np.int64)
+
+        for start in range(0, len(factors), chunk_size):
+            block = factors[start:start + chunk_size] @ self.matrix
+            block_max, block_min = block.argmax(axis=0), block.argmin(axis=0)
+            values_max = block[block_max, np.arange(n_points)]
+            values_min = block[block_min, np.arange(n_points)]
+            raised, lowered = values_max > upper, values_min < lower
+            upper = np.where(raised, values_max, upper)
+            lower = np.where(lowered, values_min, lower)
+            upper_index = np.where(raised, block_max + start, upper_index)
+            lower_index = np.where(lowered, block_min + start, lower_index)
+
+        return {
+            "max": upper,
+            "min": lower,
+            "max_combination": [names[i] for i in upper_index],
+            "min_combination": [names[i] for i in lower_index],
+        }
+
+    def envelope_summary(self, combinations=None):
+        """
+        JSON-ready envelope per quantity; defaults to standard_combinations().
+        """
+        combinations = combinations if combinations is not None else self.standard_combinations()
+        envelope = self.envelope(combinations)
+        return {
+            "combinations": len(combinations),
+            **{
+                quantity: {
+                    "max": np.round(envelope["max"][columns], 2).tolist(),
+                    "min": np.round(envelope["min"][columns], 2).tolist(),
+                    "max_combination": envelope["max_combination"][columns],
+                    "min_combination": envelope["min_combination"][columns],
+                }
+                for quantity, columns in self.columns.items()
+            },
+        }
@@ -0,0 +1,175 @@
+import numpy as np
+
+from section import faceAreas
+from loadEngine.panel import effective_projected_areas
+from loadEngine.wind_loads import WindLoads, cumulative_resultants, velocity_pressure
+
+# Unit weight of glaze ice in N/m³
+ICE_DENSITY = 8900.0
+
+# Upper bound of the ice height escalation factor Kiz
+KIZ_MAX = 1.4
+
+
+def ice_escalation_factor(z_height):
+    """
+    Height escalation factor Kiz = (z / 10)^0.10, capped at KIZ_MAX (z in meters).
+    """
+    return np.minimum((np.asarray(z_height, dtype=np.float64) / 10.0) ** 0.10, KIZ_MAX)
+
+
+def design_ice_thickness(thickness, z_height, kzt=1.0, importance_factor=1.0, escalate=True):
+    """
+    Radial ice thickness at every segment height for one or many base thicknesses.
+
+    With escalate, t_iz = 2.0 * t * I * Kiz * Kzt^0.35; otherwise t is used unchanged at every height.
+
+    Args:
+        thickness (float | array-like): Base radial ice thickness in m, scalar, (n_cases,),
+            or (n_cases, n_segments) for a thickness profile given directly.
+        z_height (np.ndarray): Segment mid heights in m, shape (n_segments,).
+        kzt (float | np.ndarray): Topographic factor, scalar or per segment.
+        importance_factor (float): Ice importance factor I.
+        escalate (bool): Apply the height and topographic escalation.
+
+    Returns:
+        np.ndarray: t_iz in m, shape (n_cases, n_segments).
+    """
+    thickness = np.asarray(thickness, dtype=np.float64)
+    if thickness.ndim < 2:
+        thickness = np.atleast_1d(thickness)[:, None]
+    if (thickness < 0).any():
+        raise ValueError("Invalid ice thickness: every thickness must be non-negative.")
+    if not escalate:
+        return np.broadcast_to(thickness, (thickness.shape[0], len(z_height))).copy()
+    return 2.0 * thickness * importance_factor * ice_escalation_factor(z_height) * np.asarray(kzt) ** 0.35
+
+
+class IceLoads:
+    """
+    Ice-accreted load case of a Section: iced member widths, ice self-weight and the wind on the iced tower.
+
+    Every member's projected width grows by 2 * t_iz. Members keep their bare type
+    (round or angle) for Rr and Cf. Many ice thicknesses are evaluated as one batch
+    along a leading case axis.
+
+    Attributes:
+        section (Section): Tower geometry with its element section assignments.
+        wind (WindLoads): Bare-steel wind loads supplying heights, site parameters and Gh.
+    """
+
+    def __init__(self, section, site=None, gh=None):
+        self.section = section
+        self.wind = WindLoads.from_section(section, site, gh)
+
+    @property
+    def site(self):
+        return self.wind.site
+
+    def default_thickness(self):
+        """
+        The tower's own radial ice thickness ("ice thickness" in tower_data, mm) in m.
+        """
+        return float(self.site.get("ice thickness") or self.site.get("ice_thickness") or 0.0) / 1000
+
+    def compute(self, thickness=None, escalate=True):
+        """
+        Iced member geometry, ice weight, solidity, Cf, EPA and wind forces for every thickness.
+
+        Args:
+            thickness (float | array-like): Radial ice thickness in m, see design_ice_thickness;
+                defaults to the tower's own ice thickness.
+            escalate (bool): Escalate the thickness with height and topography.
+
+        Returns:
+            dict: "thickness" (n_cases, n_segments) t_iz, "ice_weight" (n_cases, n_segments) in N
+            and "total_ice_weight" (n_cases,), "solidity_ratio" and "cf" (n_cases, n_segments),
+            "angle_keys", "epa" of shape (n_cases, n_directions, n_segments), the ice wind
+            speed and "qz" (n_segments,), and "force", "shear", "moment" of shape
+            (n_cases, n_directions, n_segments).
+        """
+        if thickness is None:
+            thickness = self.default_thickness()
+        arrays = self.section.getElementArrays()
+        coordinates = self.section.getJoinedCoordinateArray()
+        factors = self.wind.site_factors()
+
+        t_iz = design_ice_thickness(
+            thickness, self.wind.z_height, factors["kzt"], self.site.get("ice_importance_factor", 1.0), escalate
+        )
+        # (n_cases, n_sections, 1) against (n_sections, n_members)
+        member_thickness = t_iz[:, :, None]
+        width = arrays["projected_width"]
+        length = arrays["length"]
+        iced_projected_area = (width + 2 * member_thickness) * length
+
+        # Ice annulus around an envelope of the bare width: pi * t * (w + t)
+        ice_weight = (ICE_DENSITY * np.pi * member_thickness * (width + member_thickness) * length).sum(axis=-1)
+
+        faces = faceAreas(coordinates, iced_projected_area, arrays["secction_type"] == "round")
+        aero = effective_projected_areas(
+            faces["angle_projected_area"], faces["round_projected_area"], faces["gross_area"], self.wind.cross_section
+        )
+        angle_keys = list(aero["epa"])
+        epa = np.stack([aero["epa"][angle_key] for angle_key in angle_keys], axis=1)
+
+        wind_speed = self.site.get("basic_wind_speed_ice", self.site["basic_wind_speed_service"])
+        qz = velocity_pressure(
+            factors["kz"], factors["kzt"], factors["ke"], self.site["kd"], wind_speed, self.site["importance_factor"]
+        )
+        force = qz * self.wind.gh * epa
+        shear, moment = cumulative_resultants(force, self.wind.z_height, self.wind.bottom_level)
+        return {
+            "thickness": t_iz,
+            "ice_weight": ice_weight,
+            "total_ice_weight": ice_weight.sum(axis=-1),
+            "solidity_ratio": aero["solidity_ratio"],
+            "cf": aero["cf"],
+            "angle_keys": angle_keys,
+            "epa": epa,
+            "wind_speed": wind_speed,
+            "qz": qz,
+            "force": force,
+            "shear": shear,
+            "moment": moment,
+        }
+
+    def sensitivity(self, thicknesses, escalate=True):
+        """
+        Ice sensitivity curves: total ice weight and base resultants against base ice thickness.
+
+        Args:
+            thicknesses (array-like): Base radial ice thicknesses in m, shape (n_cases,).
+
+        Returns:
+            dict: "thickness" (n_cases,), "total_ice_weight" (n_cases,) and, per direction,
+            "base_shear" and "base_moment" (n_cases,).
+        """
+        thicknesses = np.atleast_1d(np.asarray(thicknesses, dtype=np.float64))
+        result = self.compute(thicknesses, escalate)
+        has_segments = result["force"].shape[-1] > 0
+        return {
+            "thickness": thicknesses,
+            "total_ice_weight": result["total_ice_weight"],
+            "directions": {
+                angle_key: {
+                    "base_shear": result["shear"][:, a, 0] if has_segments else np.zeros(len(thicknesses)),
+                    "base_moment": result["moment"][:, a, 0] if has_segments else np.zeros(len(thicknesses)),
+                }
+                for a, angle_key in enumerate(result["angle_keys"])
+            },
+        }
+
+    def summary(self, thicknesses, escalate=True):
+        """
+        JSON-ready ice sensitivity curves for a list of base thicknesses (m).
+        """
+        curves = self.sensitivity(thicknesses, escalate)
+        return {
+            "thickness": np.round(curves["thickness"], 4).tolist(),
+            "total_ice_weight": np.round(curves["total_ice_weight"], 2).tolist(),
+            "directions": {
+                angle_key: {key: np.round(values, 2).tolist() for key, values in direction.items()}
+                for angle_key, direction in curves["directions"].items()
+            },
+        }
@@ -1,6 +1,80 @@
 from math import exp
+import numpy as np
 from loadEngine.tables import table_2_4, table_2_5
 
+
+def _exposure_constants(exposure_category):
+    try:
+        return (
+            table_2_4["zg"][exposure_category],
+            table_2_4["alpha"][exposure_category],
+            table_2_4["Kzmin"][exposure_category],
+            table_2_4["Ke"][exposure_category],
+        )
+    except KeyError as e:
+        raise ValueError(f"Invalid exposure category '{exposure_category}'. Ensure it exists in Table 2-4.") from e
+
+
+def _as_number(value):
+    # float(value) for ints, floats, NumPy scalars and numeric strings; None when it is not a finite number
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if np.isfinite(number) else None
+
+
+def factor_profile(z_heights, exposure_category="Exposure C", topographic_category="2",
+                   crest_height=10, ground_elevation=0, decimals=4):
+    """
+    Evaluate Kz, Kzt and Ke over an array of heights in one vectorized pass.
+
+    Args:
+        z_heights (array-like): Heights above ground level in meters, any shape.
+        exposure_category (str): Key of Table 2-4 ("Exposure B", "Exposure C", "Exposure D").
+        topographic_category (str): "1" (no speed-up) or a key of Table 2-5.
+        crest_height (float): Height of the crest above the surrounding terrain in meters.
+        ground_elevation (float): Ground elevation above sea level in meters.
+        decimals (int | None): Rounding applied to the results; None returns raw values.
+
+    Returns:
+        dict: "z", "kz", "kzt" and "ke" arrays shaped like z_heights.
+    """
+    z = np.asarray(z_heights, dtype=np.float64)
+    if not np.all(z > 0):
+        raise ValueError("Invalid z_height: every height must be a positive number.")
+    zg, alpha, kz_min, terrain_constant = _exposure_constants(exposure_category)
+
+    # Kz = 2.01 * (z / zg)^(2 / alpha), bounded by [Kzmin, 2.01]
+    kz = np.clip(2.01 * (z / zg) ** (2 / alpha), kz_min, 2.01)
+
+    topographic_category = str(topographic_category)
+    if topographic_category == "1":
+        kzt = np.ones_like(z)
+    else:
+        try:
+            topographic = table_2_5["Topographic Category"][topographic_category]
+        except KeyError as e:
+            raise ValueError(f"Invalid topographic category '{topographic_category}'. Ensure it exists in Table 2-5.") from e
+        crest = _as_number(crest_height)
+        if crest is None or crest <= 0:
+            raise ValueError(f"Invalid crest_height: {crest_height}. Must be a positive number.")
+        crest_height = crest
+        Kh = np.exp(topographic["f"] * z / crest_height)
+        kzt = (1 + (terrain_constant * topographic["Kt"] / Kh)) ** 2
+
+    elevation = _as_number(ground_elevation)
+    if elevation is None or elevation < 0:
+        raise ValueError(f"Invalid ground elevation: {ground_elevation}. Must be a non-negative number.")
+    ground_elevation = elevation
+    # Ke = e^(-0.000119 * z_s)
+    ke = np.full_like(z, np.exp(-0.000119 * ground_elevation))
+
+    if decimals is not None:
+        kz, kzt, ke = np.round(kz, decimals), np.round(kzt, decimals), np.round(ke, decimals)
+    return {"z": z, "kz": kz, "kzt": kzt, "ke": ke}
+
+
 class K_factors:
     def __init__(self, tower_data):
         """
@@ -14,9 +88,36 @@ class K_factors:
         # Extract relevant values from tower_data
         self.exposure_category = tower_data.get("exposure_category", "Exposure C")
         self.crest_height = tower_data.get("crest_height", 0)  # Default crest height
+        self.topographic_category = str(tower_data.get("topographic_category", "2"))
         self.ground_elevation = tower_data.get("ground_elevation", 0)  # Default ground elevation
         self.segment_list = tower_data.get("segment_list", [])  # Get the list of segments
 
+    def profile(self, z_heights, decimals=4):
+        """
+        Kz, Kzt and Ke over an array of heights for this tower's exposure and topography.
+
+        Args:
+            z_heights (array-like): Heights above ground level in meters.
+            decimals (int | None): Rounding applied to the results; None returns raw values.
+
+        Returns:
+            dict: "z", "kz", "kzt" and "ke" arrays shaped like z_heights.
+        """
+        return factor_profile(
+            z_heights,
+            exposure_category=self.exposure_category,
+            topographic_category=self.topographic_category,
+            crest_height=self.crest_height,
+            ground_elevation=self.ground_elevation,
+            decimals=decimals,
+        )
+
+    @staticmethod
+    def _validate_height(z_height, factor):
+        height = _as_number(z_height)
+        if height is None or height <= 0:
+            raise ValueError(f"Error calculating {factor}: Invalid z_height: {z_height}. Must be a positive number.")
+
     def calculateKe(self):
         """
         Calculate the ground elevation factor (Ke).
@@ -24,16 +125,11 @@ class K_factors:
         Returns:
             float: Ground elevation factor (Ke).
         """
-        try:
-            # Validate ground elevation
-            if not isinstance(self.ground_elevation, (int, float)) or self.ground_elevation < 0:
-                raise ValueError(f"Invalid ground elevation: {self.ground_elevation}. Must be a non-negative number.")
-
-            # Calculate Ke using the formula Ke = e^(-0.000119 * z_s)
-            ke = exp(-0.000119 * self.ground_elevation)
-            return round(ke, 4)
-        except Exception as e:
-            raise ValueError(f"Error calculating Ke: {str(e)}")
+        ground_elevation = _as_number(self.ground_elevation)
+        if ground_elevation is None or ground_elevation < 0:
+            raise ValueError(f"Error calculating Ke: Invalid ground elevation: {self.ground_elevation}. Must be a non-negative number.")
+        # Ke = e^(-0.000119 * z_s)
+        return round(exp(-0.000119 * ground_elevation), 4)
 
     def calculateKzt(self, z_height):
         """
@@ -45,28 +141,11 @@ class K_factors:
         Returns:
             float: Topographic factor (Kzt).
         """
+        self._validate_height(z_height, "Kzt")
         try:
-            # Retrieve parameters from Table 2-4 and Table 2-5
-            ke = table_2_4["Ke"][self.exposure_category]  # Terrain constant
-            kt = table_2_5["Topographic Category"]["2"]["Kt"]  # Topographic constant
-            f = table_2_5["Topographic Category"]["2"]["f"]  # Height attenuation factor
-
-            # Validate inputs
-            if not isinstance(z_height, (int, float)) or z_height <= 0:
-                raise ValueError(f"Invalid z_height: {z_height}. Must be a positive number.")
-
-            if not isinstance(self.crest_height, (int, float)) or self.crest_height <= 0:
-                raise ValueError(f"Invalid crest_height: {self.crest_height}. Must be a positive number.")
-
-            # Calculate Kh and Kzt
-            Kh = exp(f * z_height / self.crest_height)
-            kzt = (1 + (ke * kt / Kh)) ** 2
-
-            return round(kzt, 4)
-        except KeyError as e:
-            raise ValueError(f"Invalid exposure category '{self.exposure_category}'. Ensure it exists in Table 2-4.") from e
-        except Exception as e:
-            raise ValueError(f"Error calculating Kzt: {str(e)}")
+            return round(float(self.profile(z_height, decimals=None)["kzt"]), 4)
+        except ValueError as e:
+            raise ValueError(f"Error calculating Kzt: {str(e)}") from e
 
     def calculateKz(self, z_height):
         """
@@ -78,26 +157,12 @@ class K_factors:
         Returns:
             float: Velocity pressure coefficient (Kz).
         """
+        self._validate_height(z_height, "Kz")
         try:
-            # Retrieve parameters from Table 2-4
-            zg = table_2_4["zg"][self.exposure_category]  # Boundary layer height in meters
-            alpha = table_2_4["alpha"][self.exposure_category]  # Velocity profile exponent
-            Kzmin = table_2_4["Kzmin"][self.exposure_category]  # Minimum Kz value
-
-            # Validate inputs
-            if not isinstance(z_height, (int, float)) or z_height <= 0:
-                raise ValueError(f"Invalid z_height: {z_height}. Must be a positive number.")
+            return round(float(self.profile(z_height, decimals=None)["kz"]), 4)
+        except ValueError as e:
+            raise ValueError(f"Error calculating Kz: {str(e)}") from e
 
-            # Calculate Kz using the formula: Kz = 2.01 * (z / zg)^(2 / alpha)
-            Kz = 2.01 * (z_height / zg) ** (2 / alpha)
-
-            # Ensure Kz is within valid bounds
-            return round(min(max(Kz, Kzmin), 2.01), 4)
-        except KeyError as e:
-            raise ValueError(f"Invalid exposure category '{self.exposure_category}'. Ensure it exists in Table 2-4.") from e
-        except Exception as e:
-            raise ValueError(f"Error calculating Kz: {str(e)}")
-        
     def calculateKs(self, zr, parapet_height, xb, ws, hs):
         """
         Calculate the rooftop wind speed-up factor (Ks).
@@ -134,22 +199,23 @@ class K_factors:
         """
         Get a list of dictionaries containing Kz, Kzt, and Ke values for each segment.
 
+        Ks is not included: it needs rooftop parameters (zr, parapet height, building
+        size) that tower_data does not carry; call calculateKs directly for rooftop towers.
+
         Returns:
             list: A list of dictionaries, each containing Kz, Kzt, and Ke for a segment.
         """
-        ke = self.calculateKe()
-        factors_summary = []
+        z_heights = [segment.get("z_height") for segment in self.segment_list]
+        if not z_heights:
+            return []
+        factors = self.profile(z_heights)
 
-        for segment in self.segment_list:
-
-            z_height = segment.get("z_height")  # not use any with deafult. 
-
-            factors_summary.append({
+        return [
+            {
                 "segment_number": segment.get("segment_number", "N/A"),
-                "Kz": self.calculateKz(z_height),
-                "Kzt": self.calculateKzt(z_height),
-                "Ke": ke,
-                "Ks": self.calculateKs(zr, parapet_height, xb, ws, hs)
-            })
-
-        return factors_summary
+                "Kz": float(kz),
+                "Kzt": float(kzt),
+                "Ke": float(ke),
+            }
+            for segment, kz, kzt, ke in zip(self.segment_list, factors["kz"], factors["kzt"], factors["ke"])
+        ]
@@ -140,9 +140,12 @@ def main(stdscr):
             ground_elevation=0.0  # Set default ground elevation
         )
 
-        panel_summary = panel.summary(cross_section)
+        panels.append(panel)
+
+    # Evaluate every panel of the tower in one batched pass
+    panels = Panel.evaluate_many(panels, cross_section)
+    for section_number, panel_summary in enumerate(panels, start=1):
         panel_summary["section_number"] = section_number
-        panels.append(panel_summary)
 
     # Save summaries to JSON
     with open("panel_summaries.json", "w") as f:
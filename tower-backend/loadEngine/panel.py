@@ -1,8 +1,188 @@
 import math
-from loadEngine.toolkit import Toolkit
+from collections import Counter
+from functools import wraps
+from loadEngine.toolkit import Toolkit, member_lengths, round_like_python
 from loadEngine.angle_bar import ANGLE_BARS_SI, ANGLE_BARS_IMPERIAL, ROUND_BARS_SI, ROUND_BARS_IMPERIAL
 from loadEngine.tables import table_2_6
 from loadEngine.k_factors import K_factors  # Import the updated K_factors module
+import numpy as np
+
+
+VALID_CROSS_SECTIONS = ("square", "triangular")
+
+
+def force_coefficient(solidity_ratio, cross_section):
+    """
+    Force coefficient Cf for a solidity ratio (float or array).
+
+    Args:
+        solidity_ratio (float | np.ndarray): Solidity ratio ε.
+        cross_section (str): "square" or "triangular".
+
+    Returns:
+        float | np.ndarray: Unrounded Cf.
+    """
+    cross_section = cross_section.lower()
+    if cross_section == "triangular":
+        return 3.4 * solidity_ratio**2 - 4.7 * solidity_ratio + 3.4
+    elif cross_section == "square":
+        return 4.0 * solidity_ratio**2 - 5.9 * solidity_ratio + 4.0
+    else:
+        raise ValueError("Invalid cross-section type. Use 'square' or 'triangular'.")
+
+
+def round_reduction_factor(solidity_ratio):
+    """
+    Reduction factor Rr for round members (float or array), capped at 1.0.
+    """
+    rr = 0.57 - 0.14 * solidity_ratio + 0.86 * (solidity_ratio ** 2) - 0.24 * (solidity_ratio ** 3)
+    return np.minimum(rr, 1.0)
+
+
+def force_coefficient_derivative(solidity_ratio, cross_section):
+    """
+    dCf/dε of force_coefficient (float or array).
+    """
+    cross_section = cross_section.lower()
+    if cross_section == "triangular":
+        return 6.8 * solidity_ratio - 4.7
+    elif cross_section == "square":
+        return 8.0 * solidity_ratio - 5.9
+    else:
+        raise ValueError("Invalid cross-section type. Use 'square' or 'triangular'.")
+
+
+def round_reduction_factor_derivative(solidity_ratio):
+    """
+    dRr/dε of round_reduction_factor, zero where Rr is capped at 1.0.
+    """
+    rr = 0.57 - 0.14 * solidity_ratio + 0.86 * (solidity_ratio ** 2) - 0.24 * (solidity_ratio ** 3)
+    return np.where(rr < 1.0, -0.14 + 1.72 * solidity_ratio - 0.72 * (solidity_ratio ** 2), 0.0)
+
+
+def direction_factor(solidity_ratio, cross_section, angle_key):
+    """
+    Wind direction factor Df from Table 2-6 (float or array).
+
+    The square 45° entry is computed as min(1 + 0.75 * ε, 1.2).
+    """
+    df_value = table_2_6[cross_section][angle_key]["Df"]
+    if df_value is None:
+        if cross_section == "square" and angle_key == "45":
+            return np.minimum(1 + 0.75 * solidity_ratio, 1.2)
+        raise ValueError(f"Df is undefined for {cross_section} at {angle_key}°.")
+    return df_value + np.zeros_like(solidity_ratio, dtype=float)
+
+
+def direction_factor_derivative(solidity_ratio, cross_section, angle_key):
+    """
+    dDf/dε of direction_factor: 0.75 below the 1.2 cap for square 45°, zero for the constant entries.
+    """
+    if table_2_6[cross_section][angle_key]["Df"] is None and cross_section == "square" and angle_key == "45":
+        return np.where(1 + 0.75 * solidity_ratio < 1.2, 0.75, 0.0)
+    return np.zeros_like(solidity_ratio, dtype=float)
+
+
+# Symmetry period of each cross-section (degrees) and where every Table 2-6 direction
+# falls once an angle is folded into [0, period / 2]; 90° on a triangle mirrors to 30°.
+DIRECTION_SYMMETRY = {
+    "square": (90.0, {"Normal": 0.0, "45": 45.0}),
+    "triangular": (120.0, {"Normal": 0.0, "90": 30.0, "60": 60.0}),
+}
+
+
+def fold_wind_angle(angles, cross_section):
+    """
+    Fold wind angles (degrees from the face normal, any range) into [0, period / 2].
+    """
+    period = DIRECTION_SYMMETRY[cross_section][0]
+    remainder = np.mod(np.asarray(angles, dtype=np.float64), period)
+    return np.minimum(remainder, period - remainder)
+
+
+def direction_factor_sweep(solidity_ratio, cross_section, angles):
+    """
+    Direction factor Df at arbitrary wind angles, linearly interpolated between the Table 2-6 directions.
+
+    Args:
+        solidity_ratio (np.ndarray): Solidity ratio of each panel, shape (n_panels,).
+        cross_section (str): "square" or "triangular".
+        angles (np.ndarray): Wind angles in degrees, shape (n_angles,).
+
+    Returns:
+        np.ndarray: Df of shape (n_angles, n_panels).
+    """
+    solidity_ratio = np.atleast_1d(np.asarray(solidity_ratio, dtype=np.float64))
+    points = sorted(DIRECTION_SYMMETRY[cross_section][1].items(), key=lambda item: item[1])
+    knots = np.array([folded for _, folded in points])
+    values = np.array([direction_factor(solidity_ratio, cross_section, angle_key) for angle_key, _ in points])
+
+    folded = fold_wind_angle(angles, cross_section)
+    upper = np.clip(np.searchsorted(knots, folded, side="right"), 1, len(knots) - 1)
+    weight = ((folded - knots[upper - 1]) / (knots[upper] - knots[upper - 1]))[:, None]
+    return values[upper - 1] * (1 - weight) + values[upper] * weight
+
+
+def effective_projected_areas(angle_projected_area, round_projected_area, gross_area, cross_section, gradients=False):
+    """
+    Unrounded EPA for every Table 2-6 wind direction, vectorized over panels.
+
+    Args:
+        angle_projected_area (np.ndarray): Projected area of flat (angle) members.
+        round_projected_area (np.ndarray): Projected area of round members.
+        gross_area (np.ndarray): Gross area of the face.
+        cross_section (str): "square" or "triangular".
+        gradients (bool): Also return the exact partial derivatives of every EPA with
+            respect to the angle and round projected areas (gross area held fixed).
+
+    Returns:
+        dict: {"solidity_ratio", "cf", "rr", "epa": {angle_key: array}}, plus
+        "d_epa_d_angle" and "d_epa_d_round" ({angle_key: array}) when gradients is set.
+    """
+    cross_section = cross_section.lower().strip()
+    if cross_section not in VALID_CROSS_SECTIONS:
+        raise ValueError(f"Invalid cross-section type '{cross_section}'. Must be one of {list(VALID_CROSS_SECTIONS)}.")
+
+    solidity = (angle_projected_area + round_projected_area) / gross_area
+    cf = force_coefficient(solidity, cross_section)
+    rr = round_reduction_factor(solidity)
+    total_projected_area = angle_projected_area + round_projected_area * rr
+    epa = {
+        angle_key: cf * direction_factor(solidity, cross_section, angle_key) * total_projected_area
+        for angle_key in table_2_6[cross_section]
+    }
+    result = {"solidity_ratio": solidity, "cf": cf, "rr": rr, "epa": epa}
+    if not gradients:
+        return result
+
+    # EPA = Cf(ε) Df(ε) (Aa + Ar Rr(ε)) with ε = (Aa + Ar) / Ag, so dε/dAa = dε/dAr = 1 / Ag
+    d_cf = force_coefficient_derivative(solidity, cross_section)
+    d_rr = round_reduction_factor_derivative(solidity)
+    result["d_epa_d_angle"], result["d_epa_d_round"] = {}, {}
+    for angle_key in table_2_6[cross_section]:
+        df = direction_factor(solidity, cross_section, angle_key)
+        d_df = direction_factor_derivative(solidity, cross_section, angle_key)
+        through_solidity = ((d_cf * df + cf * d_df) * total_projected_area + cf * df * round_projected_area * d_rr) / gross_area
+        result["d_epa_d_angle"][angle_key] = through_solidity + cf * df
+        result["d_epa_d_round"][angle_key] = through_solidity + cf * df * rr
+    return result
+
+
+def _memoized(method):
+    """
+    Evaluate a derived panel quantity once per argument set.
+
+    Derived quantities call each other (cf -> solidity_ratio -> projected_area -> *_geometry),
+    so caching every node of that graph makes each one run exactly once per panel.
+    """
+    @wraps(method)
+    def wrapper(self, *args):
+        key = (method.__name__,) + args
+        if key not in self._cache:
+            self.evaluation_counts[method.__name__] += 1
+            self._cache[key] = method(self, *args)
+        return self._cache[key]
+    return wrapper
 
 
 class Panel:
@@ -20,13 +200,16 @@ class Panel:
         self.z_height = z_height
         self.ground_elevation = ground_elevation
 
+        # Memoized derived quantities and how many times each one was actually computed
+        self._cache = {}
+        self.evaluation_counts = Counter()
+
         # Initialize K_factors instance for this panel
-        self.k_factors = K_factors(
-            exposure_category=exposure_category,
-            z_height=z_height,
-            crest_height=segment.get("crest_height", 10),  # Default crest height
-            ground_elevation=ground_elevation
-        )
+        self.k_factors = K_factors({
+            "exposure_category": exposure_category,
+            "crest_height": segment.get("crest_height", 10),  # Default crest height
+            "ground_elevation": ground_elevation
+        })
 
         # Determine which bar dictionary to use based on bar type and measurement system
         if leg_type == "Angle Bar":
@@ -69,19 +252,28 @@ class Panel:
 
         self.toolkit = Toolkit(segment)
 
+    def invalidate(self):
+        """
+        Drop every memoized quantity, e.g. after changing a member width.
+        """
+        self._cache.clear()
+
     # Use K_factors for Kz, Kzt, and Ke
+    @_memoized
     def calculateKz(self):
         """
         Calculate Kz using the K_factors module.
         """
-        return self.k_factors.calculateKz()
+        return self.k_factors.calculateKz(self.z_height)
 
+    @_memoized
     def calculateKzt(self):
         """
         Calculate Kzt using the K_factors module.
         """
-        return self.k_factors.calculateKzt()
+        return self.k_factors.calculateKzt(self.z_height)
 
+    @_memoized
     def calculateKe(self):
         """
         Calculate Ke using the K_factors module.
@@ -90,6 +282,7 @@ class Panel:
 
     ### Geometry Calculation Methods
 
+    @_memoized
     def leg_geometry(self):
         leg_length = self.toolkit.calculate_leg_length()
         return {
@@ -98,6 +291,7 @@ class Panel:
             "leg_area": round(leg_length * self.leg_width, 4)
         }
 
+    @_memoized
     def diagonal_geometry(self):
         diagonal_length = self.toolkit.calculate_diagonal_length()
         return {
@@ -106,6 +300,7 @@ class Panel:
             "diagonal_area": round(diagonal_length * self.diagonal_width, 4)
         }
 
+    @_memoized
     def main_belt_geometry(self):
         main_belt_length = self.toolkit.calculate_main_belt_length()
         return {
@@ -114,6 +309,7 @@ class Panel:
             "main_belt_area": round(main_belt_length * self.main_belt_width, 4)
         }
     
+    @_memoized
     def projected_area(self):
         """
         Calculate the projected area for round and angle bars in the panel.
@@ -152,6 +348,7 @@ class Panel:
             "angle_projected_area": round(angle_projected_area, 4),
         }
     
+    @_memoized
     def solidity_ratio(self):
         """
         Calculate the solidity ratio of the panel.
@@ -174,6 +371,7 @@ class Panel:
         total_projected_area = round_projected_area + angle_projected_area
         return round(total_projected_area / gross_area, 4)
     
+    @_memoized
     def cf(self):
         """
         Calculate the force coefficient based on the solidity ratio.
@@ -182,14 +380,9 @@ class Panel:
             float: Force coefficient.
         """
         solidity_ratio = self.solidity_ratio()
+        return round(force_coefficient(solidity_ratio, self.cross_section), 4)
 
-        if self.cross_section.lower() == "triangular":
-            return round(3.4 * solidity_ratio**2 - 4.7 * solidity_ratio + 3.4, 4)
-        elif self.cross_section.lower() == "square":
-            return round(4.0 * solidity_ratio**2 - 5.9 * solidity_ratio + 4.0, 4)
-        else:
-            raise ValueError("Invalid cross-section type. Use 'square' or 'triangular'.")
-
+    @_memoized
     def reduction_round_factor(self):
         """
         Calculate the reduction factor (Rr) for round bars based on the solidity ratio.
@@ -200,15 +393,13 @@ class Panel:
         # Calculate the solidity ratio
         solidity_ratio = self.solidity_ratio()
 
-        # Calculate Rr using the formula provided
-        rr = 0.57 - 0.14 * solidity_ratio + 0.86 * (solidity_ratio ** 2) - 0.24 * (solidity_ratio ** 3)
-
-        # Ensure Rr does not exceed 1
-        rr = min(rr, 1.0)
+        # Calculate Rr using the formula provided, capped at 1
+        rr = round_reduction_factor(solidity_ratio)
 
-        return round(rr, 4)
+        return round(float(rr), 4)
 
 
+    @_memoized
     def effective_projected_area(self, cross_section):
         """
         Calculate the effective projected area (EPA) for different wind angles based on the cross-section type.
@@ -245,16 +436,8 @@ class Panel:
         # Calculate EPA for each wind angle
         epa_dict = {}
         for angle_key in wind_angles:
-            # Retrieve Df from Table 2-6
-            df_value = table_2_6[cross_section][angle_key]["Df"]
-
-            # Handle None or formula-based Df values
-            if df_value is None:
-                if cross_section == "square" and angle_key == "45":  # Dynamic calculation for square at 45°
-                    epsilon = self.solidity_ratio()
-                    df_value = min(1 + 0.75 * epsilon, 1.2)  # Calculate dynamically
-                else:
-                    raise ValueError(f"Df is undefined for {cross_section} at {angle_key}°.")
+            # Retrieve Df from Table 2-6 (square at 45° is calculated from ε)
+            df_value = float(direction_factor(self.solidity_ratio(), cross_section, angle_key))
 
             # Calculate EPA
             epa = cf * df_value * total_projected_area
@@ -292,3 +475,143 @@ class Panel:
             "ke": ke_value,
             "effective_projected_area": epa
         }
+
+    @classmethod
+    def evaluate_many(cls, panels, cross_section):
+        """
+        Summarize many panels (e.g. every segment of a tower) in one batched pass.
+
+        Geometry, projected areas, solidity, Cf, Rr and EPA are computed as arrays over
+        all panels with the same rounding steps as summary(), so the results are identical.
+        summary() rounds Python floats with round() and NumPy scalars (the main belt length,
+        which comes from np.arcsin, and everything computed from it) with np.round; each
+        step below uses the same one (round_like_python for the former).
+
+        Args:
+            panels (list): Panel instances.
+            cross_section (str): The cross-section type ("square" or "triangular") for EPA.
+
+        Returns:
+            list: One summary dict per panel, in order.
+        """
+        if not panels:
+            return []
+        cross_section = cross_section.lower().strip()
+        if cross_section not in VALID_CROSS_SECTIONS:
+            raise ValueError(
+                f"Invalid cross-section type '{cross_section}'. Must be one of {list(VALID_CROSS_SECTIONS)}."
+            )
+
+        def segment_column(key):
+            return np.array([panel.segment[key] for panel in panels], dtype=np.float64)
+
+        members = ("leg", "diagonal", "main_belt")
+        lengths = member_lengths(segment_column("base_width"), segment_column("rwidth"), segment_column("height"))
+        widths = {m: np.array([getattr(panel, f"{m}_width") for panel in panels]) for m in members}
+        areas = {
+            "leg": round_like_python(lengths["leg_length"] * widths["leg"], 4),
+            "diagonal": round_like_python(lengths["diagonal_length"] * widths["diagonal"], 4),
+            "main_belt": np.round(lengths["main_belt_length"] * widths["main_belt"], 4),
+        }
+
+        # Projected areas by bar type, summed in the same order as projected_area()
+        round_projected_area = np.zeros(len(panels))
+        angle_projected_area = np.zeros(len(panels))
+        bar_types = {m: np.array([getattr(panel, f"{m}_type") for panel in panels]) for m in members}
+        for m in members:
+            round_projected_area = round_projected_area + np.where(bar_types[m] == "Round Bar", 2 * areas[m], 0)
+            angle_projected_area = angle_projected_area + np.where(bar_types[m] == "Angle Bar", 2 * areas[m], 0)
+        # The sum holding the main belt area is a NumPy scalar in projected_area(), the other one is not
+        main_belt_round = bar_types["main_belt"] == "Round Bar"
+        round_projected_area = np.where(main_belt_round, np.round(round_projected_area, 4), round_like_python(round_projected_area, 4))
+        angle_projected_area = np.where(main_belt_round, round_like_python(angle_projected_area, 4), np.round(angle_projected_area, 4))
+
+        gross_area = np.array([panel.segment.get("area", 0) for panel in panels], dtype=np.float64)
+        if (gross_area <= 0).any():
+            bad = panels[int(np.argmax(gross_area <= 0))].segment
+            raise ValueError(f"Invalid or missing gross area in segment data for segment: {bad}")
+        solidity_ratio = np.round((round_projected_area + angle_projected_area) / gross_area, 4)
+
+        # Cf follows each panel's own cross-section, like cf()
+        panel_sections = np.array([panel.cross_section.lower() for panel in panels])
+        cf = np.empty(len(panels))
+        for section_type in set(panel_sections.tolist()):
+            selected = panel_sections == section_type
+            cf[selected] = force_coefficient(solidity_ratio[selected], section_type)
+        cf = np.round(cf, 4)
+        rr = round_like_python(round_reduction_factor(solidity_ratio), 4)
+        total_projected_area = angle_projected_area + (round_projected_area * rr)
+        epa = {
+            angle_key: np.round(cf * direction_factor(solidity_ratio, cross_section, angle_key) * total_projected_area, 4).tolist()
+            for angle_key in table_2_6[cross_section]
+        }
+
+        # Kz, Kzt and Ke from one height profile per distinct set of site parameters
+        kz, kzt, ke = np.empty(len(panels)), np.empty(len(panels)), np.empty(len(panels))
+        sites = {}
+        for i, panel in enumerate(panels):
+            factors = panel.k_factors
+            site = (factors.exposure_category, factors.topographic_category, factors.crest_height, factors.ground_elevation)
+            sites.setdefault(site, (factors, []))[1].append(i)
+        for factors, indices in sites.values():
+            profile = factors.profile([panels[i].z_height for i in indices])
+            kz[indices], kzt[indices], ke[indices] = profile["kz"], profile["kzt"], profile["ke"]
+
+        summaries = []
+        for i, panel in enumerate(panels):
+            geometry = {
+                m: {
+                    f"{m}_length": float(lengths[f"{m}_length"][i]),
+                    f"{m}_width": round(float(widths[m][i]), 4),
+                    f"{m}_area": float(areas[m][i]),
+                }
+                for m in members
+            }
+            summaries.append({
+                "panel_type": panel.panel_type,
+                "leg_geometry": geometry["leg"],
+                "diagonal_geometry": geometry["diagonal"],
+                "main_belt_geometry": geometry["main_belt"],
+                "projected_area": {
+                    "round_projected_area": float(round_projected_area[i]),
+                    "angle_projected_area": float(angle_projected_area[i]),
+                },
+                "solidity_ratio": float(solidity_ratio[i]),
+                "cf": float(cf[i]),
+                "kz": float(kz[i]),
+                "kzt": float(kzt[i]),
+                "ke": float(ke[i]),
+                "effective_projected_area": {f'epa_{angle_key}°': values[i] for angle_key, values in epa.items()},
+            })
+        return summaries
+
+
+if __name__ == "__main__":
+    # Local check: evaluate_many against summary() on random towers with random bar choices
+    import random
+    from loadEngine.geometry import Geometry
+
+    rng = random.Random(0)
+    towers, panel_count, mismatches = 300, 0, 0
+    for _ in range(towers):
+        cross_section = rng.choice(VALID_CROSS_SECTIONS)
+        tower_data = Geometry(
+            rng.uniform(3, 7), rng.choice([1, 1.5, 2]), rng.choice(range(18, 73, 6)),
+            rng.randint(1, 10), rng.randint(1, 2), cross_section,
+        ).initiate_tower_data()
+        panels = []
+        for segment in tower_data["segment_list"]:
+            bars = {}
+            for member in ("leg", "diagonal", "main_belt"):
+                bar_type = rng.choice(["Angle Bar", "Round Bar"])
+                bars[f"{member}_type"] = bar_type
+                bars[f"{member}_bar"] = rng.choice(list(ANGLE_BARS_SI if bar_type == "Angle Bar" else ROUND_BARS_SI))
+            panels.append(Panel(
+                tower_data=tower_data, panel_type=1, segment=segment, cross_section=cross_section,
+                measurement_system="SI (Metric)", exposure_category=tower_data["exposure_category"],
+                z_height=segment["z_height"], ground_elevation=0.0, **bars,
+            ))
+        batched = Panel.evaluate_many(panels, cross_section)
+        panel_count += len(panels)
+        mismatches += sum(panel.summary(cross_section) != summary for panel, summary in zip(panels, batched))
+    print(f"{'✅' if not mismatches else '❌'} {mismatches} of {panel_count} panels differ from summary() over {towers} towers")
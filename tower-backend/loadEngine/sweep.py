@@ -0,0 +1,234 @@
+import argparse
+import csv
+import json
+import sys
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+from section import ELEMENT_GROUP_COLUMNS, MEMBER_GROUPS, coordinateKernel, faceAreas, joinSections, memberLengths
+from section_catalog import DEFAULT_ELEMENT_PROPERTIES, DEFAULT_INDEX, compileCatalog, sectionTypeFor
+from loadEngine.panel import effective_projected_areas
+
+SWEEP_PARAMETERS = ("tower_base_width", "top_width", "height", "variable_segments", "constant_segments")
+
+
+def design_grid(tower_base_width, top_width, height, variable_segments, constant_segments):
+    """
+    Build the cartesian product of the parameter values.
+
+    Designs whose base is not wider than the top, or that have no segments, are dropped.
+
+    Returns:
+        dict: One array per SWEEP_PARAMETERS entry, all of length D.
+    """
+    values = [np.atleast_1d(np.asarray(v)) for v in (tower_base_width, top_width, height, variable_segments, constant_segments)]
+    grid = {name: axis.ravel() for name, axis in zip(SWEEP_PARAMETERS, np.meshgrid(*values, indexing="ij"))}
+    for name in ("variable_segments", "constant_segments"):
+        grid[name] = grid[name].astype(np.int64)
+
+    valid = (grid["tower_base_width"] > grid["top_width"]) & (grid["variable_segments"] + grid["constant_segments"] > 0)
+    return {name: column[valid] for name, column in grid.items()}
+
+
+def member_properties(member_sections=None, section_library=None):
+    """
+    Projected width and round flag of each section member from a {group: section name} assignment.
+
+    Args:
+        member_sections (dict): Section name per member group (M, D, C, T, S); missing groups use the defaults.
+        section_library (dict | SectionCatalog): Library the names are looked up in.
+
+    Returns:
+        tuple: (widths, is_round) arrays with one entry per member of a section.
+    """
+    member_sections = member_sections or {}
+    catalog = compileCatalog(section_library)
+    widths = np.empty(len(MEMBER_GROUPS))
+    is_round = np.empty(len(MEMBER_GROUPS), dtype=bool)
+    for column, group in enumerate(MEMBER_GROUPS):
+        name = member_sections.get(group)
+        row = catalog.index(sectionTypeFor(name), name) if name else DEFAULT_INDEX
+        widths[column] = catalog.projectedWidth[row]
+        section_type = sectionTypeFor(name) if name else DEFAULT_ELEMENT_PROPERTIES["secction_type"]
+        is_round[column] = section_type == "round"
+    return widths[ELEMENT_GROUP_COLUMNS], is_round[ELEMENT_GROUP_COLUMNS]
+
+
+def evaluate_designs(tower_base_width, top_width, height, variable_segments, constant_segments, widths, is_round, cross_section):
+    """
+    Evaluate D designs that share the same segment counts in one batched pass.
+
+    Args:
+        tower_base_width, top_width, height (np.ndarray): Per-design dimensions, shape (D,).
+        variable_segments, constant_segments (int): Segment counts shared by all D designs.
+        widths (np.ndarray): Projected width of each section member.
+        is_round (np.ndarray): Whether each section member is a round bar.
+        cross_section (str): "square" or "triangular", used for Cf and the direction factors.
+
+    Returns:
+        dict: total_member_length and total_projected_area of shape (D,), plus
+        solidity_ratio and epa ({angle_key: array}) of shape (D, n_sections).
+    """
+    # Legs joined across sections, the same geometry Section measures its members on
+    coordinates = joinSections(
+        coordinateKernel(tower_base_width, top_width, height, int(variable_segments), int(constant_segments))
+    )
+    lengths = memberLengths(coordinates)
+    projected_area = lengths * widths
+    faces = faceAreas(coordinates, projected_area, is_round)
+    aero = effective_projected_areas(
+        faces["angle_projected_area"], faces["round_projected_area"], faces["gross_area"], cross_section
+    )
+    return {
+        "total_member_length": lengths.sum(axis=(-2, -1)),
+        "total_projected_area": projected_area.sum(axis=(-2, -1)),
+        "solidity_ratio": aero["solidity_ratio"],
+        "epa": aero["epa"],
+    }
+
+
+def _evaluate_group(task):
+    indices, columns, widths, is_round, cross_section = task
+    return indices, evaluate_designs(*columns, widths, is_round, cross_section)
+
+
+def sweep(tower_base_width, top_width, height, variable_segments, constant_segments,
+          cross_section="triangular", member_sections=None, section_library=None, processes=None):
+    """
+    Evaluate every design of a parameter grid.
+
+    Designs are grouped by (variable_segments, constant_segments); each group is
+    computed as one batch along the design axis. With processes > 1 the groups,
+    which have different segment counts, are spread over a multiprocessing pool.
+
+    Returns:
+        dict: The design parameters, total_member_length, total_projected_area,
+        segment_count, and solidity_ratio / epa ({angle_key: array}) of shape
+        (D, max_segments) padded with NaN past each design's last segment.
+    """
+    grid = design_grid(tower_base_width, top_width, height, variable_segments, constant_segments)
+    widths, is_round = member_properties(member_sections, section_library)
+    counts = np.stack([grid["variable_segments"], grid["constant_segments"]], axis=1)
+
+    tasks = []
+    for variable, constant in np.unique(counts, axis=0):
+        indices = np.flatnonzero((counts[:, 0] == variable) & (counts[:, 1] == constant))
+        columns = (
+            grid["tower_base_width"][indices], grid["top_width"][indices], grid["height"][indices],
+            int(variable), int(constant),
+        )
+        tasks.append((indices, columns, widths, is_round, cross_section))
+
+    if processes and processes > 1 and len(tasks) > 1:
+        with Pool(processes) as pool:
+            results = pool.map(_evaluate_group, tasks)
+    else:
+        results = [_evaluate_group(task) for task in tasks]
+
+    design_count = len(grid["height"])
+    segment_count = counts.sum(axis=1)
+    max_segments = int(segment_count.max()) if design_count else 0
+    table = dict(grid)
+    table["segment_count"] = segment_count
+    table["total_member_length"] = np.empty(design_count)
+    table["total_projected_area"] = np.empty(design_count)
+    table["solidity_ratio"] = np.full((design_count, max_segments), np.nan)
+    table["epa"] = {}
+    for indices, metrics in results:
+        segments = metrics["solidity_ratio"].shape[-1]
+        table["total_member_length"][indices] = metrics["total_member_length"]
+        table["total_projected_area"][indices] = metrics["total_projected_area"]
+        table["solidity_ratio"][indices, :segments] = metrics["solidity_ratio"]
+        for angle_key, epa in metrics["epa"].items():
+            table["epa"].setdefault(angle_key, np.full((design_count, max_segments), np.nan))
+            table["epa"][angle_key][indices, :segments] = epa
+    return table
+
+
+def _parse_range(text, cast=float):
+    """
+    Parse "start:stop:step" (stop inclusive) or a comma separated list of values.
+    """
+    if ":" in text:
+        start, stop, step = (cast(part) for part in text.split(":"))
+        return np.arange(start, stop + step / 2, step).astype(type(start))
+    return np.array([cast(part) for part in text.split(",")])
+
+
+def _write_csv(table, stream):
+    writer = csv.writer(stream)
+    angle_keys = list(table["epa"])
+    writer.writerow(list(SWEEP_PARAMETERS) + [
+        "total_member_length", "total_projected_area", "max_solidity_ratio",
+    ] + [f"max_epa_{angle_key}" for angle_key in angle_keys])
+    max_solidity = np.nanmax(table["solidity_ratio"], axis=1)
+    max_epa = [np.nanmax(table["epa"][angle_key], axis=1) for angle_key in angle_keys]
+    for d in range(len(table["height"])):
+        writer.writerow(
+            [table[name][d] for name in SWEEP_PARAMETERS]
+            + [round(table["total_member_length"][d], 4), round(table["total_projected_area"][d], 4), round(max_solidity[d], 4)]
+            + [round(epa[d], 4) for epa in max_epa]
+        )
+
+
+def _to_json(table):
+    def segments(values, count):
+        return [np.round(row[:n], 4).tolist() for row, n in zip(values, count)]
+
+    count = table["segment_count"]
+    return {
+        **{name: table[name].tolist() for name in SWEEP_PARAMETERS},
+        "total_member_length": np.round(table["total_member_length"], 4).tolist(),
+        "total_projected_area": np.round(table["total_projected_area"], 4).tolist(),
+        "solidity_ratio": segments(table["solidity_ratio"], count),
+        "epa": {angle_key: segments(epa, count) for angle_key, epa in table["epa"].items()},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep tower layouts and report per-design member and wind metrics.")
+    parser.add_argument("--base-width", required=True, help="start:stop:step or comma list, meters")
+    parser.add_argument("--top-width", required=True, help="start:stop:step or comma list, meters")
+    parser.add_argument("--height", required=True, help="start:stop:step or comma list, meters")
+    parser.add_argument("--variable-segments", required=True, help="start:stop:step or comma list")
+    parser.add_argument("--constant-segments", required=True, help="start:stop:step or comma list")
+    parser.add_argument("--cross-section", default="triangular", choices=["square", "triangular"])
+    parser.add_argument("--sections", help='JSON {group: section name}, e.g. \'{"M": "RD50", "D": "L50x50x3"}\'')
+    parser.add_argument("--library", help="Path to a section_library.json")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--format", choices=["csv", "json"], default="csv")
+    parser.add_argument("--out", help="Output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    library = None
+    if args.library:
+        with open(args.library) as f:
+            library = json.load(f)
+
+    start = time.perf_counter()
+    table = sweep(
+        _parse_range(args.base_width), _parse_range(args.top_width), _parse_range(args.height),
+        _parse_range(args.variable_segments, int), _parse_range(args.constant_segments, int),
+        cross_section=args.cross_section,
+        member_sections=json.loads(args.sections) if args.sections else None,
+        section_library=library,
+        processes=args.processes,
+    )
+    elapsed = time.perf_counter() - start
+
+    stream = open(args.out, "w", newline="") if args.out else sys.stdout
+    try:
+        if args.format == "json":
+            json.dump(_to_json(table), stream)
+        else:
+            _write_csv(table, stream)
+    finally:
+        if args.out:
+            stream.close()
+    print(f"✅ Evaluated {len(table['height'])} designs in {elapsed:.3f} s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -93,3 +93,18 @@ table_2_6 = {
         "For Square at 45°, Df and Dr are calculated as '1 + 0.75 * ε', with a maximum value of 1.2."
     ]
 }
+
+table_gust_exposure = {
+    "c": {"Exposure B": 0.30, "Exposure C": 0.20, "Exposure D": 0.15},  # Turbulence intensity factor
+    "l": {"Exposure B": 97.54, "Exposure C": 152.4, "Exposure D": 198.12},  # Integral length scale factor, in meters
+    "epsilon_bar": {"Exposure B": 1 / 3.0, "Exposure C": 1 / 5.0, "Exposure D": 1 / 8.0},
+    "alpha_bar": {"Exposure B": 1 / 4.0, "Exposure C": 1 / 6.5, "Exposure D": 1 / 9.0},
+    "b_bar": {"Exposure B": 0.45, "Exposure C": 0.65, "Exposure D": 0.80},
+    "zmin": {"Exposure B": 9.14, "Exposure C": 4.57, "Exposure D": 2.13},  # in meters
+    "Notes": [
+        "Terrain exposure constants for the gust effect factor of flexible structures (ASCE 7 Table 26.11-1, SI).",
+        "c, l, epsilon_bar: Turbulence intensity and integral length scale of turbulence at the equivalent height.",
+        "alpha_bar, b_bar: Mean hourly wind speed profile at the equivalent height.",
+        "zmin: Minimum equivalent height z_bar."
+    ]
+}
@@ -1,5 +1,49 @@
 import numpy as np
 
+
+def round_like_python(values, ndigits):
+    """
+    Builtin round() applied to every element of an array.
+
+    np.round scales by 10**ndigits before rounding, so values near a half (e.g. 0.13125)
+    can land on the other side of it; round() rounds the exact binary value instead.
+    Only the elements whose scaled value sits within rounding error of a half can
+    differ, so those few go through round() and the rest keep the np.round result.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    rounded = np.empty_like(values)
+    np.round(values, ndigits, out=rounded)
+    scaled = values * 10.0 ** ndigits
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) <= 1e-9 * np.maximum(1.0, np.abs(scaled))
+    if near_half.any():
+        rounded[near_half] = [round(value, ndigits) for value in values[near_half].tolist()]
+    return rounded
+
+
+def member_lengths(base_width, rwidth, height):
+    """
+    Leg, diagonal and main belt lengths for arrays of segments, matching Toolkit.
+
+    Args:
+        base_width, rwidth, height (np.ndarray): Segment geometry, one entry per segment.
+
+    Returns:
+        dict: leg_length and diagonal_length (rounded to 4 decimals like Toolkit)
+        and the unrounded main_belt_length.
+    """
+    base_width, rwidth, height = (np.asarray(v, dtype=np.float64) for v in (base_width, rwidth, height))
+    leg_length = round_like_python((rwidth**2 + height**2)**0.5, 4)
+    diagonal_length = round_like_python(((base_width - rwidth)**2 + height**2)**0.5, 4)
+    angle = np.arcsin(height / diagonal_length)
+    hc = np.tan(angle) * (base_width * 0.5)
+    rc = rwidth * hc / height
+    return {
+        "leg_length": leg_length,
+        "diagonal_length": diagonal_length,
+        "main_belt_length": base_width * 0.5 - rc,
+    }
+
+
 class Toolkit:
     def __init__(self, segment):
         """
@@ -0,0 +1,320 @@
+import numpy as np
+
+from loadEngine.k_factors import factor_profile
+from loadEngine.panel import direction_factor_sweep, effective_projected_areas
+from section import ELEMENT_GROUP_COLUMNS, MEMBER_GROUPS, groupFaceLengths
+
+# Limit states and the tower_data keys holding their basic wind speeds (m/s)
+WIND_SPEED_KEYS = {
+    "ultimate": "basic_wind_speed_ultimate",
+    "service": "basic_wind_speed_service",
+}
+
+# Site parameters used when tower_data does not carry them (same values as Geometry.initiate_tower_data)
+DEFAULT_SITE = {
+    "importance_factor": 1.0,
+    "exposure_category": "Exposure C",
+    "basic_wind_speed_service": 33.33,
+    "basic_wind_speed_ultimate": 44.44,
+    "crest_height": 0.0,
+    "ground_elevation": 0.0,
+    "kd": 0.85,
+}
+
+
+def gust_effect_factor(height):
+    """
+    Gust effect factor Gh of a latticed structure, 0.85 + 0.15 * (h / 45.7 - 3) bounded to [0.85, 1.0].
+    """
+    return float(np.clip(0.85 + 0.15 * ((height / 45.7) - 3.0), 0.85, 1.0))
+
+
+def velocity_pressure(kz, kzt, ke, kd, wind_speed, importance_factor=1.0):
+    """
+    Velocity pressure qz = 0.613 * Kz * Kzt * Ke * Kd * V² * I in N/m².
+
+    Every argument may be a float or an array; the result broadcasts them together.
+    """
+    return 0.613 * kz * kzt * ke * kd * np.square(wind_speed) * importance_factor
+
+
+def cumulative_resultants(forces, z_height, bottom_level):
+    """
+    Shear and overturning moment at the bottom of every segment from the segment forces above it.
+
+    Args:
+        forces (np.ndarray): Segment forces (..., n_segments) in N, ordered from the base up.
+        z_height (np.ndarray): Height of each force's point of application in m, shape (n_segments,).
+        bottom_level (np.ndarray): Height of the bottom of each segment in m, shape (n_segments,).
+
+    Returns:
+        tuple: (shear, moment) arrays shaped like forces, in N and N·m.
+    """
+    # Suffix sums: V_i = sum_{j>=i} F_j and M_i = sum_{j>=i} F_j * (z_j - bottom_i)
+    shear = np.flip(np.cumsum(np.flip(forces, axis=-1), axis=-1), axis=-1)
+    first_moment = np.flip(np.cumsum(np.flip(forces * z_height, axis=-1), axis=-1), axis=-1)
+    return shear, first_moment - shear * bottom_level
+
+
+class WindLoads:
+    """
+    Design wind forces on every segment of a tower for every wind direction and limit state.
+
+    All inputs are held as arrays so qz, F = qz * Gh * EPA and the cumulative shear and
+    overturning moment are computed for all segments, directions and limit states at once.
+
+    Attributes:
+        z_height (np.ndarray): Mid height of each segment in m, from the base up.
+        bottom_level (np.ndarray): Bottom height of each segment in m.
+        angle_keys (list): Wind directions, as the keys of Table 2-6.
+        epa (np.ndarray): Effective projected area in m², shape (n_directions, n_segments).
+        site (dict): Site parameters, see DEFAULT_SITE.
+        gh (float): Gust effect factor.
+        aero (dict): Solidity, Cf and Rr per segment (effective_projected_areas); needed by direction_sweep.
+        cross_section (str): "square" or "triangular"; needed by direction_sweep.
+    """
+
+    def __init__(self, z_height, bottom_level, epa, site=None, gh=None, aero=None, cross_section=None):
+        self.z_height = np.asarray(z_height, dtype=np.float64)
+        self.bottom_level = np.asarray(bottom_level, dtype=np.float64)
+        self.angle_keys = list(epa)
+        self.epa = np.array([np.asarray(epa[angle_key], dtype=np.float64) for angle_key in self.angle_keys])
+        self.site = {**DEFAULT_SITE, **{key: value for key, value in (site or {}).items() if value is not None}}
+        top = float(self.bottom_level[-1] + 2 * (self.z_height[-1] - self.bottom_level[-1])) if len(self.z_height) else 0.0
+        self.aero = aero
+        self.cross_section = cross_section
+        self.gh = gh if gh is not None else self.site.get("gust_effect_factor") or gust_effect_factor(top)
+
+        if self.epa.shape[-1] != len(self.z_height):
+            raise ValueError(f"EPA has {self.epa.shape[-1]} segments but {len(self.z_height)} heights were given.")
+
+    @classmethod
+    def from_section(cls, section, site=None, gh=None, sensitivities=False):
+        """
+        Build the wind loads of a Section from its windward-face areas.
+
+        Args:
+            section (Section): Tower geometry with its element section assignments.
+            site (dict): Site parameters (tower_data keys), missing ones fall back to DEFAULT_SITE.
+            gh (float): Gust effect factor, computed from the tower height when not given.
+            sensitivities (bool): Also differentiate every segment's EPA with respect to the
+                projected width of each of its member groups, for width_sensitivities().
+        """
+        coordinates = section.getCoordinateArray()
+        bottom_level = coordinates[:, 0, 1]
+        top_level = coordinates[:, 2, 1]
+        faces = section.getFaceAreas()
+        cross_section = section.towerData["cross_section"]
+        aero = effective_projected_areas(
+            faces["angle_projected_area"], faces["round_projected_area"], faces["gross_area"], cross_section,
+            gradients=sensitivities,
+        )
+        aero["total_projected_area"] = faces["angle_projected_area"] + faces["round_projected_area"] * aero["rr"]
+        if sensitivities:
+            # A group's face area is face length × width and counts as round or angle area by its type
+            arrays = section.getElementArrays()
+            face_length = groupFaceLengths(arrays["length"])
+            group_round = np.zeros(face_length.shape, dtype=bool)
+            group_round[:, ELEMENT_GROUP_COLUMNS] = arrays["secction_type"] == "round"
+            aero["epa_width_gradient"] = np.array([
+                np.where(group_round, aero["d_epa_d_round"][angle_key][:, None], aero["d_epa_d_angle"][angle_key][:, None])
+                * face_length
+                for angle_key in aero["epa"]
+            ])
+        return cls((bottom_level + top_level) / 2, bottom_level, aero["epa"], site, gh, aero, cross_section)
+
+    def site_factors(self):
+        """
+        Kz, Kzt and Ke at every segment height. Towers on flat ground (crest_height 0) use Kzt = 1.
+        """
+        crest_height = self.site["crest_height"]
+        topographic_category = self.site.get("topographic_category") or ("2" if crest_height > 0 else "1")
+        return factor_profile(
+            self.z_height,
+            exposure_category=self.site["exposure_category"],
+            topographic_category=topographic_category,
+            crest_height=crest_height,
+            ground_elevation=self.site["ground_elevation"],
+            decimals=None,
+        )
+
+    def compute(self):
+        """
+        Velocity pressure, segment forces and cumulative resultants.
+
+        Returns:
+            dict: "limit_states" and "angle_keys" labels, "kz"/"kzt"/"ke" of shape (n_segments,),
+            "qz" (N/m²) of shape (n_limit_states, n_segments), and "force" (N), "shear" (N) and
+            "moment" (N·m) of shape (n_limit_states, n_directions, n_segments).
+        """
+        factors = self.site_factors()
+        limit_states = list(WIND_SPEED_KEYS)
+        wind_speeds = np.array([self.site[WIND_SPEED_KEYS[state]] for state in limit_states], dtype=np.float64)
+
+        qz = velocity_pressure(
+            factors["kz"], factors["kzt"], factors["ke"], self.site["kd"], wind_speeds[:, None], self.site["importance_factor"]
+        )
+        force = qz[:, None, :] * self.gh * self.epa[None, :, :]
+        shear, moment = cumulative_resultants(force, self.z_height, self.bottom_level)
+        return {
+            "limit_states": limit_states,
+            "angle_keys": self.angle_keys,
+            "kz": factors["kz"],
+            "kzt": factors["kzt"],
+            "ke": factors["ke"],
+            "qz": qz,
+            "force": force,
+            "shear": shear,
+            "moment": moment,
+        }
+
+    def width_sensitivities(self, result=None):
+        """
+        Exact derivatives of segment EPA and base resultants with respect to member group widths.
+
+        Only a segment's own groups change its EPA, and F = qz * Gh * EPA is linear in EPA,
+        so dV_base/dw = qz * Gh * dEPA/dw and dM_base/dw adds the lever arm of the segment.
+
+        Args:
+            result (dict): Output of compute() to reuse; computed when not given.
+
+        Returns:
+            dict: "limit_states", "angle_keys" and "groups" labels, "epa" of shape
+            (n_directions, n_segments, n_groups) in m²/m, and "base_shear" (N/m) and
+            "base_moment" (N·m/m) of shape (n_limit_states, n_directions, n_segments, n_groups).
+        """
+        if self.aero is None or "epa_width_gradient" not in self.aero:
+            raise ValueError("Width sensitivities need WindLoads.from_section(..., sensitivities=True).")
+        result = result or self.compute()
+        gradient = self.aero["epa_width_gradient"]
+        base_shear = (result["qz"] * self.gh)[:, None, :, None] * gradient[None, :, :, :]
+        lever_arm = self.z_height - (self.bottom_level[0] if len(self.bottom_level) else 0.0)
+        return {
+            "limit_states": result["limit_states"],
+            "angle_keys": self.angle_keys,
+            "groups": list(MEMBER_GROUPS),
+            "epa": gradient,
+            "base_shear": base_shear,
+            "base_moment": base_shear * lever_arm[None, None, :, None],
+        }
+
+    def sensitivity_summary(self, limit_state="ultimate"):
+        """
+        JSON-ready width sensitivities of one limit state, per direction as (n_segments, n_groups) lists.
+        """
+        if limit_state not in WIND_SPEED_KEYS:
+            raise ValueError(f"Invalid limit state '{limit_state}'. Must be one of {list(WIND_SPEED_KEYS)}.")
+        sensitivities = self.width_sensitivities()
+        s = sensitivities["limit_states"].index(limit_state)
+        return {
+            "limit_state": limit_state,
+            "groups": sensitivities["groups"],
+            "directions": {
+                angle_key: {
+                    "epa": np.round(sensitivities["epa"][a], 4).tolist(),
+                    "base_shear": np.round(sensitivities["base_shear"][s, a], 2).tolist(),
+                    "base_moment": np.round(sensitivities["base_moment"][s, a], 2).tolist(),
+                }
+                for a, angle_key in enumerate(sensitivities["angle_keys"])
+            },
+        }
+
+    def direction_sweep(self, step=1.0, limit_state="ultimate"):
+        """
+        EPA and segment forces for wind angles 0-360° every `step` degrees.
+
+        Direction factors are interpolated between the Table 2-6 directions (see
+        direction_factor_sweep), then the angle × segment matrices are computed at once.
+
+        Returns:
+            dict: "angles" (n_angles,), "epa", "force", "shear", "moment" of shape
+            (n_angles, n_segments), and the governing direction per segment (largest
+            force) and for the tower (largest base overturning moment).
+        """
+        if self.aero is None or self.cross_section is None:
+            raise ValueError("A direction sweep needs the solidity and Cf of every segment; build the loads with from_section().")
+        if step <= 0:
+            raise ValueError(f"Invalid direction step: {step}. Must be a positive number of degrees.")
+        if limit_state not in WIND_SPEED_KEYS:
+            raise ValueError(f"Invalid limit state '{limit_state}'. Must be one of {list(WIND_SPEED_KEYS)}.")
+
+        angles = np.arange(0.0, 360.0, step)
+        df = direction_factor_sweep(self.aero["solidity_ratio"], self.cross_section, angles)
+        epa = self.aero["cf"] * df * self.aero["total_projected_area"]
+
+        factors = self.site_factors()
+        qz = velocity_pressure(
+            factors["kz"], factors["kzt"], factors["ke"], self.site["kd"],
+            self.site[WIND_SPEED_KEYS[limit_state]], self.site["importance_factor"]
+        )
+        force = qz * self.gh * epa
+        shear, moment = cumulative_resultants(force, self.z_height, self.bottom_level)
+
+        governing_segment = np.argmax(force, axis=0)
+        governing_tower = int(np.argmax(moment[:, 0])) if len(self.z_height) else 0
+        return {
+            "limit_state": limit_state,
+            "angles": angles,
+            "epa": epa,
+            "force": force,
+            "shear": shear,
+            "moment": moment,
+            "segment_governing_angle": angles[governing_segment],
+            "segment_governing_force": force[governing_segment, np.arange(force.shape[1])],
+            "tower_governing_angle": float(angles[governing_tower]),
+            "tower_base_shear": float(shear[governing_tower, 0]) if len(self.z_height) else 0.0,
+            "tower_base_moment": float(moment[governing_tower, 0]) if len(self.z_height) else 0.0,
+        }
+
+    def direction_summary(self, step=1.0, limit_state="ultimate"):
+        """
+        JSON-ready governing directions of a direction sweep, plus the base resultants at every angle.
+        """
+        sweep = self.direction_sweep(step, limit_state)
+        has_segments = len(self.z_height) > 0
+        return {
+            "limit_state": limit_state,
+            "step": step,
+            "angles": sweep["angles"].tolist(),
+            "base_shear": np.round(sweep["shear"][:, 0], 2).tolist() if has_segments else [],
+            "base_moment": np.round(sweep["moment"][:, 0], 2).tolist() if has_segments else [],
+            "segments": {
+                "governing_angle": sweep["segment_governing_angle"].tolist(),
+                "governing_force": np.round(sweep["segment_governing_force"], 2).tolist(),
+            },
+            "tower": {
+                "governing_angle": sweep["tower_governing_angle"],
+                "base_shear": round(sweep["tower_base_shear"], 2),
+                "base_moment": round(sweep["tower_base_moment"], 2),
+            },
+        }
+
+    def summary(self):
+        """
+        JSON-ready loads: per limit state and direction, the segment values and the base resultants.
+        """
+        result = self.compute()
+        summary = {
+            "gust_effect_factor": round(self.gh, 4),
+            "z_height": np.round(self.z_height, 4).tolist(),
+            "kz": np.round(result["kz"], 4).tolist(),
+            "kzt": np.round(result["kzt"], 4).tolist(),
+            "ke": np.round(result["ke"], 4).tolist(),
+        }
+        for s, state in enumerate(result["limit_states"]):
+            directions = {}
+            for a, angle_key in enumerate(result["angle_keys"]):
+                directions[angle_key] = {
+                    "epa": np.round(self.epa[a], 4).tolist(),
+                    "force": np.round(result["force"][s, a], 2).tolist(),
+                    "shear": np.round(result["shear"][s, a], 2).tolist(),
+                    "moment": np.round(result["moment"][s, a], 2).tolist(),
+                    "base_shear": round(float(result["shear"][s, a, 0]), 2) if len(self.z_height) else 0.0,
+                    "base_moment": round(float(result["moment"][s, a, 0]), 2) if len(self.z_height) else 0.0,
+                }
+            summary[state] = {
+                "wind_speed": self.site[WIND_SPEED_KEYS[state]],
+                "qz": np.round(result["qz"][s], 2).tolist(),
+                "directions": directions,
+            }
+        return summary
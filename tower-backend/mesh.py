@@ -0,0 +1,119 @@
+import numpy as np
+
+
+# Every combination of a zero or half-cell shift on x, y and z
+_GRID_SHIFTS = np.array([[sx, sy, sz] for sx in (0.0, 0.5) for sy in (0.0, 0.5) for sz in (0.0, 0.5)])
+
+
+def _cellIndex(cells):
+    # Dense id of every (ix, iy, iz) cell, found by a lexicographic sort of the keys
+    order = np.lexsort(cells.T[::-1])
+    ordered = cells[order]
+    isNewCell = np.empty(len(cells), dtype=bool)
+    isNewCell[0] = True
+    isNewCell[1:] = (ordered[1:] != ordered[:-1]).any(axis=1)
+    cellIndex = np.empty(len(cells), dtype=np.int64)
+    cellIndex[order] = np.cumsum(isNewCell) - 1
+    return cellIndex
+
+
+def mergeNodes(points, tolerance=1e-6):
+    """
+    Deduplicate coincident points with a tolerance-aware spatial hash.
+
+    Points are hashed into grid cells of size `tolerance`. The grid is hashed eight
+    times with half-cell shifts so that two points closer than tolerance / 2 on every
+    axis always share a cell in at least one of them; labels are then propagated
+    until every chain of shared cells collapses onto one node.
+
+    Args:
+        points (array-like): Coordinates of shape (n_points, 3).
+        tolerance (float): Size of the hash cells.
+
+    Returns:
+        tuple: (nodes, inverse) where nodes is a (n_nodes, 3) float64 array and
+        inverse is an int32 array mapping every input point to its node.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    if len(points) == 0:
+        return points, np.zeros(0, dtype=np.int32)
+
+    scaled = points / tolerance
+    labels = np.arange(len(points))
+    changed = True
+    while changed:
+        changed = False
+        for shift in _GRID_SHIFTS:
+            cellIndex = _cellIndex(np.floor(scaled + shift).astype(np.int64))
+            cellLabel = np.full(cellIndex.max() + 1, len(points))
+            np.minimum.at(cellLabel, cellIndex, labels)
+            merged = cellLabel[cellIndex]
+            if (merged != labels).any():
+                labels = merged
+                changed = True
+
+    representatives, inverse = np.unique(labels, return_inverse=True)
+    return points[representatives], inverse.reshape(-1).astype(np.int32)
+
+
+class Mesh:
+    """
+    Node table plus integer connectivity for the members of a tower.
+
+    Attributes:
+        nodes (np.ndarray): Unique node coordinates, shape (n_nodes, 3).
+        connectivity (np.ndarray): int32 node indices (i, j) per element, shape (n_elements, 2).
+        elementSection (np.ndarray): int32 section number of every element.
+        elementNames (list): Member name of every element (M1, D3, ...).
+    """
+
+    def __init__(self, nodes, connectivity, elementSection, elementNames):
+        self.nodes = nodes
+        self.connectivity = connectivity
+        self.elementSection = elementSection
+        self.elementNames = elementNames
+
+    @classmethod
+    def fromSections(cls, coordinateArray, topology, nodeNames, tolerance=1e-6):
+        """
+        Build a mesh from a (n_sections, n_nodes, 3) coordinate array.
+
+        Args:
+            coordinateArray (np.ndarray): Per-section node coordinates.
+            topology (tuple): (name, node_i, node_j) for the members of one section.
+            nodeNames (tuple): Node name of every slot of the coordinate array.
+            tolerance (float): Distance under which two nodes are considered the same.
+        """
+        nSections, nodesPerSection = coordinateArray.shape[:2]
+        nodes, inverse = mergeNodes(coordinateArray, tolerance)
+
+        slot = {name: k for k, name in enumerate(nodeNames)}
+        localPairs = np.array([[slot[i], slot[j]] for _, i, j in topology])
+        sectionBase = (np.arange(nSections) * nodesPerSection)[:, None, None]
+        connectivity = inverse[(sectionBase + localPairs).reshape(-1, 2)]
+
+        elementSection = np.repeat(np.arange(1, nSections + 1, dtype=np.int32), len(topology))
+        elementNames = [name for name, _, _ in topology] * nSections
+        return cls(nodes, connectivity, elementSection, elementNames)
+
+    @property
+    def nodeCount(self):
+        return len(self.nodes)
+
+    @property
+    def elementCount(self):
+        return len(self.connectivity)
+
+    def elementVectors(self):
+        return self.nodes[self.connectivity[:, 1]] - self.nodes[self.connectivity[:, 0]]
+
+    def elementLengths(self):
+        return np.linalg.norm(self.elementVectors(), axis=1)
+
+    def toDict(self):
+        return {
+            "nodes": np.round(self.nodes, 3).tolist(),
+            "connectivity": self.connectivity.tolist(),
+            "section": self.elementSection.tolist(),
+            "element": self.elementNames,
+        }
@@ -0,0 +1,270 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+
+# Part of every key; bump it whenever a change to the engines alters their results
+ENGINE_VERSION = "2026.10.1"
+
+# Memory tier budget in bytes of cached response bodies
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Disk tier budget in bytes; the least recently used files are removed beyond it
+DEFAULT_MAX_DISK_BYTES = 1024 * 1024 * 1024
+
+# A disk trim removes files until the tier is back under this fraction of its budget,
+# so the directory is rescanned once per tenth of the budget written, not on every write
+DISK_TRIM_RATIO = 0.9
+
+
+def canonicalJson(value):
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def resultKey(kind, towerData, elementSections=None, libraryVersion=None, engineVersion=ENGINE_VERSION, **options):
+    """
+    SHA-256 content address of one computation.
+
+    Args:
+        kind (str): Which computation ("section", "segments", ...).
+        towerData (dict): Normalized towerData (normalizeTowerDataKeys), so key spellings do not matter.
+        elementSections (dict): Member assignments; section numbers are compared as strings.
+        libraryVersion (str): SectionCatalog.version the result was computed with.
+        engineVersion (str): ENGINE_VERSION by default.
+        **options: Anything else that changes the result, e.g. the response format.
+    """
+    sections = {str(number): groups for number, groups in (elementSections or {}).items()}
+    payload = canonicalJson({
+        "kind": kind,
+        "towerData": towerData,
+        "elementSections": sections,
+        "library": libraryVersion,
+        "engine": engineVersion,
+        "options": options,
+    })
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class _Flight:
+    # One computation in progress; followers wait on the event for its outcome
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class ResultCache:
+    """
+    Content-addressed cache of serialized results: a size-bounded LRU in memory and an optional, also bounded, disk tier.
+
+    Values are bytes (response bodies), so their size is known exactly and hits are served
+    without serializing again. getOrCompute() coalesces concurrent requests for the same key:
+    the first one computes and every other waits for and shares its result.
+
+    Disk files are ordered by modification time, which a disk hit refreshes, and the least
+    recently used ones are removed once the directory grows past maxDiskBytes. The trim
+    rescans the directory, so several processes sharing it stay within the one budget.
+
+    Attributes:
+        maxBytes (int): Memory tier budget; least recently used entries are evicted beyond it.
+        directory (str): Disk tier directory, or None for memory only.
+        maxDiskBytes (int): Disk tier budget.
+    """
+
+    def __init__(self, maxBytes=DEFAULT_MAX_BYTES, directory=None, maxDiskBytes=DEFAULT_MAX_DISK_BYTES):
+        self.maxBytes = maxBytes
+        self.directory = directory
+        self.maxDiskBytes = maxDiskBytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._diskBytes = 0
+        self._lock = threading.Lock()
+        self._diskLock = threading.Lock()
+        self._inflight = {}
+        self._counts = {
+            "memory_hits": 0, "disk_hits": 0, "misses": 0, "coalesced": 0, "evictions": 0, "disk_evictions": 0,
+            "computations": 0,
+        }
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self._trimDisk()
+
+    def _diskPath(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def _readDisk(self, key):
+        path = self._diskPath(key)
+        try:
+            with open(path, "rb") as f:
+                value = f.read()
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)  # most recently used
+        except FileNotFoundError:
+            pass
+        return value
+
+    def _writeDisk(self, key, value):
+        if len(value) > self.maxDiskBytes:
+            return
+        path = self._diskPath(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(value)
+        os.replace(temporary, path)
+        with self._lock:
+            self._diskBytes += len(value)
+            full = self._diskBytes > self.maxDiskBytes
+        if full:
+            self._trimDisk()
+
+    def _scanDisk(self):
+        # (mtime, size, path) of every cached file, least recently used first
+        files = []
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    info = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                files.append((info.st_mtime_ns, info.st_size, path))
+        files.sort()
+        return files
+
+    def _trimDisk(self):
+        """
+        Recount the disk tier and, when it is over maxDiskBytes, remove the least recently
+        used files until it is under DISK_TRIM_RATIO of the budget.
+        """
+        with self._diskLock:
+            files = self._scanDisk()
+            total = sum(size for _, size, _ in files)
+            target = self.maxDiskBytes * DISK_TRIM_RATIO if total > self.maxDiskBytes else total
+            removed = 0
+            for _, size, path in files:
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass  # already trimmed by another process
+                total -= size
+                removed += 1
+            with self._lock:
+                self._diskBytes = total
+                self._counts["disk_evictions"] += removed
+
+    def _remember(self, key, value):
+        # Caller holds the lock
+        if key in self._entries:
+            self._bytes -= len(self._entries.pop(key))
+        if len(value) > self.maxBytes:
+            return
+        self._entries[key] = value
+        self._bytes += len(value)
+        while self._bytes > self.maxBytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self._counts["evictions"] += 1
+
+    def get(self, key):
+        """
+        Cached bytes for a key from memory, then disk (promoted to memory), or None.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self._counts["memory_hits"] += 1
+                return value
+
+        value = self._readDisk(key) if self.directory else None
+        with self._lock:
+            if value is None:
+                self._counts["misses"] += 1
+            else:
+                self._counts["disk_hits"] += 1
+                self._remember(key, value)
+        return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._remember(key, value)
+        if self.directory:
+            self._writeDisk(key, value)
+
+    def getOrCompute(self, key, compute):
+        """
+        Cached bytes for key, or the bytes of compute() run once for all concurrent callers.
+
+        Args:
+            key (str): resultKey() of the computation.
+            compute (callable): Returns the result as bytes; exceptions reach every waiting caller
+                and nothing is cached.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                return value
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+            else:
+                self._counts["coalesced"] += 1
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = compute()
+            with self._lock:
+                self._counts["computations"] += 1
+            self.put(key, flight.value)
+            return flight.value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            flight.event.set()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """
+        Hit, miss, coalescing and eviction counts, the hit rate and the memory tier size.
+        """
+        with self._lock:
+            counts = dict(self._counts)
+            lookups = counts["memory_hits"] + counts["disk_hits"] + counts["misses"]
+            return {
+                **counts,
+                "hit_rate": round((counts["memory_hits"] + counts["disk_hits"]) / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.maxBytes,
+                "disk": self.directory,
+                "disk_bytes": self._diskBytes,
+                "max_disk_bytes": self.maxDiskBytes if self.directory else None,
+                "engine_version": ENGINE_VERSION,
+            }
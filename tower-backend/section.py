@@ -1,16 +1,306 @@
 import numpy as np
+import itertools
 import json
-import math
-from utils import normalizeTowerDataKeys
+from mesh import Mesh
+from loadEngine.toolkit import round_like_python
+from section_catalog import DEFAULT_ELEMENT_PROPERTIES, compileCatalog
+
+
+# Node order of the (n_sections, 12, 3) coordinate array built by coordinateKernel
+NODE_NAMES = ('a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'l', 'm', 'n', 'o')
+
+
+def _sectionOffsets(step, count, start=0.0):
+    # Running offset at the start of each section, accumulated like the original loop
+    # (start + step + step + ...), so every partial sum rounds the same way.
+    # step and start may carry a leading design axis; sections run along the last axis.
+    step = np.asarray(step, dtype=np.float64)[..., None]
+    steps = np.broadcast_to(step, step.shape[:-1] + (count,))
+    start = np.broadcast_to(np.asarray(start, dtype=np.float64)[..., None], step.shape)
+    return np.cumsum(np.concatenate((start, steps), axis=-1), axis=-1)
+
+
+def _builtinRoundedMask(nSections, variableSegments):
+    # Components the original loop held as Python floats, and so rounded with the builtin
+    # round(); everything derived from a numpy scalar went through np.round instead
+    a, b, c, d, g, h, l, m = (NODE_NAMES.index(name) for name in "abcdghlm")
+    mask = np.zeros((nSections, len(NODE_NAMES), 3), dtype=bool)
+    variable, constant = mask[:variableSegments], mask[variableSegments:]
+    variable[:, [a, b, c, d, h, l], 1] = True
+    variable[:1, [a, b, g, h, l, m], 0] = True
+    variable[:1, [a, b], 2] = True
+    constant[..., 1] = True
+    return mask
+
+
+def roundCoordinates(coordinateArray, variableSegments):
+    """
+    Kernel coordinates rounded to 3 decimals exactly like the published per-section values.
+
+    Components the original loop computed from Python floats are rounded like the builtin
+    round(), the rest with np.round; the two disagree on values right next to a half.
+    """
+    rounded = np.round(coordinateArray, 3)
+    builtin = _builtinRoundedMask(coordinateArray.shape[-3], variableSegments)
+    rounded[..., builtin] = round_like_python(coordinateArray[..., builtin], 3)
+    return rounded
+
+
+def _node(x, y, z):
+    return np.stack(np.broadcast_arrays(x, y, z), axis=-1)
+
+
+def coordinateKernel(baseWidth, topWidth, totalHeight, variableSegments, constantSegments):
+    """
+    Build the nodes of every variable and constant section in one vectorized pass.
+
+    baseWidth, topWidth and totalHeight may also be arrays of D designs that share
+    the same segment counts, which adds a leading design axis to the result.
+
+    Returns:
+        np.ndarray: float64 array of shape ([D,] n_sections, 12, 3) ordered as NODE_NAMES.
+    """
+    baseWidth, topWidth, totalHeight = np.broadcast_arrays(
+        *(np.asarray(value, dtype=np.float64) for value in (baseWidth, topWidth, totalHeight))
+    )
+    designShape = baseWidth.shape
+
+    segmentHeight = totalHeight / (variableSegments + constantSegments)
+    taperDelta = (baseWidth - topWidth) / 2
+    zinitial = np.sin(np.deg2rad(60)) * baseWidth
+
+    if variableSegments:
+        alpha = np.arctan(taperDelta / (variableSegments * segmentHeight))
+        alphaZ = np.arctan((np.cos(np.deg2rad(30)) * taperDelta) / (variableSegments * segmentHeight))
+    else:
+        alpha = alphaZ = np.zeros(designShape)
+    segmentDelta = np.tan(alpha) * segmentHeight
+    segmentDeltaZ = np.tan(alphaZ) * segmentHeight
+
+    # Cumulative secction_init_* offsets and base widths at the bottom of each section
+    initX = _sectionOffsets(segmentDelta, variableSegments)
+    initY = _sectionOffsets(segmentHeight, variableSegments)
+    initZ = _sectionOffsets(segmentDeltaZ, variableSegments)
+    currentBase = _sectionOffsets(-2 * segmentDelta, variableSegments, start=baseWidth)
+
+    coords = np.zeros(designShape + (variableSegments + constantSegments, len(NODE_NAMES), 3))
+
+    # Per-design scalars as columns so they broadcast over the section axis
+    segmentHeight, segmentDelta, segmentDeltaZ, zinitial, alpha, alphaZ = (
+        value[..., None] for value in (segmentHeight, segmentDelta, segmentDeltaZ, zinitial, alpha, alphaZ)
+    )
+
+    # Variable (tapered) sections
+    x, y, z = initX[..., :-1], initY[..., :-1], initZ[..., :-1]
+    base = currentBase[..., :-1]
+    phi = np.arctan(segmentHeight / (base - segmentDelta))
+    gHeight = np.tan(phi) * (base / 2)
+    deltaG = gHeight * np.tan(alpha)
+    deltaGZ = gHeight * np.tan(alphaZ)
+    half = base / 2
+
+    var = coords[..., :variableSegments, :, :]
+    var[..., 0, :] = _node(x, y, z)
+    var[..., 1, :] = _node(base + x, y, z)
+    var[..., 2, :] = _node(segmentDelta + x, segmentHeight + y, segmentDelta + z)
+    var[..., 3, :] = _node(base - segmentDelta + x, segmentHeight + y, segmentDelta + z)
+    var[..., 4, :] = _node(deltaG + x, gHeight + y, deltaG + z)
+    var[..., 5, :] = _node(base - deltaG + x, gHeight + y, deltaG + z)
+    var[..., 6, :] = _node(half + x, gHeight + y, deltaG + z)
+    var[..., 7, :] = _node(half + x, y, zinitial - z)
+    var[..., 8, :] = _node(half + x, segmentHeight + y, zinitial - segmentDeltaZ - z)
+    var[..., 9, :] = _node(half + x, gHeight + y, zinitial - deltaGZ - z)
+
+    # Constant (straight) sections continue from where the taper ends
+    x, z, base = initX[..., -1:], initZ[..., -1:], currentBase[..., -1:]
+    y = _sectionOffsets(round_like_python(segmentHeight[..., 0], 3), constantSegments, start=initY[..., -1])[..., :-1]
+    half = base / 2
+    midY = segmentHeight / 2 + y
+    topY = segmentHeight + y
+
+    const = coords[..., variableSegments:, :, :]
+    const[..., 0, :] = _node(x, y, z)
+    const[..., 1, :] = _node(base + x, y, z)
+    const[..., 2, :] = _node(x, topY, z)
+    const[..., 3, :] = _node(base + x, topY, z)
+    const[..., 4, :] = _node(x, midY, z)
+    const[..., 5, :] = _node(base + x, midY, z)
+    const[..., 6, :] = _node(half + x, midY, z)
+    const[..., 7, :] = _node(half + x, y, zinitial - z)
+    const[..., 8, :] = _node(half + x, topY, zinitial - z)
+    const[..., 9, :] = _node(half + x, midY, zinitial - z)
+
+    # n and o sit midway between the third-leg node m and the face nodes e and f,
+    # taken from the published (3 decimal) positions of those nodes
+    published = roundCoordinates(coords, variableSegments)
+    e, f, m = (published[..., k, :] for k in (4, 5, 9))
+    coords[..., 10, :] = (e + m) / 2
+    coords[..., 11, :] = (m + f) / 2
+    return coords
+
+
+def memberLengths(coordinateArray):
+    """
+    Length of every ELEMENT_TOPOLOGY member, shape ([D,] n_sections, n_members).
+    """
+    return np.linalg.norm(coordinateArray[..., ELEMENT_NODE_J, :] - coordinateArray[..., ELEMENT_NODE_I, :], axis=-1)
+
+
+def joinSections(coordinateArray):
+    """
+    Section nodes with each section's top face corners (c, d) moved onto the next section's base corners (a, b).
+
+    The kernel offsets c/d in z from the next section's a/b (segmentDelta against
+    segmentDeltaZ), which keeps the per-section coordinates unchanged but leaves the legs
+    discontinuous. Snapping them makes consecutive sections share their leg nodes.
+    """
+    coordinates = np.array(coordinateArray, dtype=np.float64)
+    a, b, c, d = (NODE_NAMES.index(name) for name in ("a", "b", "c", "d"))
+    coordinates[..., :-1, [c, d], :] = coordinates[..., 1:, [a, b], :]
+    return coordinates
+
+
+def faceAreas(coordinateArray, projectedArea, isRound):
+    """
+    Windward face areas of every section, the inputs of solidity, Cf and EPA.
+
+    Args:
+        coordinateArray (np.ndarray): ([D,] n_sections, 12, 3) nodes.
+        projectedArea (np.ndarray): ([D,] n_sections, n_members) width × length of every member.
+        isRound (np.ndarray): Whether each member is a round bar, broadcastable to projectedArea.
+
+    Returns:
+        dict: round_projected_area, angle_projected_area and gross_area, each ([D,] n_sections).
+    """
+    faceArea = np.where(FACE_ELEMENT_MASK, projectedArea, 0.0)
+    roundArea = np.where(isRound, faceArea, 0.0).sum(axis=-1)
+    a, b, c, d = (coordinateArray[..., k, :] for k in range(4))
+    bottomWidth = b[..., 0] - a[..., 0]
+    topWidth = d[..., 0] - c[..., 0]
+    return {
+        "round_projected_area": roundArea,
+        "angle_projected_area": faceArea.sum(axis=-1) - roundArea,
+        "gross_area": (bottomWidth + topWidth) / 2 * (c[..., 1] - a[..., 1]),
+    }
+
+
+# Fixed-width dtype of the secction_type column, wide enough for every library type
+SECTION_TYPE_DTYPE = "<U16"
+
+# Sections converted from arrays to dicts at a time when streaming
+STREAM_BLOCK_SECTIONS = 256
+
+
+def iterJsonObject(fields, indent=None):
+    """
+    Incrementally encode {key: [item, ...], ...} where every value is an iterable.
+
+    The chunks join into exactly what json.dumps would produce for the same
+    document with lists, while only one item is ever encoded at a time.
+
+    Args:
+        fields (list): (key, iterable of items) pairs in output order.
+        indent (int): Same meaning as for json.dumps.
+    """
+    if indent is None:
+        newline, pad, fieldSep, itemSep = "", "", ", ", ", "
+    else:
+        newline, pad, fieldSep, itemSep = "\n", " " * indent, ",", ","
+
+    yield "{"
+    for f, (key, items) in enumerate(fields):
+        yield (fieldSep if f else "") + newline + pad + json.dumps(key) + ": ["
+        empty = True
+        for item in items:
+            encoded = json.dumps(item, indent=indent)
+            if newline:
+                encoded = encoded.replace(newline, newline + pad * 2)
+            yield ("" if empty else itemSep) + newline + pad * 2 + encoded
+            empty = False
+        yield "]" if empty else newline + pad + "]"
+    yield newline + "}" if fields else "}"
+
+
+def changedSections(previous, elementSections, nSections):
+    """
+    Numbers of the sections (1..nSections) whose assignment differs between two elementSections dicts.
+    """
+    previous, elementSections = previous or {}, elementSections or {}
+    return sorted(
+        int(key) for key in set(previous) | set(elementSections)
+        if str(key).isdigit() and 0 < int(key) <= nSections and previous.get(key) != elementSections.get(key)
+    )
+
+
+def _coordinateDicts(coordinateArray, start=0):
+    # {'section', 'a', ..., 'o'} dict of each section, converted STREAM_BLOCK_SECTIONS at a time
+    for blockStart in range(0, len(coordinateArray), STREAM_BLOCK_SECTIONS):
+        block = coordinateArray[blockStart:blockStart + STREAM_BLOCK_SECTIONS].tolist()
+        for i, nodes in enumerate(block, start=start + blockStart):
+            localCoords = {'section': i + 1}
+            localCoords.update(zip(NODE_NAMES, nodes))
+            yield localCoords
 
 
 class Section:
 
     def __init__(self, towerData, elementSections=None, sectionLibrary=None):
+        # Number of times the coordinate kernel ran for this instance
+        self.geometryBuilds = 0
+        self._coordinateArray = None
+        self._joinedCoordinateArray = None
+        self._coordinates = None
+        self._elements = None
+        self._elementArrays = None
+        self._mesh = None
+        # Sections whose element columns are out of date after updateElementSections
+        self.dirtySections = set()
         self.towerData = towerData
         self.elementSections = elementSections or {}
         self.sectionLibrary = sectionLibrary or {}
+
+    # Geometry is built lazily and memoized; replacing any input invalidates what depends on it.
+    # Mutating one of these dicts in place is not detected, call invalidate() afterwards.
+
+    @property
+    def towerData(self):
+        return self._towerData
+
+    @towerData.setter
+    def towerData(self, value):
+        self._towerData = value
         self._validateInputs()
+        self.invalidate()
+
+    @property
+    def elementSections(self):
+        return self._elementSections
+
+    @elementSections.setter
+    def elementSections(self, value):
+        self._elementSections = value
+        self._invalidateElements()
+
+    @property
+    def sectionLibrary(self):
+        return self._sectionLibrary
+
+    @sectionLibrary.setter
+    def sectionLibrary(self, value):
+        self._sectionLibrary = value
+        self.catalog = compileCatalog(value)
+        self._invalidateElements()
+
+    def invalidate(self):
+        self._coordinateArray = None
+        self._joinedCoordinateArray = None
+        self._coordinates = None
+        self._mesh = None
+        self._invalidateElements()
+
+    def _invalidateElements(self):
+        self._elementArrays = None
+        self._elements = None
 
     def _validateInputs(self):
         requiredKeys = ["tower_base_width", "top_width", "height", "variable_segments", "constant_segments"]
@@ -18,202 +308,305 @@ class Section:
             if key not in self.towerData:
                 raise ValueError(f"Missing required parameter: {key}")
 
-    DEFAULT_ELEMENT_PROPERTIES = {
-        "secction_type": "round",
-        "cross_area": 1222.6,
-        "projected_width": 0.0508,
-        "density": 7850,
-        "young_modulus": 200000,
-        "moment_of_inertia": 275000.0
-    }
+    # Members of one section as (name, node_i, node_j)
+    ELEMENT_TOPOLOGY = (
+        ("M1", "a", "e"),
+        ("M2", "e", "c"),
+        ("M3", "b", "f"),
+        ("M4", "f", "d"),
+        ("D1", "a", "g"),
+        ("D2", "g", "d"),
+        ("D3", "g", "b"),
+        ("D4", "g", "c"),
+        ("C1", "g", "e"),
+        ("C2", "g", "f"),
+        ("T1", "h", "m"),
+        ("T2", "m", "l"),
+        ("S1", "m", "n"),
+        ("S2", "m", "o"),
+        ("S3", "n", "e"),
+        ("S4", "o", "f"),
+        ("D1", "n", "a"),
+        ("D2", "n", "h"),
+        ("D3", "n", "l"),
+        ("D4", "n", "c"),
+        ("D5", "o", "h"),
+        ("D6", "o", "b"),
+        ("D7", "o", "d"),
+        ("D8", "o", "l"),
+    )
+
+    DEFAULT_ELEMENT_PROPERTIES = DEFAULT_ELEMENT_PROPERTIES
 
     def getSectionProps(self, sectionType, sectionName):
-        if sectionType not in self.sectionLibrary:
-            return self.DEFAULT_ELEMENT_PROPERTIES
-        for entry in self.sectionLibrary[sectionType]:
-            if entry["name"] == sectionName:
-                return entry
-        return self.DEFAULT_ELEMENT_PROPERTIES
-
-    def midpoint(self, p1, p2):
-        return [
-            round((p1[0] + p2[0]) / 2, 3),
-            round((p1[1] + p2[1]) / 2, 3),
-            round((p1[2] + p2[2]) / 2, 3),
-        ]
-
-
+        return self.catalog.lookup(sectionType, sectionName)
+
+    def getCoordinateArray(self):
+        if self._coordinateArray is None:
+            self._coordinateArray = coordinateKernel(
+                self.towerData["tower_base_width"],
+                self.towerData["top_width"],
+                self.towerData["height"],
+                self.towerData["variable_segments"],
+                self.towerData["constant_segments"],
+            )
+            self.geometryBuilds += 1
+        return self._coordinateArray
+
+    def getRoundedCoordinateArray(self):
+        """
+        Coordinate array rounded to the published 3 decimals, see roundCoordinates().
+        """
+        return roundCoordinates(self.getCoordinateArray(), self.towerData["variable_segments"])
+
+    def getJoinedCoordinateArray(self):
+        """
+        Rounded coordinates with the legs joined across sections (joinSections), the nodes of the mesh.
+
+        Member lengths, areas and element nodes all come from these, so the loads and the
+        frame and modal models describe the same connected structure.
+        """
+        if self._joinedCoordinateArray is None:
+            self._joinedCoordinateArray = joinSections(self.getRoundedCoordinateArray())
+        return self._joinedCoordinateArray
+
+    def iterCoordinates(self):
+        """
+        Yield the coordinate dict of each section without keeping the whole list.
+        """
+        if self._coordinates is not None:
+            yield from self._coordinates
+            return
+        yield from _coordinateDicts(self.getRoundedCoordinateArray())
 
     def getCoordinates(self):
-        baseWidth = self.towerData["tower_base_width"]
-        topWidth = self.towerData["top_width"]
-        totalHeight = self.towerData["height"]
-        variableSegments = self.towerData["variable_segments"]
-        constantSegments = self.towerData["constant_segments"]
-
-        segmentHeight = totalHeight / (variableSegments + constantSegments)
-        taperDelta = (baseWidth - topWidth) / 2
-        alpha  = np.arctan(taperDelta / (variableSegments * segmentHeight))
-        alphaZ = np.arctan( (np.cos(np.deg2rad(30)) * taperDelta )/ (variableSegments * segmentHeight) )
-
-
-        currentBase = baseWidth
-        coordinatesList = []
-        secction_init_x = 0.0
-        secction_init_y = 0.0
-        secction_init_z = 0.0
-
-        zinitial = np.sin(np.deg2rad(60))*baseWidth
-
-        for i in range(variableSegments):
-
-            sectionNumber = i + 1
-            segmentDelta = np.tan(alpha) * segmentHeight
-            segmentDeltaZ = np.tan(alphaZ) * segmentHeight
-
-            phi = np.arctan(segmentHeight / (currentBase - segmentDelta))
-            gHeight = np.tan(phi) * (currentBase / 2)
-            deltaG = gHeight * np.tan(alpha)
-            deltaGZ = gHeight * np.tan(alphaZ)
-
-            localCoords = {
-                'section': sectionNumber,
-                'a': [round(0.0 + secction_init_x, 3), round(0.0 + secction_init_y, 3), round(secction_init_z, 3)],
-                'b': [round(currentBase + secction_init_x, 3), round(0.0 + secction_init_y, 3), round(secction_init_z, 3)],
-                'c': [round(segmentDelta + secction_init_x, 3), round(segmentHeight + secction_init_y, 3), round(segmentDelta + secction_init_z, 3)],
-                'd': [round((currentBase - segmentDelta) + secction_init_x, 3), round(segmentHeight + secction_init_y, 3), round(segmentDelta + secction_init_z, 3)],
-                'e': [round(deltaG + secction_init_x, 3), round(gHeight + secction_init_y, 3), round(deltaG + secction_init_z, 3)],
-                'f': [round((currentBase - deltaG) + secction_init_x, 3), round(gHeight + secction_init_y, 3), round(deltaG + secction_init_z, 3)],
-                'g': [round((currentBase / 2) + secction_init_x, 3), round(gHeight + secction_init_y, 3), round(deltaG + secction_init_z, 3)],
-                'h': [round((currentBase / 2) + secction_init_x, 3), round(0.0 + secction_init_y, 3), round(zinitial - secction_init_z, 3)],
-                'l': [round((currentBase / 2) + secction_init_x, 3), round(segmentHeight + secction_init_y, 3), round((zinitial - segmentDeltaZ) - secction_init_z, 3)],
-                'm': [round((currentBase / 2) + secction_init_x, 3), round(gHeight + secction_init_y, 3), round((zinitial - deltaGZ) - secction_init_z, 3)],
-            }
-
-            # ✅ Now calculate midpoints n and o
-            localCoords['n'] = self.midpoint(localCoords['e'], localCoords['m'])
-            localCoords['o'] = self.midpoint(localCoords['m'], localCoords['f'])
-
-            coordinatesList.append(localCoords)
-            currentBase -= segmentDelta * 2
-            secction_init_x += segmentDelta
-            secction_init_y += segmentHeight
-            secction_init_z += segmentDeltaZ
-
-
-        for i in range(constantSegments):
-            sectionNumber += 1
-            localCoords = {
-                'section': sectionNumber,
-
-                #this are the coord to make the 2D tower section  
-
-                'a': [round(0.0 + secction_init_x, 3), round(0.0 + secction_init_y, 3), round(secction_init_z, 3)],
-                'b': [round(currentBase + secction_init_x, 3), round(0.0 + secction_init_y, 3), round(secction_init_z, 3)],
-                'c': [round(secction_init_x, 3), round(segmentHeight + secction_init_y, 3),round(secction_init_z, 3)],
-                'd': [round(currentBase + secction_init_x, 3), round(segmentHeight + secction_init_y, 3),round(secction_init_z, 3)],
-                'e': [round(secction_init_x, 3), round((segmentHeight / 2) + secction_init_y, 3),round(secction_init_z, 3)],
-                'f': [round(currentBase + secction_init_x, 3), round((segmentHeight / 2) + secction_init_y, 3),round(secction_init_z, 3)],
-                'g': [round((currentBase / 2) + secction_init_x, 3), round((segmentHeight / 2) + secction_init_y, 3),round(secction_init_z, 3)],
-
-                # Add this nodes to make the 3d tower section tiangle cross section node corresponding to the 3rd leg of the tower
-
-                'h': [round((currentBase / 2)+ secction_init_x,3), round(0.0 + secction_init_y, 3), round(zinitial-secction_init_z , 3)],
-                'l': [round((currentBase / 2)+ secction_init_x,3), round(segmentHeight + secction_init_y, 3), round(zinitial-secction_init_z , 3)],
-                'm': [round((currentBase / 2)+ secction_init_x,3), round((segmentHeight / 2) + secction_init_y, 3), round(zinitial-secction_init_z , 3)],
-            }
-
-            # ✅ Now calculate n and o
-            n = self.midpoint(localCoords['e'], localCoords['m'])
-            o = self.midpoint(localCoords['m'], localCoords['f'])
-
-            # ✅ Add them to localCoords
-            localCoords['n'] = n
-            localCoords['o'] = o
-
-            coordinatesList.append(localCoords)
-            secction_init_y += round(segmentHeight, 3)
-
-        return coordinatesList
+        if self._coordinates is None:
+            self._coordinates = list(self.iterCoordinates())
+        return self._coordinates
+
+    def getMesh(self):
+        if self._mesh is None:
+            # Joined so section n's c/d and section n+1's a/b become the same nodes
+            self._mesh = Mesh.fromSections(self.getJoinedCoordinateArray(), self.ELEMENT_TOPOLOGY, NODE_NAMES)
+        return self._mesh
+
+    def toMeshDict(self):
+        mesh = self.getMesh()
+        arrays = self.getElementArrays()
+        meshDict = mesh.toDict()
+        # Same lengths as mesh.elementLengths(), both come from the joined coordinates
+        lengths = np.round(arrays["length"], 3)
+        meshDict["length"] = lengths.ravel().tolist()
+        meshDict["projected_area"] = np.round(arrays["projected_width"] * lengths, 3).ravel().tolist()
+        return meshDict
+
+    def _assignedSectionNames(self, sectionIndices):
+        # (len(sectionIndices), n_groups) assigned names, None where the group has no assignment
+        groupNames = np.full((len(sectionIndices), len(MEMBER_GROUPS)), None, dtype=object)
+        for row, i in enumerate(sectionIndices):
+            assignedGroup = self.elementSections.get(str(i + 1))
+            if not assignedGroup:
+                continue
+            for column, group in enumerate(MEMBER_GROUPS):
+                groupNames[row, column] = assignedGroup.get(group) or None
+        return groupNames
+
+    def _resolveAssignments(self, sectionIndices):
+        # Resolve each (section, group) assignment once, then spread it over the group's members
+        assigned = self._assignedSectionNames(sectionIndices)
+        groupRows = self.catalog.indexMany(assigned)
+        groupTypes = np.where(
+            assigned.astype(bool),
+            np.where(np.char.startswith(assigned.astype(str), "RD"), "round", "angular"),
+            self.DEFAULT_ELEMENT_PROPERTIES["secction_type"],
+        )
+        return groupRows[:, ELEMENT_GROUP_COLUMNS], groupTypes[:, ELEMENT_GROUP_COLUMNS]
+
+    def getElementArrays(self):
+        """
+        Unrounded per-element arrays of shape (n_sections, n_members) for all sections.
+
+        Keys: length, row (catalog row), secction_type, projected_area and every
+        SectionCatalog.PROPERTY_NAMES column.
+        """
+        if self._elementArrays is None:
+            coordinateArray = self.getJoinedCoordinateArray()
+            lengths = memberLengths(coordinateArray)
+            rows, sectionTypes = self._resolveAssignments(range(len(coordinateArray)))
+
+            arrays = self.catalog.properties(rows)
+            arrays["length"] = lengths
+            arrays["row"] = rows
+            arrays["secction_type"] = sectionTypes.astype(SECTION_TYPE_DTYPE)
+            arrays["projected_area"] = arrays["projected_width"] * lengths
+            self._elementArrays = arrays
+            self.dirtySections = set()
+        return self._elementArrays
+
+    def updateElementSections(self, elementSections):
+        """
+        Replace the member assignments, recomputing only the sections whose assignment changed.
+
+        Geometry and the other sections' element arrays and dicts are kept; only the
+        property columns (and cached element dicts) of the changed sections are rebuilt.
+
+        Returns:
+            list: Numbers of the sections whose assignment changed.
+        """
+        elementSections = elementSections or {}
+        changed = changedSections(self._elementSections, elementSections, len(self.getCoordinateArray()))
+        self._elementSections = elementSections
+        if self._elementArrays is None:
+            self._elements = None
+            return changed
+
+        self.dirtySections.update(changed)
+        self._refreshDirtySections()
+        return changed
+
+    def _refreshDirtySections(self):
+        sectionIndices = np.array(sorted(self.dirtySections), dtype=np.int64) - 1
+        if len(sectionIndices):
+            arrays = self._elementArrays
+            rows, sectionTypes = self._resolveAssignments(sectionIndices)
+            for prop, values in self.catalog.properties(rows).items():
+                arrays[prop][sectionIndices] = values
+            arrays["row"][sectionIndices] = rows
+            arrays["secction_type"][sectionIndices] = sectionTypes
+            arrays["projected_area"][sectionIndices] = arrays["projected_width"][sectionIndices] * arrays["length"][sectionIndices]
+
+            if self._elements is not None:
+                joined = self.getJoinedCoordinateArray()
+                for row, i in enumerate(sectionIndices.tolist()):
+                    self._elements[i] = self._elementGroup(
+                        next(_coordinateDicts(joined[i:i + 1], start=i)),
+                        arrays["length"][i].tolist(),
+                        rows[row].tolist(),
+                        arrays["secction_type"][i].tolist(),
+                    )
+        self.dirtySections = set()
+
+    def getFaceAreas(self):
+        """
+        Round, angle and gross windward-face areas of every section, see faceAreas().
+        """
+        arrays = self.getElementArrays()
+        return faceAreas(
+            self.getJoinedCoordinateArray(),
+            arrays["projected_area"],
+            arrays["secction_type"] == "round",
+        )
 
     def getElements(self):
-        coordinatesList = self.getCoordinates()
-        elementList = []
-
-        for i, coords in enumerate(coordinatesList):
-            sectionNumber = str(coords["section"])
-            assignedGroup = self.elementSections.get(sectionNumber, {})
-
-            def buildElement(name, node_i, node_j):
-                group = name[0]  # M, D, or C
-                assigned = assignedGroup.get(group)
-                if assigned:
-                    sectionType = "round" if assigned.startswith("RD") else "angular"
-                    props = self.getSectionProps(sectionType, assigned)
-                    secType = sectionType
-                else:
-                    props = self.DEFAULT_ELEMENT_PROPERTIES
-                    secType = props["secction_type"]
-
-                length = round(self.elementLength(node_i, node_j), 3)
-
-                return {
-                    "element": name,
-                    "node_i": node_i,
-                    "node_j": node_j,
-                    "length": length,
-                    "secction_type": secType,
-                    "cross_area": props["cross_area"],
-                    "projected_width": props["projected_width"],
-                    "projected_area": round(props["projected_width"] * length, 3)
-                }
-
-            elements = [
-                buildElement("M1", coords['a'], coords['e']),
-                buildElement("M2", coords['e'], coords['c']),
-                buildElement("M3", coords['b'], coords['f']),
-                buildElement("M4", coords['f'], coords['d']),
-                buildElement("D1", coords['a'], coords['g']),
-                buildElement("D2", coords['g'], coords['d']),
-                buildElement("D3", coords['g'], coords['b']),
-                buildElement("D4", coords['g'], coords['c']),
-                buildElement("C1", coords['g'], coords['e']),
-                buildElement("C2", coords['g'], coords['f']),
-                buildElement("T1", coords['h'], coords['m']),
-                buildElement("T2", coords['m'], coords['l']),
-                buildElement("S1", coords['m'], coords['n']),
-                buildElement("S2", coords['m'], coords['o']),
-                buildElement("S3", coords['n'], coords['e']),
-                buildElement("S4", coords['o'], coords['f']),
-                buildElement("D1", coords['n'], coords['a']),
-                buildElement("D2", coords['n'], coords['h']),   
-                buildElement("D3", coords['n'], coords['l']),
-                buildElement("D4", coords['n'], coords['c']),
-                buildElement("D5", coords['o'], coords['h']),
-                buildElement("D6", coords['o'], coords['b']),
-                buildElement("D7", coords['o'], coords['d']),
-                buildElement("D8", coords['o'], coords['l']),
-            ]
-
-
-            elementList.append({
-                "section": coords["section"],
-                "elements": elements
+        if self._elements is None:
+            self._elements = self._buildElements()
+        return self._elements
+
+    def iterElements(self):
+        """
+        Yield the element group of each section without keeping the whole list.
+        """
+        if self._elements is not None:
+            yield from self._elements
+            return
+        # Serialization boundary: values are rounded here, the arrays stay unrounded
+        arrays = self.getElementArrays()
+        # Element nodes are the joined ones their lengths were measured on
+        coordinates = _coordinateDicts(self.getJoinedCoordinateArray())
+        for start in range(0, len(arrays["row"]), STREAM_BLOCK_SECTIONS):
+            block = slice(start, start + STREAM_BLOCK_SECTIONS)
+            lengths = arrays["length"][block].tolist()
+            rows = arrays["row"][block].tolist()
+            sectionTypes = arrays["secction_type"][block].tolist()
+
+            for i, coords in enumerate(itertools.islice(coordinates, len(rows))):
+                yield self._elementGroup(coords, lengths[i], rows[i], sectionTypes[i])
+
+    def _elementGroup(self, coords, lengths, rows, sectionTypes):
+        # One section's {"section", "elements"} dict from its rounded nodes and element columns
+        entries = self.catalog.entries
+        elements = []
+        for k, (name, node_i, node_j) in enumerate(self.ELEMENT_TOPOLOGY):
+            entry = entries[rows[k]]
+            length = round(lengths[k], 3)
+            elements.append({
+                "element": name,
+                "node_i": coords[node_i],
+                "node_j": coords[node_j],
+                "length": length,
+                "secction_type": sectionTypes[k],
+                "cross_area": entry["cross_area"],
+                "projected_width": entry["projected_width"],
+                "projected_area": round(entry["projected_width"] * length, 3)
             })
 
-        return elementList
+        return {
+            "section": coords["section"],
+            "elements": elements
+        }
 
-    def elementLength(self, node_i, node_j):
-        return math.sqrt(
-            (node_j[0] - node_i[0]) ** 2 +
-            (node_j[1] - node_i[1]) ** 2 +
-            (node_j[2] - node_i[2]) ** 2
-        )
+    def getSectionElements(self, sectionNumbers):
+        """
+        Element groups of the given section numbers only.
+        """
+        elements = self.getElements()
+        return [elements[n - 1] for n in sectionNumbers]
+
+    def _buildElements(self):
+        return list(self.iterElements())
+
+    def toDict(self):
+        return { 'coordinates': self.getCoordinates(), 'elements': self.getElements() }
 
     def toJson(self, indent=4):
-        return json.dumps({ 'coordinates': self.getCoordinates(), 'elements': self.getElements() }, indent=indent)
+        return json.dumps(self.toDict(), indent=indent)
+
+    def iterJson(self, indent=None):
+        """
+        Stream the same document as toJson() in chunks, one section at a time.
+        """
+        return iterJsonObject([("coordinates", self.iterCoordinates()), ("elements", self.iterElements())], indent)
+
+    def writeJson(self, fp, indent=4):
+        for chunk in self.iterJson(indent):
+            fp.write(chunk)
 
     def saveToFile(self, filename: str):
         with open(filename, 'w') as f:
-            json.dump({ 'coordinates': self.getCoordinates(), 'elements': self.getElements() }, f, indent=4)
+            self.writeJson(f, indent=4)
         print(f"✅ Saved tower sections to {filename}")
+
+
+# Member groups that elementSections assigns sections to, and the group column of every member
+MEMBER_GROUPS = ("M", "D", "C", "T", "S")
+ELEMENT_GROUP_COLUMNS = np.array([MEMBER_GROUPS.index(name[0]) for name, _, _ in Section.ELEMENT_TOPOLOGY])
+
+# Coordinate-array slots of the end nodes of every member
+ELEMENT_NODE_I = np.array([NODE_NAMES.index(node_i) for _, node_i, _ in Section.ELEMENT_TOPOLOGY])
+ELEMENT_NODE_J = np.array([NODE_NAMES.index(node_j) for _, _, node_j in Section.ELEMENT_TOPOLOGY])
+
+# Members lying in the a-g face, the face the wind loads
+FACE_NODES = ('a', 'b', 'c', 'd', 'e', 'f', 'g')
+FACE_ELEMENT_MASK = np.array([
+    node_i in FACE_NODES and node_j in FACE_NODES for _, node_i, node_j in Section.ELEMENT_TOPOLOGY
+])
+
+
+def groupFaceLengths(lengths):
+    """
+    Summed length of the windward-face members of every member group.
+
+    A group's face area is this length × its projected width, the link between
+    a group's section and its panel's solidity and EPA.
+
+    Args:
+        lengths (np.ndarray): ([D,] n_sections, n_members) member lengths.
+
+    Returns:
+        np.ndarray: ([D,] n_sections, len(MEMBER_GROUPS)) lengths in m.
+    """
+    faceLengths = np.where(FACE_ELEMENT_MASK, lengths, 0.0)
+    groupLengths = np.zeros(lengths.shape[:-1] + (len(MEMBER_GROUPS),))
+    for column, group in enumerate(ELEMENT_GROUP_COLUMNS):
+        groupLengths[..., group] += faceLengths[..., column]
+    return groupLengths
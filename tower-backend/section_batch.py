@@ -0,0 +1,161 @@
+import json
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from section import Section
+from section_catalog import compileCatalog, libraryFingerprint
+from utils import normalizeTowerDataKeys
+
+
+# Catalog compiled once in every worker process by _initWorker
+_workerCatalog = None
+
+
+def _initWorker(sectionLibrary, version):
+    global _workerCatalog
+    _workerCatalog = compileCatalog(sectionLibrary, version)
+
+
+def _ping():
+    return os.getpid()
+
+
+def computeSectionJson(payload):
+    """
+    Compute one {towerData, elementSections} payload inside a worker.
+
+    Returns:
+        str: JSON text of {"coordinates", "elements"}, or of {"error"} when the payload is invalid.
+    """
+    try:
+        towerData = normalizeTowerDataKeys(payload.get("towerData") or {})
+        section = Section(towerData, payload.get("elementSections") or {}, _workerCatalog)
+        return "".join(section.iterJson())
+    except Exception as e:
+        return json.dumps({"error": str(e)})
+
+
+class SectionBatchPool:
+    """
+    Warm process pool computing Section payloads with the section library preloaded.
+
+    Workers are spawned (not forked), so they never inherit the web server's network clients or
+    threads. A spawned worker re-imports the server's main script as __mp_main__; app.py
+    creates its clients in init_services(), which it skips under that name.
+    """
+
+    def __init__(self, sectionLibrary=None, workers=None, version=None):
+        catalog = compileCatalog(sectionLibrary, version)
+        self.version = catalog.version
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initWorker,
+            initargs=(sectionLibrary, catalog.version),
+        )
+        # Start every worker now so the first request does not pay for process start-up
+        for future in [self._executor.submit(_ping) for _ in range(self.workers)]:
+            future.result()
+
+    @property
+    def executor(self):
+        """
+        The warm ProcessPoolExecutor, for other picklable work (e.g. SectionSizer panels).
+        """
+        return self._executor
+
+    def map(self, payloads):
+        """
+        Compute every payload and return the JSON results in input order.
+        """
+        chunksize = max(1, len(payloads) // (self.workers * 4))
+        return list(self._executor.map(computeSectionJson, payloads, chunksize=chunksize))
+
+    def iterCompleted(self, payloads):
+        """
+        Submit every payload now and return an iterator of (index, json_text) in completion order.
+
+        Submitting eagerly means a streamed response keeps working if the pool is retired
+        (getBatchPool) before the stream is consumed.
+        """
+        futures = {self._executor.submit(computeSectionJson, payload): i for i, payload in enumerate(payloads)}
+        return ((futures[future], future.result()) for future in as_completed(futures))
+
+    def close(self, wait=True):
+        """
+        Shut the workers down.
+
+        With wait=False the call returns at once: work already submitted still completes,
+        new submissions are refused and the workers exit when the queue is empty.
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=wait)
+
+
+_pool = None
+_poolLock = threading.Lock()
+
+
+def getBatchPool(sectionLibrary, version=None, workers=None):
+    """
+    Return the process-wide SectionBatchPool of this library version, rebuilding it when the version changes.
+
+    Args:
+        sectionLibrary (dict): Raw section library the workers compile.
+        version (str): Library version (SectionCatalog.version); defaults to a content fingerprint.
+        workers (int): Pool size, defaults to the CPU count.
+    """
+    global _pool
+    version = version or libraryFingerprint(sectionLibrary or {})
+    with _poolLock:
+        if _pool is not None and _pool.version != version:
+            # Requests already running on the old pool (a streamed batch, a sizing run) have
+            # submitted their work, which still completes; then its workers exit
+            print(f"🔁 Section library changed ({_pool.version} -> {version}), restarting the batch pool")
+            _pool.close(wait=False)
+            _pool = None
+        if _pool is None:
+            _pool = SectionBatchPool(sectionLibrary, workers, version)
+        return _pool
+
+
+def _benchmarkPayloads(count):
+    payloads = []
+    for i in range(count):
+        payloads.append({
+            "towerData": {
+                "tower_base_width": 6.0 + (i % 7) * 0.5,
+                "top_width": 1.5,
+                "height": 60.0 + (i % 11) * 6,
+                "variable_segments": 40 + i % 10,
+                "constant_segments": 10,
+            },
+            "elementSections": {str(s): {"M": "RD50", "D": "L50x50x3"} for s in range(1, 50, 2)},
+        })
+    return payloads
+
+
+if __name__ == "__main__":
+    # Local benchmark: throughput of the pool against a serial loop for growing worker counts
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "section_library.json")) as f:
+        library = json.load(f)
+    payloads = _benchmarkPayloads(400)
+
+    _initWorker(library, None)
+    start = time.perf_counter()
+    for payload in payloads:
+        computeSectionJson(payload)
+    serial = time.perf_counter() - start
+    print(f"serial:     {serial:.3f} s ({len(payloads) / serial:.0f} towers/s)")
+
+    workerCounts = sorted({1, 2, 4, 8, os.cpu_count() or 1})
+    for workers in [w for w in workerCounts if w <= (os.cpu_count() or 1)]:
+        pool = SectionBatchPool(library, workers)
+        start = time.perf_counter()
+        pool.map(payloads)
+        elapsed = time.perf_counter() - start
+        pool.close()
+        print(f"{workers:2d} workers: {elapsed:.3f} s ({len(payloads) / elapsed:.0f} towers/s, speedup x{serial / elapsed:.2f})")
@@ -0,0 +1,248 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+
+DEFAULT_ELEMENT_PROPERTIES = {
+    "secction_type": "round",
+    "cross_area": 1222.6,
+    "projected_width": 0.0508,
+    "density": 7850,
+    "young_modulus": 200000,
+    "moment_of_inertia": 275000.0
+}
+
+# Row of the packed arrays holding DEFAULT_ELEMENT_PROPERTIES
+DEFAULT_INDEX = 0
+
+# Number of compiled catalogs kept by compileCatalog
+CATALOG_CACHE_SIZE = 8
+
+# Storage object holding the raw section library
+LIBRARY_FILE = "sections/element_sections/section_library.json"
+
+# Seconds a cached library is trusted before its generation is checked again
+CATALOG_REVALIDATE_SECONDS = 30.0
+
+
+def sectionTypeFor(sectionName):
+    """
+    Infer the library type of a section from its name (RD... bars are round).
+    """
+    return "round" if sectionName.startswith("RD") else "angular"
+
+
+def libraryFingerprint(library):
+    """
+    Stable content hash of a raw section library, used as its version when none is given.
+    """
+    payload = json.dumps(library, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class SectionCatalog:
+    """
+    Section library compiled into packed property arrays indexed by (type, name).
+
+    Row DEFAULT_INDEX holds DEFAULT_ELEMENT_PROPERTIES, which is what unknown or
+    unassigned sections resolve to.
+    """
+
+    PROPERTY_NAMES = ("projected_width", "cross_area", "density", "young_modulus", "moment_of_inertia")
+
+    def __init__(self, library, version=None):
+        library = library or {}
+        self.version = version or libraryFingerprint(library)
+
+        self.entries = [DEFAULT_ELEMENT_PROPERTIES]
+        self.types = [DEFAULT_ELEMENT_PROPERTIES["secction_type"]]
+        self.names = [None]
+        self._index = {}
+        for sectionType, entries in library.items():
+            for entry in entries:
+                key = (sectionType, entry["name"])
+                if key in self._index:
+                    continue  # first entry wins, as in the original linear scan
+                self._index[key] = len(self.entries)
+                self.entries.append(entry)
+                self.types.append(sectionType)
+                self.names.append(entry["name"])
+
+        for prop in self.PROPERTY_NAMES:
+            values = np.array([entry[prop] for entry in self.entries], dtype=np.float64)
+            setattr(self, self._attributeName(prop), values)
+        self.isRound = np.array([sectionType == "round" for sectionType in self.types])
+
+    @staticmethod
+    def _attributeName(prop):
+        head, *tail = prop.split("_")
+        return head + "".join(word.capitalize() for word in tail)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def index(self, sectionType, sectionName):
+        """
+        Row of (sectionType, sectionName), or DEFAULT_INDEX when it is not in the library.
+        """
+        return self._index.get((sectionType, sectionName), DEFAULT_INDEX)
+
+    def lookup(self, sectionType, sectionName):
+        """
+        Library entry for (sectionType, sectionName), falling back to the default properties.
+        """
+        return self.entries[self.index(sectionType, sectionName)]
+
+    def indexMany(self, sectionNames):
+        """
+        Vectorized lookup of an array of assigned section names.
+
+        Args:
+            sectionNames (array-like): Section names; None or "" means unassigned.
+
+        Returns:
+            np.ndarray: int64 row of every name, DEFAULT_INDEX where not found.
+        """
+        sectionNames = np.asarray(sectionNames, dtype=object)
+        if sectionNames.size == 0:
+            return np.zeros(sectionNames.shape, dtype=np.int64)
+        uniqueNames, inverse = np.unique(sectionNames.astype(str), return_inverse=True)
+        rows = np.array([
+            self.index(sectionTypeFor(name), name) if name not in ("", "None") else DEFAULT_INDEX
+            for name in uniqueNames
+        ], dtype=np.int64)
+        return rows[inverse].reshape(sectionNames.shape)
+
+    def properties(self, rows):
+        """
+        Gather every packed property for an array of rows.
+
+        Returns:
+            dict: property name -> float64 array shaped like rows.
+        """
+        return {prop: getattr(self, self._attributeName(prop))[rows] for prop in self.PROPERTY_NAMES}
+
+
+_catalogCache = OrderedDict()
+_catalogLock = threading.Lock()
+
+
+def compileCatalog(library, version=None):
+    """
+    Return the compiled SectionCatalog for a library, building it once per version.
+
+    Args:
+        library (dict | SectionCatalog): Raw library ({type: [entry, ...]}) or a compiled catalog.
+        version (str): Library version; defaults to a content fingerprint.
+    """
+    if isinstance(library, SectionCatalog):
+        return library
+    version = version or libraryFingerprint(library or {})
+    with _catalogLock:
+        catalog = _catalogCache.get(version)
+        if catalog is not None:
+            _catalogCache.move_to_end(version)
+            return catalog
+
+    catalog = SectionCatalog(library, version)
+    with _catalogLock:
+        _catalogCache[version] = catalog
+        while len(_catalogCache) > CATALOG_CACHE_SIZE:
+            _catalogCache.popitem(last=False)
+    return catalog
+
+
+class CatalogCache:
+    """
+    Process-wide compiled section library, revalidated against the stored object's generation.
+
+    Within `ttl` seconds of the last check the cached catalog is returned without any
+    storage request. After that a stat() compares the object's generation (bumped by every
+    upload) with the cached one and only downloads and compiles the library when it changed.
+    invalidate() forces the next get() to revalidate.
+
+    Attributes:
+        storage (StorageBackend): Where the library lives.
+        libraryFile (str): Object name of the library.
+        ttl (float): Seconds between revalidations.
+    """
+
+    def __init__(self, storage, libraryFile=LIBRARY_FILE, ttl=CATALOG_REVALIDATE_SECONDS, clock=time.monotonic):
+        self.storage = storage
+        self.libraryFile = libraryFile
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._library = None
+        self._catalog = None
+        self._generation = None
+        self._checkedAt = None
+        self._counts = {"hits": 0, "revalidated": 0, "misses": 0}
+
+    def _current(self):
+        now = self._clock()
+        if self._catalog is not None and self._checkedAt is not None and now - self._checkedAt < self.ttl:
+            self._counts["hits"] += 1
+            return
+
+        # A missing library compiles to the default properties only, with generation None
+        info = self.storage.stat(self.libraryFile)
+        generation = info["generation"] if info is not None else None
+        if self._catalog is not None and generation == self._generation:
+            self._counts["revalidated"] += 1
+        else:
+            self._counts["misses"] += 1
+            library = self.storage.getJson(self.libraryFile) if info is not None else None
+            self._library, self._catalog = library, compileCatalog(library)
+            self._generation = generation
+        self._checkedAt = now
+
+    def get(self):
+        """
+        The compiled SectionCatalog of the current library.
+        """
+        with self._lock:
+            self._current()
+            return self._catalog
+
+    def library(self):
+        """
+        The raw library dict the current catalog was compiled from (shared, do not modify).
+        """
+        with self._lock:
+            self._current()
+            return self._library
+
+    def snapshot(self):
+        """
+        (raw library, compiled catalog) of the same version, for consumers that need both.
+        """
+        with self._lock:
+            self._current()
+            return self._library, self._catalog
+
+    def invalidate(self):
+        """
+        Check the stored generation on the next access, regardless of the TTL.
+        """
+        with self._lock:
+            self._checkedAt = None
+
+    def stats(self):
+        """
+        Hit (no storage request), revalidated (generation unchanged) and miss (download) counts.
+        """
+        with self._lock:
+            return {
+                **self._counts,
+                "generation": self._generation,
+                "version": self._catalog.version if self._catalog is not None else None,
+                "ttl": self.ttl,
+            }
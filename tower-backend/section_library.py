@@ -1,28 +1,26 @@
 import os
+import sys
 import json
-from google.cloud import storage
 from dotenv import load_dotenv
+from section_catalog import LIBRARY_FILE, libraryFingerprint
+from storage_backend import getStorage
 
 # ✅ Load environment variables
 load_dotenv()
 
-# ✅ Set GCS credentials
-os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-
-# ✅ Define bucket
-bucket_name = os.getenv("BUCKET_NAME", "towerbucket1")
-
-# ✅ Path to your section_library.json
-json_path = "C:/Users/rfuen/Desktop/TowerPlot/tower-backend/section_library.json"
+# ✅ Path to your section_library.json (first argument, or the copy next to this script)
+json_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(os.path.abspath(__file__)), "section_library.json")
 
 # ✅ Load the JSON file
 with open(json_path, "r") as f:
     section_data = json.load(f)
 
-# ✅ Upload to Google Cloud Storage
-client = storage.Client()
-bucket = client.bucket(bucket_name)
-blob = bucket.blob("sections/element_sections/section_library.json")  # 👈 this must match app.py
-blob.upload_from_string(json.dumps(section_data), content_type="application/json")
+# ✅ Upload to the configured storage backend (STORAGE_BACKEND, BUCKET_NAME)
+storage = getStorage()
+previous = storage.stat(LIBRARY_FILE)
+storage.putJson(LIBRARY_FILE, section_data)  # 👈 LIBRARY_FILE is what app.py reads
 
-print("✅ Uploaded section_library.json to GCS at sections/element_sections/")
+# ✅ Every upload bumps the object's generation, which running servers' CatalogCache compare on revalidation
+current = storage.stat(LIBRARY_FILE)
+print(f"✅ Uploaded section_library.json to {storage.url(LIBRARY_FILE)}")
+print(f"🔖 Generation {previous['generation'] if previous else None} -> {current['generation']}, content version {libraryFingerprint(section_data)}")
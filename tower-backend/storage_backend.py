@@ -0,0 +1,467 @@
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+
+# Backend chosen by getStorage() when STORAGE_BACKEND is not set
+DEFAULT_BACKEND = "gcs"
+
+# Threads used by getMany/putMany (storage requests are I/O bound)
+BATCH_WORKERS = 16
+
+# Latencies kept per operation for the percentile metrics
+LATENCY_WINDOW = 2048
+
+# Resumable GCS uploads need chunks in multiples of 256 KiB
+STREAM_CHUNK_SIZE = 8 * 256 * 1024
+
+
+class PreconditionFailed(Exception):
+    """
+    A conditional write found the object at another generation than the one it expected.
+    """
+
+
+def _isoTime(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+class StorageBackend:
+    """
+    Named text/JSON objects behind one interface, with batch operations and latency metrics.
+
+    Subclasses implement _exists, _get, _getVersioned, _put, _delete, _list, _stat and _writer; every public
+    operation is timed per operation name. `latency` (seconds) is added to every request so
+    offline backends can stand in for remote storage in load tests.
+    """
+
+    scheme = None
+
+    def __init__(self, latency=0.0, workers=BATCH_WORKERS):
+        self.latency = latency
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._metricsLock = threading.Lock()
+        self._metrics = {}
+
+    @contextmanager
+    def _timed(self, operation):
+        start = time.perf_counter()
+        failed = False
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            yield
+        except Exception:
+            failed = True
+            raise
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            with self._metricsLock:
+                stats = self._metrics.setdefault(
+                    operation, {"count": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0, "recent": deque(maxlen=LATENCY_WINDOW)}
+                )
+                stats["count"] += 1
+                stats["errors"] += failed
+                stats["total_ms"] += elapsed
+                stats["max_ms"] = max(stats["max_ms"], elapsed)
+                stats["recent"].append(elapsed)
+
+    def metrics(self, reset=False):
+        """
+        Per-operation count, errors and latency (mean, p50, p95, max in ms).
+        """
+        with self._metricsLock:
+            summary = {}
+            for operation, stats in self._metrics.items():
+                recent = sorted(stats["recent"])
+                summary[operation] = {
+                    "count": stats["count"],
+                    "errors": stats["errors"],
+                    "mean_ms": round(stats["total_ms"] / stats["count"], 3),
+                    "p50_ms": round(recent[len(recent) // 2], 3),
+                    "p95_ms": round(recent[min(len(recent) - 1, int(len(recent) * 0.95))], 3),
+                    "max_ms": round(stats["max_ms"], 3),
+                }
+            if reset:
+                self._metrics = {}
+        return {"backend": self.scheme, "operations": summary}
+
+    def exists(self, name):
+        with self._timed("exists"):
+            return self._exists(name)
+
+    def getText(self, name):
+        """
+        Text of an object, or None when it does not exist.
+        """
+        with self._timed("get"):
+            return self._get(name)
+
+    def getVersioned(self, name):
+        """
+        (text, generation) of an object read as one version; (None, 0) when it does not exist.
+        """
+        with self._timed("get"):
+            return self._getVersioned(name)
+
+    def putText(self, name, text, contentType="application/json", ifGeneration=None):
+        """
+        Write an object.
+
+        With ifGeneration set, the write only happens while the object is still at that
+        generation (0: while it does not exist), otherwise PreconditionFailed is raised.
+        Read-modify-write cycles use it to detect concurrent writers, in any process.
+        """
+        with self._timed("put"):
+            self._put(name, text, contentType, ifGeneration)
+
+    def delete(self, name):
+        with self._timed("delete"):
+            self._delete(name)
+
+    def list(self, prefix=""):
+        """
+        Names of the objects starting with prefix, sorted.
+        """
+        with self._timed("list"):
+            return sorted(self._list(prefix))
+
+    def stat(self, name):
+        """
+        {"name", "size", "updated", "generation"} of an object, or None when it does not exist.
+
+        The generation changes on every write, so it identifies one version of the object.
+        """
+        with self._timed("stat"):
+            return self._stat(name)
+
+    @contextmanager
+    def openWriter(self, name, contentType="application/json"):
+        """
+        Text writer whose content becomes the object when the block exits, written in chunks where supported.
+        """
+        with self._timed("stream"):
+            with self._writer(name, contentType) as writer:
+                yield writer
+
+    def getJson(self, name):
+        text = self.getText(name)
+        return json.loads(text) if text is not None else None
+
+    def putJson(self, name, data, ifGeneration=None):
+        self.putText(name, json.dumps(data), ifGeneration=ifGeneration)
+
+    def getMany(self, names):
+        """
+        Text of many objects fetched concurrently, in order; None for missing ones.
+        """
+        return list(self._executor.map(self.getText, names))
+
+    def putMany(self, items, contentType="application/json"):
+        """
+        Write many {name: text} objects concurrently.
+        """
+        list(self._executor.map(lambda item: self.putText(item[0], item[1], contentType), items.items()))
+
+    def url(self, name):
+        return f"{self.scheme}://{name}"
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+
+class MemoryStorage(StorageBackend):
+    """
+    Process-local objects in a dict; each write bumps the object's generation.
+    """
+
+    scheme = "memory"
+
+    def __init__(self, latency=0.0, workers=BATCH_WORKERS):
+        super().__init__(latency, workers)
+        self._objects = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def _exists(self, name):
+        return name in self._objects
+
+    def _get(self, name):
+        entry = self._objects.get(name)
+        return entry["text"] if entry else None
+
+    def _getVersioned(self, name):
+        entry = self._objects.get(name)
+        return (entry["text"], entry["generation"]) if entry else (None, 0)
+
+    def _put(self, name, text, contentType, ifGeneration=None):
+        with self._lock:
+            if ifGeneration is not None:
+                entry = self._objects.get(name)
+                if (entry["generation"] if entry else 0) != ifGeneration:
+                    raise PreconditionFailed(name)
+            self._generation += 1
+            self._objects[name] = {"text": text, "generation": self._generation, "updated": time.time()}
+
+    def _delete(self, name):
+        with self._lock:
+            self._objects.pop(name, None)
+
+    def _list(self, prefix):
+        return [name for name in list(self._objects) if name.startswith(prefix)]
+
+    def _stat(self, name):
+        entry = self._objects.get(name)
+        if entry is None:
+            return None
+        return {"name": name, "size": len(entry["text"].encode()), "updated": _isoTime(entry["updated"]), "generation": entry["generation"]}
+
+    @contextmanager
+    def _writer(self, name, contentType):
+        buffer = io.StringIO()
+        yield buffer
+        self._put(name, buffer.getvalue(), contentType)
+
+
+class LocalStorage(StorageBackend):
+    """
+    Objects stored as files under a root directory, object names used as relative paths.
+
+    Writes go to a temporary file that replaces the target, so readers never see partial objects.
+    Conditional writes (ifGeneration) are checked against the file's mtime within this process
+    only; this backend is meant for a single server process.
+    """
+
+    scheme = "file"
+
+    def __init__(self, root, latency=0.0, workers=BATCH_WORKERS):
+        super().__init__(latency, workers)
+        self.root = os.path.abspath(root)
+        self._conditionalLock = threading.Lock()
+
+    def _path(self, name):
+        path = os.path.abspath(os.path.join(self.root, name))
+        if os.path.commonpath([self.root, path]) != self.root:
+            raise ValueError(f"Object name '{name}' escapes the storage root.")
+        return path
+
+    def _exists(self, name):
+        return os.path.isfile(self._path(name))
+
+    def _get(self, name):
+        try:
+            with open(self._path(name), encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    @contextmanager
+    def _writer(self, name, contentType):
+        path = self._path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                yield f
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def _getVersioned(self, name):
+        while True:
+            before = self._stat(name)
+            if before is None:
+                return None, 0
+            text = self._get(name)
+            after = self._stat(name)
+            if text is not None and after is not None and after["generation"] == before["generation"]:
+                return text, before["generation"]
+
+    def _put(self, name, text, contentType, ifGeneration=None):
+        if ifGeneration is None:
+            with self._writer(name, contentType) as f:
+                f.write(text)
+            return
+        with self._conditionalLock:
+            info = self._stat(name)
+            if (info["generation"] if info else 0) != ifGeneration:
+                raise PreconditionFailed(name)
+            with self._writer(name, contentType) as f:
+                f.write(text)
+
+    def _delete(self, name):
+        try:
+            os.remove(self._path(name))
+        except FileNotFoundError:
+            pass
+
+    def _list(self, prefix):
+        names = []
+        for directory, _, files in os.walk(self.root):
+            for file in files:
+                name = os.path.relpath(os.path.join(directory, file), self.root).replace(os.sep, "/")
+                if name.startswith(prefix) and not name.endswith(".tmp"):
+                    names.append(name)
+        return names
+
+    def _stat(self, name):
+        try:
+            info = os.stat(self._path(name))
+        except FileNotFoundError:
+            return None
+        # Every write replaces the file, so the inode tells apart writes within one mtime tick
+        return {"name": name, "size": info.st_size, "updated": _isoTime(info.st_mtime), "generation": f"{info.st_mtime_ns}:{info.st_ino}"}
+
+    def url(self, name):
+        return f"file://{self._path(name)}"
+
+
+# One google.cloud.storage.Client per process, shared by every GcsStorage
+_gcsClient = None
+_gcsClientLock = threading.Lock()
+
+
+def _sharedGcsClient():
+    global _gcsClient
+    with _gcsClientLock:
+        if _gcsClient is None:
+            from google.cloud import storage
+            _gcsClient = storage.Client()
+        return _gcsClient
+
+
+class GcsStorage(StorageBackend):
+    """
+    Objects in a Google Cloud Storage bucket, through the process-wide pooled client.
+
+    Streamed writes go to a temporary object that is copied onto the target only after the
+    writer finishes cleanly: closing a blob writer finalizes the upload even when the block
+    raised, which would otherwise replace the target with a truncated object.
+    """
+
+    scheme = "gs"
+
+    def __init__(self, bucketName, client=None, latency=0.0, workers=BATCH_WORKERS):
+        super().__init__(latency, workers)
+        self.bucketName = bucketName
+        self.bucket = (client or _sharedGcsClient()).bucket(bucketName)
+
+    def _exists(self, name):
+        return self.bucket.blob(name).exists()
+
+    def _get(self, name):
+        from google.api_core.exceptions import NotFound
+        try:
+            return self.bucket.blob(name).download_as_text()
+        except NotFound:
+            return None
+
+    def _getVersioned(self, name):
+        from google.api_core.exceptions import NotFound, PreconditionFailed as GcsPreconditionFailed
+        while True:
+            blob = self.bucket.get_blob(name)
+            if blob is None:
+                return None, 0
+            try:
+                return blob.download_as_text(if_generation_match=blob.generation), blob.generation
+            except (NotFound, GcsPreconditionFailed):
+                continue  # replaced or deleted between the two requests
+
+    def _put(self, name, text, contentType, ifGeneration=None):
+        from google.api_core.exceptions import PreconditionFailed as GcsPreconditionFailed
+        try:
+            self.bucket.blob(name).upload_from_string(text, content_type=contentType, if_generation_match=ifGeneration)
+        except GcsPreconditionFailed as e:
+            raise PreconditionFailed(name) from e
+
+    def _delete(self, name):
+        from google.api_core.exceptions import NotFound
+        try:
+            self.bucket.blob(name).delete()
+        except NotFound:
+            pass
+
+    def _list(self, prefix):
+        return [blob.name for blob in self.bucket.list_blobs(prefix=prefix) if not blob.name.endswith(".tmp")]
+
+    def _stat(self, name):
+        blob = self.bucket.get_blob(name)
+        if blob is None:
+            return None
+        return {"name": name, "size": blob.size, "updated": blob.updated.isoformat() if blob.updated else None, "generation": blob.generation}
+
+    @contextmanager
+    def _writer(self, name, contentType):
+        temporary = self.bucket.blob(f"{name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with temporary.open("w", content_type=contentType, chunk_size=STREAM_CHUNK_SIZE) as writer:
+                yield writer
+            # Server-side copy within the bucket: the target only ever holds complete objects
+            self.bucket.copy_blob(temporary, self.bucket, name)
+        finally:
+            self._delete(temporary.name)
+
+    def url(self, name):
+        return f"https://storage.googleapis.com/{self.bucketName}/{name}"
+
+
+def createStorage(backend=None, **options):
+    """
+    Build a storage backend from arguments, falling back to the environment.
+
+    Environment: STORAGE_BACKEND ("gcs", "local" or "memory"), BUCKET_NAME (gcs),
+    STORAGE_ROOT (local) and STORAGE_LATENCY_MS (extra latency per request).
+    """
+    backend = (backend or os.getenv("STORAGE_BACKEND") or DEFAULT_BACKEND).lower()
+    latency = options.pop("latency", float(os.getenv("STORAGE_LATENCY_MS", "0")) / 1000)
+    if backend == "gcs":
+        return GcsStorage(options.pop("bucketName", None) or os.getenv("BUCKET_NAME", "towerbucket1"), latency=latency, **options)
+    if backend == "local":
+        return LocalStorage(options.pop("root", None) or os.getenv("STORAGE_ROOT", "./storage"), latency=latency, **options)
+    if backend == "memory":
+        return MemoryStorage(latency=latency, **options)
+    raise ValueError(f"Invalid storage backend '{backend}'. Must be one of ['gcs', 'local', 'memory'].")
+
+
+_storage = None
+_storageLock = threading.Lock()
+
+
+def getStorage():
+    """
+    Return the process-wide storage backend configured by the environment, creating it on first use.
+    """
+    global _storage
+    with _storageLock:
+        if _storage is None:
+            _storage = createStorage()
+        return _storage
+
+
+if __name__ == "__main__":
+    # Local benchmark: serial against batched reads for the offline backends with injected latency
+    payload = json.dumps({"tower_id": "0", "Height": 60, "elements": list(range(200))})
+    names = [f"towers/tower_{i:05d}.json" for i in range(500)]
+    with tempfile.TemporaryDirectory() as root:
+        for storage in (MemoryStorage(latency=0.005), LocalStorage(root, latency=0.005)):
+            storage.putMany({name: payload for name in names})
+            start = time.perf_counter()
+            for name in names:
+                storage.getText(name)
+            serial = time.perf_counter() - start
+            start = time.perf_counter()
+            storage.getMany(names)
+            batched = time.perf_counter() - start
+            print(f"{storage.scheme:6s}: serial {serial:.3f} s, batched {batched:.3f} s (x{serial / batched:.1f})")
+            print(f"        get {storage.metrics()['operations']['get']}")
+            storage.close()
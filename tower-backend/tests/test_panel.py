@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+from loadEngine.geometry import Geometry
+from loadEngine.angle_bar import ANGLE_BARS_SI, ROUND_BARS_SI
+from loadEngine.panel import VALID_CROSS_SECTIONS, Panel
+
+
+def randomPanels(rng):
+    cross_section = rng.choice(VALID_CROSS_SECTIONS)
+    tower_data = Geometry(
+        rng.uniform(3, 7), rng.choice([1, 1.5, 2]), rng.choice(range(18, 73, 6)),
+        rng.randint(1, 10), rng.randint(1, 2), cross_section,
+    ).initiate_tower_data()
+    panels = []
+    for segment in tower_data["segment_list"]:
+        bars = {}
+        for member in ("leg", "diagonal", "main_belt"):
+            bar_type = rng.choice(["Angle Bar", "Round Bar"])
+            bars[f"{member}_type"] = bar_type
+            bars[f"{member}_bar"] = rng.choice(list(ANGLE_BARS_SI if bar_type == "Angle Bar" else ROUND_BARS_SI))
+        panels.append(Panel(
+            tower_data=tower_data, panel_type=1, segment=segment, cross_section=cross_section,
+            measurement_system="SI (Metric)", exposure_category=tower_data["exposure_category"],
+            z_height=segment["z_height"], ground_elevation=0.0, **bars,
+        ))
+    return panels, cross_section
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_evaluate_many_matches_summary(seed):
+    rng = random.Random(seed)
+    for _ in range(50):
+        panels, cross_section = randomPanels(rng)
+        batched = Panel.evaluate_many(panels, cross_section)
+        assert [panel.summary(cross_section) for panel in panels] == batched
+
+
+@pytest.mark.parametrize("cross_section", VALID_CROSS_SECTIONS)
+def test_summary_evaluates_each_quantity_once(cross_section):
+    panels, _ = randomPanels(random.Random(7))
+    panel = panels[0]
+    first = panel.summary(cross_section)
+    assert set(panel.evaluation_counts.values()) == {1}
+    assert {"projected_area", "solidity_ratio", "cf", "effective_projected_area"} <= set(panel.evaluation_counts)
+
+    # A second summary is served from the cache
+    assert panel.summary(cross_section) == first
+    assert set(panel.evaluation_counts.values()) == {1}
+
+
+def test_invalidate_recomputes():
+    panels, cross_section = randomPanels(random.Random(3))
+    panel = panels[0]
+    panel.summary(cross_section)
+    panel.invalidate()
+    panel.summary(cross_section)
+    assert set(panel.evaluation_counts.values()) == {2}
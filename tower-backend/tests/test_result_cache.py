@@ -0,0 +1,35 @@
+import os
+
+from result_cache import ResultCache
+
+
+def diskUsage(directory):
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(directory) for name in names)
+
+
+def test_disk_tier_stays_within_budget(tmp_path):
+    cache = ResultCache(maxBytes=0, directory=str(tmp_path), maxDiskBytes=10_000)
+    for i in range(50):
+        cache.put(f"{i:064x}", b"x" * 1000)
+    assert diskUsage(tmp_path) <= 10_000
+    assert cache.stats()["disk_evictions"] >= 40
+    assert cache.get(f"{49:064x}") == b"x" * 1000
+    assert cache.get(f"{0:064x}") is None
+
+
+def test_disk_hit_is_most_recently_used(tmp_path):
+    cache = ResultCache(maxBytes=0, directory=str(tmp_path), maxDiskBytes=5_000)
+    keys = [f"{i:064x}" for i in range(5)]
+    for age, key in enumerate(keys):
+        cache.put(key, b"x" * 1000)
+        os.utime(cache._diskPath(key), ns=(age * 10**9, age * 10**9))
+    assert cache.get(keys[0]) is not None
+    cache.put(f"{99:064x}", b"x" * 1000)
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+
+
+def test_existing_directory_is_trimmed_on_start(tmp_path):
+    ResultCache(maxBytes=0, directory=str(tmp_path), maxDiskBytes=100_000).put("ab" * 32, b"x" * 5000)
+    cache = ResultCache(maxBytes=0, directory=str(tmp_path), maxDiskBytes=1000)
+    assert diskUsage(tmp_path) == 0 and cache.stats()["disk_bytes"] == 0
@@ -0,0 +1,61 @@
+import io
+import json
+import os
+
+from section import Section, changedSections
+
+TOWER = {"tower_base_width": 8.0, "top_width": 1.5, "height": 60.0, "variable_segments": 8, "constant_segments": 2}
+
+with open(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "section_library.json")) as f:
+    LIBRARY = json.load(f)
+
+
+def test_geometry_built_once_per_section():
+    section = Section(dict(TOWER))
+    document = section.toDict()
+    assert json.loads(section.toJson()) == json.loads(json.dumps(document))
+    stream = io.StringIO()
+    section.writeJson(stream)
+    section.getMesh()
+    section.toMeshDict()
+    section.getFaceAreas()
+    assert section.geometryBuilds == 1
+
+
+def test_replacing_inputs_invalidates_geometry():
+    section = Section(dict(TOWER))
+    section.getElements()
+    section.elementSections = {"1": {"M": "RD30"}}
+    section.sectionLibrary = LIBRARY
+    section.getElements()
+    assert section.geometryBuilds == 1
+
+    section.towerData = dict(TOWER, height=66.0)
+    assert section.getCoordinates()[-1]["c"][1] == 66.0
+    assert section.geometryBuilds == 2
+
+
+def test_update_element_sections_matches_fresh_section():
+    section = Section(dict(TOWER), {"1": {"M": "RD30"}}, LIBRARY)
+    section.getElements()
+    assignments = {"1": {"M": "RD30"}, "3": {"D": "RD10"}}
+    assert section.updateElementSections(assignments) == [3]
+    assert section.getElements() == Section(dict(TOWER), assignments, LIBRARY).getElements()
+    assert section.geometryBuilds == 1
+
+
+def test_members_measured_on_the_joined_mesh():
+    section = Section(dict(TOWER, variable_segments=4, constant_segments=3))
+    mesh = section.getMesh()
+    # c/d of every section but the last are shared with the next section's a/b
+    assert mesh.nodeCount == 66
+    lengths = section.getElementArrays()["length"].ravel()
+    assert (mesh.elementLengths() == lengths).all()
+    assert section.toMeshDict()["length"] == [element["length"] for group in section.getElements() for element in group["elements"]]
+
+
+def test_changed_sections_ignores_unknown_keys():
+    previous = {"1": {"M": "RD30"}, "2": {"D": "RD10"}}
+    current = {"1": {"M": "RD30"}, "3": {"D": "RD10"}, "99": {"M": "RD30"}, "note": {}}
+    assert changedSections(previous, current, 10) == [2, 3]
+    assert changedSections(None, current, 10) == [1, 3]
@@ -0,0 +1,107 @@
+import random
+
+import numpy as np
+import pytest
+
+from section import Section
+
+
+def loopCoordinates(towerData):
+    # The per-section loop coordinateKernel replaced, kept as the reference for its output
+    baseWidth = towerData["tower_base_width"]
+    topWidth = towerData["top_width"]
+    totalHeight = towerData["height"]
+    variableSegments = towerData["variable_segments"]
+    constantSegments = towerData["constant_segments"]
+
+    segmentHeight = totalHeight / (variableSegments + constantSegments)
+    taperDelta = (baseWidth - topWidth) / 2
+    alpha = np.arctan(taperDelta / (variableSegments * segmentHeight))
+    alphaZ = np.arctan((np.cos(np.deg2rad(30)) * taperDelta) / (variableSegments * segmentHeight))
+    zinitial = np.sin(np.deg2rad(60)) * baseWidth
+
+    def midpoint(p1, p2):
+        return [round((p1[k] + p2[k]) / 2, 3) for k in range(3)]
+
+    currentBase = baseWidth
+    x = y = z = 0.0
+    coordinates = []
+    for i in range(variableSegments):
+        segmentDelta = np.tan(alpha) * segmentHeight
+        segmentDeltaZ = np.tan(alphaZ) * segmentHeight
+        phi = np.arctan(segmentHeight / (currentBase - segmentDelta))
+        gHeight = np.tan(phi) * (currentBase / 2)
+        deltaG = gHeight * np.tan(alpha)
+        deltaGZ = gHeight * np.tan(alphaZ)
+        nodes = {
+            "section": i + 1,
+            "a": [round(0.0 + x, 3), round(0.0 + y, 3), round(z, 3)],
+            "b": [round(currentBase + x, 3), round(0.0 + y, 3), round(z, 3)],
+            "c": [round(segmentDelta + x, 3), round(segmentHeight + y, 3), round(segmentDelta + z, 3)],
+            "d": [round((currentBase - segmentDelta) + x, 3), round(segmentHeight + y, 3), round(segmentDelta + z, 3)],
+            "e": [round(deltaG + x, 3), round(gHeight + y, 3), round(deltaG + z, 3)],
+            "f": [round((currentBase - deltaG) + x, 3), round(gHeight + y, 3), round(deltaG + z, 3)],
+            "g": [round((currentBase / 2) + x, 3), round(gHeight + y, 3), round(deltaG + z, 3)],
+            "h": [round((currentBase / 2) + x, 3), round(0.0 + y, 3), round(zinitial - z, 3)],
+            "l": [round((currentBase / 2) + x, 3), round(segmentHeight + y, 3), round((zinitial - segmentDeltaZ) - z, 3)],
+            "m": [round((currentBase / 2) + x, 3), round(gHeight + y, 3), round((zinitial - deltaGZ) - z, 3)],
+        }
+        nodes["n"] = midpoint(nodes["e"], nodes["m"])
+        nodes["o"] = midpoint(nodes["m"], nodes["f"])
+        coordinates.append(nodes)
+        currentBase -= segmentDelta * 2
+        x += segmentDelta
+        y += segmentHeight
+        z += segmentDeltaZ
+
+    for i in range(constantSegments):
+        nodes = {
+            "section": variableSegments + i + 1,
+            "a": [round(0.0 + x, 3), round(0.0 + y, 3), round(z, 3)],
+            "b": [round(currentBase + x, 3), round(0.0 + y, 3), round(z, 3)],
+            "c": [round(x, 3), round(segmentHeight + y, 3), round(z, 3)],
+            "d": [round(currentBase + x, 3), round(segmentHeight + y, 3), round(z, 3)],
+            "e": [round(x, 3), round((segmentHeight / 2) + y, 3), round(z, 3)],
+            "f": [round(currentBase + x, 3), round((segmentHeight / 2) + y, 3), round(z, 3)],
+            "g": [round((currentBase / 2) + x, 3), round((segmentHeight / 2) + y, 3), round(z, 3)],
+            "h": [round((currentBase / 2) + x, 3), round(0.0 + y, 3), round(zinitial - z, 3)],
+            "l": [round((currentBase / 2) + x, 3), round(segmentHeight + y, 3), round(zinitial - z, 3)],
+            "m": [round((currentBase / 2) + x, 3), round((segmentHeight / 2) + y, 3), round(zinitial - z, 3)],
+        }
+        nodes["n"] = midpoint(nodes["e"], nodes["m"])
+        nodes["o"] = midpoint(nodes["m"], nodes["f"])
+        coordinates.append(nodes)
+        y += round(segmentHeight, 3)
+
+    return coordinates
+
+
+def randomTowers(seed, count):
+    rng = random.Random(seed)
+    for _ in range(count):
+        towerData = {
+            "tower_base_width": round(rng.uniform(3, 9), rng.choice([1, 2, 3])),
+            "top_width": round(rng.uniform(1, 2.5), 1),
+            "height": round(rng.uniform(18, 80), 1),
+            "variable_segments": rng.randint(1, 12),
+            "constant_segments": rng.randint(0, 4),
+        }
+        if rng.random() < 0.3:
+            towerData["tower_base_width"] = int(towerData["tower_base_width"])
+            towerData["height"] = int(towerData["height"])
+        yield towerData
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_kernel_matches_section_loop(seed):
+    for towerData in randomTowers(seed, 200):
+        assert Section(towerData).getCoordinates() == loopCoordinates(towerData), towerData
+
+
+@pytest.mark.parametrize("towerData", [
+    # Towers where adding the start after summing the offsets from zero was 1 mm off
+    {"tower_base_width": 7.1, "top_width": 2.2, "height": 30.0, "variable_segments": 4, "constant_segments": 2},
+    {"tower_base_width": 4.5, "top_width": 1.2, "height": 42.7, "variable_segments": 8, "constant_segments": 2},
+])
+def test_kernel_matches_section_loop_on_known_towers(towerData):
+    assert Section(towerData).getCoordinates() == loopCoordinates(towerData)
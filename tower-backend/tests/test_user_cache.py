@@ -0,0 +1,35 @@
+from user_cache import UserCache
+
+
+def test_unknown_usernames_do_not_evict_users():
+    users = {f"user{i}": {"username": f"user{i}"} for i in range(10)}
+    cache = UserCache(users.get, maxEntries=10, maxNegativeEntries=3, clock=lambda: 0.0)
+    for username in users:
+        cache.get(username)
+    for i in range(100):
+        cache.get(f"ghost{i}")
+    for username in users:
+        assert cache.get(username) == users[username]
+
+    stats = cache.stats()
+    assert stats["hits"] == 10 and stats["evictions"] == 0
+    assert stats["negative_entries"] == 3 and stats["negative_evictions"] == 97
+
+
+def test_negative_entries_expire_and_invalidate():
+    now = [0.0]
+    users = {}
+    cache = UserCache(users.get, ttl=300, negativeTtl=30, clock=lambda: now[0])
+    assert cache.get("new") is None
+    assert cache.get("new") is None and cache.stats()["negative_hits"] == 1
+
+    users["new"] = {"username": "new"}
+    cache.invalidate("new")
+    assert cache.get("new") == users["new"]
+
+    del users["new"]
+    cache.invalidate()
+    cache.get("new")
+    now[0] = 31.0
+    cache.get("new")
+    assert cache.stats()["misses"] == 4
@@ -0,0 +1,20 @@
+import pytest
+
+from utils import normalizeSiteKeys
+
+
+def test_site_keys_from_stored_towers_and_forms():
+    stored = {"Importance Factor": 1.15, "Basic Wind Speed Ultimate": "50", "Exposure Category": "Exposure B", "Height": 30}
+    form = {"importance_factor": "1.15", "wind_speed_ultimate": "50", "wind_speed_service": "", "exposure_category": "Exposure B"}
+    expected = {"importance_factor": 1.15, "basic_wind_speed_ultimate": 50.0, "exposure_category": "Exposure B"}
+    assert normalizeSiteKeys(stored) == {**expected, "Height": 30}
+    assert normalizeSiteKeys(form) == expected
+
+
+def test_canonical_site_key_wins():
+    assert normalizeSiteKeys({"wind_speed_service": 30, "basic_wind_speed_service": 33})["basic_wind_speed_service"] == 33.0
+
+
+def test_bad_site_number():
+    with pytest.raises(ValueError):
+        normalizeSiteKeys({"kd": "high"})
@@ -0,0 +1,224 @@
+import bisect
+import json
+import random
+import threading
+import time
+from datetime import datetime, timezone
+
+from storage_backend import MemoryStorage, PreconditionFailed
+from utils import normalizeTowerDataKeys
+
+
+# Tower bodies live under TOWER_PREFIX; the manifest sits outside it so listings never include it
+TOWER_PREFIX = "towers/"
+MANIFEST_FILE = "manifests/towers.json"
+
+# Attempts of a conditional manifest write before giving up, and the base of the backoff between them
+MANIFEST_RETRIES = 8
+MANIFEST_BACKOFF_SECONDS = 0.05
+
+# Listing page sizes
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def towerFile(towerId):
+    return f"{TOWER_PREFIX}tower_{towerId}.json"
+
+
+def manifestEntry(towerId, towerData, size, updated=None):
+    """
+    Manifest entry of one tower: id, blob name, body size, update time and the key dimensions.
+
+    Towers whose dimensions cannot be normalized are still listed, without them.
+    """
+    entry = {
+        "tower_id": str(towerId),
+        "file": towerFile(towerId),
+        "size": size,
+        "updated": updated or datetime.now(timezone.utc).isoformat(),
+    }
+    try:
+        entry.update(normalizeTowerDataKeys(towerData))
+    except (TypeError, ValueError, AttributeError):
+        pass
+    return entry
+
+
+def projectFields(item, fields):
+    return {field: item[field] for field in fields if field in item} if fields else item
+
+
+class TowerIndex:
+    """
+    Manifest of stored towers plus paginated listing and a concurrent bulk fetcher.
+
+    The manifest is one JSON object {tower_id: entry}, updated by record() whenever a tower
+    is written. Listings read that single object instead of downloading every tower body.
+    Every update is a read-modify-write that is only stored while the manifest is still at
+    the generation it read (StorageBackend.putText ifGeneration), and is retried otherwise,
+    so concurrent writers in other processes or instances never drop each other's entries.
+
+    Attributes:
+        storage (StorageBackend): Where the tower bodies and the manifest live.
+    """
+
+    def __init__(self, storage, manifestFile=MANIFEST_FILE):
+        self.storage = storage
+        self.manifestFile = manifestFile
+        self._lock = threading.Lock()
+
+    def _readManifest(self):
+        return self.storage.getJson(self.manifestFile)
+
+    def _update(self, change):
+        # Store change(entries) over the current manifest (None when there is none yet), retrying on conflicts
+        with self._lock:  # writers of this process take turns, so only other processes conflict
+            for attempt in range(MANIFEST_RETRIES):
+                text, generation = self.storage.getVersioned(self.manifestFile)
+                entries = change(json.loads(text) if text is not None else None)
+                try:
+                    self.storage.putJson(self.manifestFile, entries, ifGeneration=generation)
+                    return entries
+                except PreconditionFailed:
+                    time.sleep(MANIFEST_BACKOFF_SECONDS * (2 ** attempt) * random.random())
+        raise RuntimeError(f"Could not update {self.manifestFile}: {MANIFEST_RETRIES} concurrent writes in a row.")
+
+    @staticmethod
+    def _parse(fileName, text):
+        # Parsed body, or None when the object is missing or not valid JSON
+        if text is None:
+            return None
+        try:
+            return json.loads(text)
+        except ValueError as e:
+            print(f"❌ Error parsing {fileName}: {str(e)}")
+            return None
+
+    def entries(self):
+        """
+        Every manifest entry keyed by tower id, rebuilding the manifest if it does not exist yet.
+        """
+        entries = self._readManifest()
+        return entries if entries is not None else self.rebuild()
+
+    def _scan(self):
+        # Manifest entries of every stored tower body, downloaded with the bulk fetcher
+        names = [name for name in self.storage.list(TOWER_PREFIX) if name.endswith(".json")]
+        entries = {}
+        for name, text in zip(names, self.storage.getMany(names)):
+            tower = self._parse(name, text)
+            if tower is None:
+                continue
+            towerId = str(tower.get("tower_id") or name[len(TOWER_PREFIX):].removeprefix("tower_").removesuffix(".json"))
+            entries[towerId] = manifestEntry(towerId, tower, len(text))
+        return entries
+
+    def rebuild(self):
+        """
+        Build the manifest from the stored tower bodies, downloaded with the bulk fetcher.
+        """
+        # Scanned again if another writer stores the manifest meanwhile, so its entry is not lost
+        entries = self._update(lambda stored: self._scan())
+        print(f"🗂️ Rebuilt tower manifest with {len(entries)} towers")
+        return entries
+
+    def record(self, towerId, towerData, size):
+        """
+        Add or refresh one tower's manifest entry after its body has been written.
+
+        Returns:
+            dict: The new entry.
+        """
+        entry = manifestEntry(towerId, towerData, size)
+
+        def add(entries):
+            # Without a manifest yet, start from the towers already stored (this one included)
+            entries = entries if entries is not None else self._scan()
+            entries[entry["tower_id"]] = entry
+            return entries
+
+        self._update(add)
+        return entry
+
+    def page(self, cursor=None, limit=DEFAULT_PAGE_SIZE, fields=None, full=False):
+        """
+        One page of towers ordered by tower id.
+
+        Args:
+            cursor (str): Tower id the previous page ended at; the page starts after it.
+            limit (int): Page size, capped at MAX_PAGE_SIZE.
+            fields (list): Fields to keep in every item; all when not given.
+            full (bool): Return the stored tower bodies (fetched in parallel) instead of manifest entries.
+
+        Returns:
+            dict: "towers" (items), "next_cursor" (None on the last page) and "total".
+        """
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+        entries = self.entries()
+        ids = sorted(entries)
+        # First id after the cursor; the cursor tower itself may have been removed since
+        start = bisect.bisect_right(ids, cursor) if cursor is not None else 0
+        pageIds = ids[start:start + limit]
+
+        if full:
+            items = [body for body in self.fetchMany(pageIds) if body is not None]
+        else:
+            items = [entries[towerId] for towerId in pageIds]
+        return {
+            "towers": [projectFields(item, fields) for item in items],
+            "next_cursor": pageIds[-1] if start + limit < len(ids) else None,
+            "total": len(ids),
+        }
+
+    def fetchMany(self, towerIds):
+        """
+        Stored bodies of many towers, downloaded concurrently; None for towers that cannot be read.
+        """
+        names = [towerFile(towerId) for towerId in towerIds]
+        return [self._parse(name, text) for name, text in zip(names, self.storage.getMany(names))]
+
+
+if __name__ == "__main__":
+    # Local benchmark: serial listing (the old GET /api/towers) against the manifest and the bulk fetcher
+    towerCount, latency = 2000, 0.002
+    storage = MemoryStorage(latency=latency)
+    storage.putMany({
+        towerFile(f"{i:05d}"): json.dumps({
+            "tower_id": f"{i:05d}",
+            "Tower Base Width": 6 + i % 7,
+            "Top Width": 1.5,
+            "Height": 60 + i % 11 * 6,
+            "Variable Segments": 40,
+            "Constant Segments": 10,
+            "Cross Section": "Square",
+        })
+        for i in range(towerCount)
+    })
+    print(f"{towerCount} towers, {latency * 1000:.0f} ms per storage request")
+
+    start = time.perf_counter()
+    towers = [json.loads(storage.getText(name)) for name in storage.list(TOWER_PREFIX)]
+    serial = time.perf_counter() - start
+    print(f"serial full listing:    {serial:.3f} s")
+
+    index = TowerIndex(storage)
+    start = time.perf_counter()
+    index.rebuild()
+    print(f"manifest rebuild:       {time.perf_counter() - start:.3f} s ({storage.workers} threads)")
+
+    start = time.perf_counter()
+    cursor, pages = None, 0
+    while True:
+        page = index.page(cursor, DEFAULT_PAGE_SIZE, fields=["tower_id", "height"])
+        pages += 1
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    print(f"paginated listing:      {(time.perf_counter() - start) / pages * 1000:.1f} ms per page ({pages} pages)")
+
+    start = time.perf_counter()
+    bodies = index.fetchMany([f"{i:05d}" for i in range(towerCount)])
+    parallel = time.perf_counter() - start
+    print(f"bulk fetch of all:      {parallel:.3f} s (speedup x{serial / parallel:.1f})")
+    storage.close()
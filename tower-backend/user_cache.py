@@ -0,0 +1,210 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Seconds a loaded user record is served without reading Firestore again
+USER_CACHE_TTL = 300.0
+
+# Seconds an unknown username is remembered as missing
+NEGATIVE_CACHE_TTL = 30.0
+
+# Usernames kept, least recently used evicted first
+USER_CACHE_SIZE = 10000
+
+# Unknown usernames kept, in their own store so a flood of them cannot evict real users
+NEGATIVE_CACHE_SIZE = 1000
+
+
+class UserCache:
+    """
+    TTL cache of user records in front of a slow lookup (Firestore), with a negative cache.
+
+    Records are kept for `ttl` seconds and unknown usernames for `negativeTtl` seconds, so
+    a flood of requests for a missing user does not reach Firestore either. Unknown usernames
+    live in a separate, smaller LRU store: requests for made-up names only evict each other.
+    Writes must call invalidate(); changes made by other processes show up once the entry expires.
+
+    Attributes:
+        loader (callable): username -> record dict, or None when the user does not exist.
+        ttl (float): Lifetime of found users in seconds.
+        negativeTtl (float): Lifetime of missing users in seconds.
+        maxEntries (int): Bound on cached users.
+        maxNegativeEntries (int): Bound on cached unknown usernames.
+    """
+
+    def __init__(self, loader, ttl=USER_CACHE_TTL, negativeTtl=NEGATIVE_CACHE_TTL, maxEntries=USER_CACHE_SIZE,
+                 maxNegativeEntries=NEGATIVE_CACHE_SIZE, clock=time.monotonic):
+        self.loader = loader
+        self.ttl = ttl
+        self.negativeTtl = negativeTtl
+        self.maxEntries = maxEntries
+        self.maxNegativeEntries = maxNegativeEntries
+        self._clock = clock
+        self._entries = OrderedDict()  # username -> (record, expiry)
+        self._missing = OrderedDict()  # username -> expiry
+        self._lock = threading.Lock()
+        self._epoch = 0  # bumped by invalidate(), so loads that straddle a write are not cached
+        self._counts = {
+            "hits": 0, "negative_hits": 0, "misses": 0, "invalidations": 0, "evictions": 0, "negative_evictions": 0,
+            "load_ms": 0.0,
+        }
+
+    def get(self, username):
+        """
+        The user's record, from the cache when fresh, otherwise from the loader; None for unknown users.
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(username)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(username)
+                self._counts["hits"] += 1
+                return entry[0]
+            expiry = self._missing.get(username)
+            if expiry is not None and expiry > now:
+                self._missing.move_to_end(username)
+                self._counts["negative_hits"] += 1
+                return None
+            epoch = self._epoch
+
+        start = time.perf_counter()
+        record = self.loader(username)
+        elapsed = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self._counts["misses"] += 1
+            self._counts["load_ms"] += elapsed
+            if epoch != self._epoch:
+                return record
+            if record is not None:
+                self._missing.pop(username, None)
+                self._store(self._entries, username, (record, self._clock() + self.ttl), self.maxEntries, "evictions")
+            else:
+                self._entries.pop(username, None)
+                self._store(self._missing, username, self._clock() + self.negativeTtl, self.maxNegativeEntries, "negative_evictions")
+        return record
+
+    def _store(self, entries, username, value, maxEntries, evictionCounter):
+        # Insert as most recently used, evicting the least recently used past maxEntries (lock held)
+        entries[username] = value
+        entries.move_to_end(username)
+        while len(entries) > maxEntries:
+            entries.popitem(last=False)
+            self._counts[evictionCounter] += 1
+
+    def invalidate(self, username=None):
+        """
+        Drop one username (or every entry) so the next get() reads the store.
+        """
+        with self._lock:
+            if username is None:
+                self._entries.clear()
+                self._missing.clear()
+            else:
+                self._entries.pop(username, None)
+                self._missing.pop(username, None)
+            self._epoch += 1
+            self._counts["invalidations"] += 1
+
+    def stats(self):
+        """
+        Hit, negative hit and miss counts, the hit rate and the mean load time of misses.
+        """
+        with self._lock:
+            counts = dict(self._counts)
+            lookups = counts["hits"] + counts["negative_hits"] + counts["misses"]
+            return {
+                **{key: value for key, value in counts.items() if key != "load_ms"},
+                "hit_rate": round((counts["hits"] + counts["negative_hits"]) / lookups, 4) if lookups else 0.0,
+                "mean_load_ms": round(counts["load_ms"] / counts["misses"], 3) if counts["misses"] else 0.0,
+                "entries": len(self._entries),
+                "negative_entries": len(self._missing),
+                "ttl": self.ttl,
+                "negative_ttl": self.negativeTtl,
+            }
+
+
+class _MemoryDocument:
+    def __init__(self, data):
+        self._data = data
+        self.exists = data is not None
+
+    def get(self, field):
+        return self._data[field]
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
+
+
+class _MemoryDocumentReference:
+    def __init__(self, client, collection, key):
+        self._client, self._collection, self._key = client, collection, key
+
+    def get(self):
+        time.sleep(self._client.latency)
+        data = self._client.collections.get(self._collection, {}).get(self._key)
+        return _MemoryDocument(dict(data) if data is not None else None)
+
+    def set(self, data):
+        time.sleep(self._client.latency)
+        with self._client.lock:
+            self._client.collections.setdefault(self._collection, {})[self._key] = dict(data)
+
+
+class _MemoryCollection:
+    def __init__(self, client, name):
+        self._client, self._name = client, name
+
+    def document(self, key):
+        return _MemoryDocumentReference(self._client, self._name, key)
+
+
+class MemoryFirestore:
+    """
+    In-process stand-in for firestore.Client covering collection().document().get()/set().
+
+    `latency` seconds are added to every document read and write, to measure what the
+    cache saves without a Firestore project.
+    """
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.collections = {}
+        self.lock = threading.Lock()
+
+    def collection(self, name):
+        return _MemoryCollection(self, name)
+
+
+if __name__ == "__main__":
+    # Local benchmark: concurrent session restores with and without the cache
+    latency, users, requests, threads = 0.02, 50, 4000, 16
+    db = MemoryFirestore(latency)
+    for i in range(users):
+        db.collection("users").document(f"user{i}").set({"username": f"user{i}", "password": "hash"})
+
+    def fetch(username):
+        doc = db.collection("users").document(username).get()
+        return doc.to_dict() if doc.exists else None
+
+    # Every tenth request is for an unknown user, which the negative cache absorbs
+    names = [f"user{i % users}" if i % 10 else f"ghost{i % 7}" for i in range(requests)]
+
+    def timed(lookup):
+        def run(username):
+            start = time.perf_counter()
+            lookup(username)
+            return time.perf_counter() - start
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            start = time.perf_counter()
+            latencies = list(executor.map(run, names))
+        return time.perf_counter() - start, sum(latencies) / len(latencies)
+
+    print(f"{requests} session restores over {users} users, {threads} threads, {latency * 1000:.0f} ms per Firestore read")
+    directTotal, directMean = timed(fetch)
+    print(f"direct:  {directTotal:.2f} s total, {directMean * 1000:.2f} ms per request")
+    cache = UserCache(fetch)
+    cachedTotal, cachedMean = timed(cache.get)
+    print(f"cached:  {cachedTotal:.2f} s total, {cachedMean * 1000:.2f} ms per request")
+    print(f"saved:   {(directMean - cachedMean) * 1000:.2f} ms per request; {cache.stats()}")
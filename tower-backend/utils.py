@@ -1,6 +1,6 @@
-from google.cloud import storage
 import json
-import os
+
+from storage_backend import getStorage
 
 def normalizeTowerDataKeys(data):
     return {
@@ -13,21 +13,55 @@ def normalizeTowerDataKeys(data):
     }
 
 
+# Site parameter spellings found in stored towers (title case) and form posts, per key the load engines read
+SITE_KEY_ALIASES = {
+    "importance_factor": ("importance_factor", "Importance Factor"),
+    "exposure_category": ("exposure_category", "Exposure Category"),
+    "basic_wind_speed_service": ("basic_wind_speed_service", "wind_speed_service", "Basic Wind Speed Service"),
+    "basic_wind_speed_ultimate": ("basic_wind_speed_ultimate", "wind_speed_ultimate", "Basic Wind Speed Ultimate"),
+}
+
+# Site parameters passed to the load engines as numbers
+NUMERIC_SITE_KEYS = (
+    "importance_factor", "basic_wind_speed_service", "basic_wind_speed_ultimate", "basic_wind_speed_ice",
+    "ice_importance_factor", "crest_height", "ground_elevation", "kd", "gust_effect_factor",
+)
+
+def normalizeSiteKeys(data):
+    """
+    Site parameters under the names WindLoads, IceLoads and ModalAnalysis read, numbers as floats.
+
+    Every spelling in SITE_KEY_ALIASES is mapped to its canonical key; empty form fields are
+    treated as missing so the engines fall back to their defaults. Other keys pass through.
+
+    Raises:
+        ValueError: A numeric site parameter is not a number.
+    """
+    site = {key: value for key, value in data.items() if value != ""}
+    for key, aliases in SITE_KEY_ALIASES.items():
+        for alias in aliases:
+            value = site.pop(alias, None)
+            if value is not None and key not in site:
+                site[key] = value
+    for key in NUMERIC_SITE_KEYS:
+        if site.get(key) is not None:
+            try:
+                site[key] = float(site[key])
+            except (TypeError, ValueError):
+                raise ValueError(f"Site parameter {key} must be a number, got {site[key]!r}") from None
+    return site
+
 
 def download_json_from_gcs(file_path):
-    print(f"📁 GCS Download Request: {file_path}")
-    
-    bucket_name = os.getenv("BUCKET_NAME") or "towerbucket1"
-    print(f"🪣 Bucket: {bucket_name}")
-    
-    client = storage.Client()
-    bucket = client.bucket(bucket_name)
-    blob = bucket.blob(file_path)
-
-    # ✅ Optional: check if file exists before download
-    if not blob.exists():
-        raise FileNotFoundError(f"❌ File '{file_path}' not found in bucket '{bucket_name}'")
-
-    content = blob.download_as_text()
-    print("📄 GCS Raw Content (first 200 chars):", content[:200])
+    print(f"📁 Storage Download Request: {file_path}")
+
+    # Shared, environment-configured backend (see storage_backend.getStorage)
+    storage = getStorage()
+    content = storage.getText(file_path)
+
+    # ✅ Missing objects raise, as callers expect
+    if content is None:
+        raise FileNotFoundError(f"❌ File '{file_path}' not found in {storage.scheme} storage")
+
+    print("📄 Raw Content (first 200 chars):", content[:200])
     return json.loads(content)